@@ -0,0 +1,81 @@
+"""Command line for the benchmark suite; run from the repository root.
+
+    python -m benchmarks run -o results.json
+    python -m benchmarks compare baseline.json results.json
+
+compare exits with status 1 if any benchmark regressed.
+"""
+import argparse
+import sys
+
+from src.utils.tracing import start_tracing, stop_tracing
+
+from .suite import BENCHMARKS, DEFAULT_THRESHOLD, compare, load_results, run_suite, save_results
+
+
+def _format_time(seconds) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.1f} ms"
+
+
+def run_command(args) -> int:
+    def progress(key, times):
+        print(f"{key:<40}{_format_time(min(times)):>14} (best of {len(times)})", file=sys.stderr)
+
+    if args.trace:
+        start_tracing()
+    results = run_suite(seed=args.seed, repeat=args.repeat, max_teams=args.max_teams,
+                        only=args.only, progress=progress)
+    if args.trace:
+        tracer = stop_tracing()
+        tracer.write_chrome_trace(args.trace)
+        print("Trace summary\n" + tracer.summary(), file=sys.stderr)
+    if args.output:
+        save_results(results, args.output)
+        print(f"Wrote {len(results['results'])} results to {args.output}", file=sys.stderr)
+    return 0
+
+
+def compare_command(args) -> int:
+    rows = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    print(f"{'benchmark':<40}{'baseline':>14}{'current':>14}{'change':>10}  status")
+    for row in rows:
+        change = "-" if row["ratio"] is None else f"{(row['ratio'] - 1) * 100:+.1f}%"
+        print(f"{row['key']:<40}{_format_time(row['baseline']):>14}"
+              f"{_format_time(row['current']):>14}{change:>10}  {row['status']}")
+
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark (default 3)")
+    run_parser.add_argument("--max-teams", type=int, help="skip worlds larger than this")
+    run_parser.add_argument("--only", nargs="+", default=(), metavar="NAME",
+                            choices=[benchmark.name for benchmark in BENCHMARKS],
+                            help="run only these benchmarks")
+    run_parser.add_argument("--trace", metavar="PATH",
+                            help="record phase spans and write them to PATH as a Chrome trace")
+    run_parser.set_defaults(handler=run_command)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help=f"allowed slowdown of the median (default {DEFAULT_THRESHOLD})")
+    compare_parser.set_defaults(handler=compare_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""The benchmarks and the code that times them.
+
+Each benchmark has a setup step, which is not timed, and a run step,
+which is. Both are repeated for every world size with the global random
+module reseeded first, so every repeat does exactly the same work.
+"""
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.ai.draft_ai import DraftAI
+from src.database.db_manager import DatabaseManager
+from src.models.draft import DRAFT_SEQUENCE, DraftAction, DraftState
+from src.models.league import Split
+from .world import SEASON_START, build_world, fill_results, pair_teams, play_season, world_teams
+
+WORLD_SIZES = (10, 100, 1000)
+
+# Matches simulated by each series benchmark
+SERIES_MATCHES = 20
+
+# A benchmark is slower than its baseline when its median time grows by more than this
+DEFAULT_THRESHOLD = 0.15
+
+# ...and by more than this many seconds, so timer noise on millisecond runs is not flagged
+MIN_DELTA = 0.002
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[int, int], Any]  # (team count, seed) -> state passed to run
+    run: Callable[[Any], None]
+    sizes: Tuple[int, ...] = WORLD_SIZES
+
+
+def _series_setup(team_count: int, seed: int):
+    return pair_teams(world_teams(build_world(team_count, seed)), seed)[:SERIES_MATCHES]
+
+
+def _series_run(best_of: int) -> Callable[[List], None]:
+    def run(matches):
+        for i in range(SERIES_MATCHES):
+            match = matches[i % len(matches)]
+            match.draft_state = None
+            match.simulate(best_of=best_of)
+    return run
+
+
+def _season_setup(team_count: int, seed: int):
+    leagues = build_world(team_count, seed)
+    for league in leagues:
+        league.start_new_season(Split.SPRING, SEASON_START)
+    return leagues
+
+
+def _season_run(leagues):
+    for league in leagues:
+        play_season(league)
+
+
+def _standings_setup(team_count: int, seed: int):
+    leagues = _season_setup(team_count, seed)
+    fill_results(leagues, seed)
+    return [league.divisions["Regular Season"] for league in leagues]
+
+
+def _standings_run(divisions):
+    for division in divisions:
+        division.get_standings()
+
+
+def _schedule_run(leagues):
+    for league in leagues:
+        league.generate_schedule(SEASON_START)
+
+
+def _draft_setup(team_count: int, seed: int):
+    """One fresh pairing per two teams, plus the actions of one AI draft to replay."""
+    matches = pair_teams(world_teams(build_world(team_count, seed)), seed)
+    sample = DraftState(blue_team=matches[0].team1, red_team=matches[0].team2)
+    DraftAI.auto_draft(sample)
+    picks, bans = iter(sample.picks), iter(sample.bans)
+    actions = [
+        (step, next(picks if step.action == DraftAction.PICK else bans).champion)
+        for step in DRAFT_SEQUENCE
+    ]
+    return matches, actions
+
+
+def _draft_state_run(state):
+    """Replay the AI's draft into fresh states, then undo and redo all of it."""
+    matches, actions = state
+    for match in matches:
+        draft = DraftState(blue_team=match.team1, red_team=match.team2)
+        for step, champion in actions:
+            team = draft.get_team(step.side)
+            if step.action == DraftAction.PICK:
+                draft.make_pick(champion, team)
+            else:
+                draft.make_ban(champion, team)
+        while draft.undo():
+            pass
+        while draft.redo():
+            pass
+
+
+def _draft_ai_run(state):
+    matches, _ = state
+    for match in matches:
+        DraftAI.auto_draft(DraftState(blue_team=match.team1, red_team=match.team2))
+
+
+def _database_setup(team_count: int, seed: int):
+    """A world where every team has played one simulated match."""
+    leagues = build_world(team_count, seed)
+    teams = world_teams(leagues)
+    matches = pair_teams(teams, seed)
+    for match in matches:
+        match.simulate()
+    return teams, matches
+
+
+def _database_run(state):
+    """Save the world to a fresh in-memory database and load every team back."""
+    teams, matches = state
+    db = DatabaseManager(":memory:")
+    try:
+        with db.batch():
+            for team in teams:
+                team.team_id = db.save_team(team)
+            for match in matches:
+                db.save_match(match, season="Spring 2024")
+        for team in teams:
+            db.load_team(team.team_id)
+    finally:
+        db.close()
+
+
+BENCHMARKS = [
+    Benchmark("match_simulate_bo1", _series_setup, _series_run(1), sizes=(10,)),
+    Benchmark("match_simulate_bo3", _series_setup, _series_run(3), sizes=(10,)),
+    Benchmark("match_simulate_bo5", _series_setup, _series_run(5), sizes=(10,)),
+    Benchmark("league_full_season", _season_setup, _season_run),
+    Benchmark("division_get_standings", _standings_setup, _standings_run),
+    Benchmark("league_generate_schedule", lambda teams, seed: build_world(teams, seed), _schedule_run),
+    Benchmark("draft_state_replay", _draft_setup, _draft_state_run),
+    Benchmark("draft_ai_auto_draft", _draft_setup, _draft_ai_run),
+    Benchmark("database_save_load_world", _database_setup, _database_run),
+]
+
+
+def result_key(name: str, team_count: int) -> str:
+    """Key of one benchmark at one world size in the JSON output."""
+    return f"{name}[{team_count}]"
+
+
+def time_benchmark(benchmark: Benchmark, team_count: int, seed: int, repeat: int) -> List[float]:
+    """Seconds taken by each of repeat runs of benchmark on one world size."""
+    times = []
+    for _ in range(repeat):
+        # Reseed for every repeat: schedules, drafts and games use the random module
+        random.seed(seed)
+        state = benchmark.setup(team_count, seed)
+        start = time.perf_counter()
+        benchmark.run(state)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_suite(seed: int = 0, repeat: int = 3, max_teams: Optional[int] = None,
+              only: Sequence[str] = (),
+              progress: Optional[Callable[[str, List[float]], None]] = None) -> Dict:
+    """Run the benchmarks and return their results, ready to be written as JSON.
+    
+    Args:
+        seed: Seed for the worlds and the random module
+        repeat: Timed runs per benchmark and world size; the median is compared
+        max_teams: Skip world sizes above this
+        only: Names of the benchmarks to run; all of them if empty
+        progress: Called as progress(key, times) after each benchmark and size
+    """
+    results = {}
+    for benchmark in BENCHMARKS:
+        if only and benchmark.name not in only:
+            continue
+        for team_count in benchmark.sizes:
+            if max_teams is not None and team_count > max_teams:
+                continue
+            times = time_benchmark(benchmark, team_count, seed, repeat)
+            key = result_key(benchmark.name, team_count)
+            results[key] = {
+                "benchmark": benchmark.name,
+                "teams": team_count,
+                "median": statistics.median(times),
+                "min": min(times),
+                "times": times,
+            }
+            if progress:
+                progress(key, times)
+    
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD,
+            min_delta: float = MIN_DELTA) -> List[Dict]:
+    """Compare the median times of two suite runs.
+    
+    Returns one row per benchmark in either run, with the ratio of the
+    current median to the baseline's and a status of "regression",
+    "improvement", "ok", "new" or "missing". A change only counts when it
+    is over both threshold (relative) and min_delta (seconds).
+    """
+    old, new = baseline["results"], current["results"]
+    rows = []
+    for key in list(old) + [key for key in new if key not in old]:
+        row = {"key": key, "baseline": None, "current": None, "ratio": None}
+        if key not in new:
+            row.update(baseline=old[key]["median"], status="missing")
+        elif key not in old:
+            row.update(current=new[key]["median"], status="new")
+        else:
+            before, after = old[key]["median"], new[key]["median"]
+            ratio = after / before if before else float("inf")
+            if abs(after - before) <= min_delta:
+                status = "ok"
+            elif ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 - threshold:
+                status = "improvement"
+            else:
+                status = "ok"
+            row.update(baseline=before, current=after, ratio=ratio, status=status)
+        rows.append(row)
+    return rows
+
+
+def load_results(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_results(results: Dict, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,104 @@
+"""Seeded synthetic worlds for the benchmarks.
+
+A world is a set of regional leagues of LEAGUE_SIZE teams each, so a
+1,000-team world is 100 leagues. Everything is generated from one seed,
+so a world of a given size is the same on every run and every machine.
+"""
+import random
+from datetime import date, datetime, timedelta
+from typing import List
+
+from src.models.league import League, SeasonPhase
+from src.models.match import Match, MatchResult
+from src.models.player import Player, PlayerStats, Role
+from src.models.team import Team
+
+# Teams per league; real regions have 10
+LEAGUE_SIZE = 10
+
+# Fixed so that worlds (and the season dates in them) never depend on today
+SEASON_START = datetime(2024, 1, 15)
+
+
+def build_team(rng: random.Random, name: str, region: str) -> Team:
+    """A team with one player per role and seeded ratings."""
+    base_skill = rng.randint(60, 95)
+    team = Team(
+        name, region, rng.randint(1, 10) * 1000000,
+        fanbase=rng.randint(10000, 5000000),
+        training_facilities=rng.randint(50, 100)
+    )
+    for role in Role:
+        team.add_player(Player(
+            name=f"{name} {role.value}",
+            role=role,
+            stats=PlayerStats(
+                mechanical_skill=min(100, base_skill + rng.randint(-10, 10)),
+                game_knowledge=min(100, base_skill + rng.randint(-10, 10)),
+                communication=min(100, base_skill + rng.randint(-10, 10)),
+                leadership=min(100, base_skill + rng.randint(-10, 10))
+            ),
+            nationality="Synthetic",
+            salary=rng.randint(5, 50) * 10000,
+            contract_end=date(2025, 11, 30)
+        ))
+    return team
+
+
+def build_world(team_count: int, seed: int) -> List[League]:
+    """Leagues holding team_count teams between them.
+
+    team_count must be a multiple of LEAGUE_SIZE.
+    """
+    if team_count < LEAGUE_SIZE or team_count % LEAGUE_SIZE:
+        raise ValueError(f"team_count must be a multiple of {LEAGUE_SIZE}")
+
+    rng = random.Random(seed)
+    leagues = []
+    for league_index in range(team_count // LEAGUE_SIZE):
+        region = f"R{league_index + 1:03d}"
+        teams = [build_team(rng, f"{region} Team {i + 1}", region) for i in range(LEAGUE_SIZE)]
+        leagues.append(League(region, {"Regular Season": teams}))
+    return leagues
+
+
+def world_teams(leagues: List[League]) -> List[Team]:
+    """Every team in the world."""
+    return [team for league in leagues for team in league.get_all_teams()]
+
+
+def fill_results(leagues: List[League], seed: int) -> None:
+    """Give every scheduled regular season match a result without simulating it.
+
+    Only the winner and score are made up; the results carry no game
+    stats, which is all that standings need.
+    """
+    rng = random.Random(seed)
+    for league in leagues:
+        for match in league.divisions["Regular Season"].matches:
+            winner, loser = (match.team1, match.team2) if rng.random() < 0.5 else (match.team2, match.team1)
+            match.result = MatchResult(
+                winner=winner, loser=loser, winner_score=1, loser_score=0,
+                match_date=match.match_date, duration=rng.randint(25, 40),
+                winner_stats=None, loser_stats=None, events=[], mvp=None
+            )
+
+
+def pair_teams(teams: List[Team], seed: int) -> List[Match]:
+    """One match for every team against a seeded random opponent."""
+    rng = random.Random(seed)
+    shuffled = list(teams)
+    rng.shuffle(shuffled)
+    return [
+        Match(shuffled[i], shuffled[i + 1], SEASON_START + timedelta(days=i // 2))
+        for i in range(0, len(shuffled) - 1, 2)
+    ]
+
+
+def play_season(league: League) -> None:
+    """Play a league's regular season and playoffs to the end."""
+    while league.current_season.phase == SeasonPhase.REGULAR_SEASON:
+        league.simulate_week()
+    while league.current_season.phase == SeasonPhase.PLAYOFFS:
+        if league.simulate_playoff_round():
+            break
@@ -1,7 +1,16 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+
+sys.path.insert(0, SPECPATH)
+from PyQt6.QtCore import QCoreApplication
+from src.ui.components.portrait_atlas import build_atlas
 
 block_cipher = None
 
+# Pack the champion portraits into one atlas instead of bundling loose files
+_qt_app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+atlas_image, atlas_index = build_atlas('src/ChampionPortraits', 'build/portrait_atlas')
+
 a = Analysis(
     ['src/main.py'],
     pathex=[],
@@ -9,7 +18,8 @@ a = Analysis(
     datas=[
         ('src/database/schema.sql', 'src/database'),
         ('src/data/*.py', 'src/data'),
-        ('src/ChampionPortraits', 'ChampionPortraits'),  # Include champion portraits
+        (atlas_image, 'ChampionPortraits'),  # Packed champion portraits
+        (atlas_index, 'ChampionPortraits'),
     ],
     hiddenimports=[
         'PyQt6.QtCore',
@@ -1,8 +1,12 @@
-from typing import List, Optional, Dict
-from ..models.draft import Champion, DraftState, DraftPhase
+from typing import List, Optional, Dict, Tuple
+from ..models.draft import Champion, DraftState, DraftPhase, DraftAction
 from ..models.team import Team
 from ..models.player import Role, Player
-import random
+from ..models.champion import ChampionRegistry
+from .draft_search import DraftSearch
+from .draft_scoring import DraftScorer
+from .draft_book import DraftBook, fingerprint
+import atexit
 
 class DraftAI:
     """AI for making draft choices."""
@@ -57,67 +61,124 @@ class DraftAI:
         'Yuumi': ['Leona', 'Nautilus', 'Thresh'],  # Hard engage
     }
 
+    # Seconds the search may spend per decision; the draft screen waits
+    # 2 seconds before asking for an AI choice, so this must stay well below that
+    SEARCH_TIME_BUDGET = 0.5
+
+    # File the opening book of searched decisions is kept in
+    BOOK_PATH = "data/draft_book.json"
+
+    _search: Optional[DraftSearch] = None
+    _book: Optional[DraftBook] = None
+    _scorers: Dict[int, DraftScorer] = {}
+
+    @classmethod
+    def get_search(cls) -> DraftSearch:
+        """Get the shared draft search, creating it on first use."""
+        if cls._search is None:
+            cls._search = DraftSearch(cls.get_scorer, time_budget=cls.SEARCH_TIME_BUDGET)
+        return cls._search
+
+    @classmethod
+    def get_book(cls) -> DraftBook:
+        """Get the opening book, loading it on first use and saving it at exit."""
+        if cls._book is None:
+            cls._book = DraftBook(
+                cls.BOOK_PATH,
+                tier_fingerprint=fingerprint(cls.TIER_LIST, cls.SYNERGIES, cls.COUNTERS)
+            )
+            atexit.register(cls._book.save)
+        return cls._book
+
+    @staticmethod
+    def _searched_choice(draft_state: DraftState) -> Optional[Champion]:
+        """Look the position up in the book, searching and recording it on a miss."""
+        book = DraftAI.get_book()
+        name = book.get(draft_state)
+        if name:
+            champion = draft_state.registry.get(name)
+            team = draft_state.get_current_team()
+            valid = draft_state.is_valid_pick if draft_state.current_step.action == DraftAction.PICK \
+                else draft_state.is_valid_ban
+            if champion and valid(champion, team):
+                return champion
+
+        champion = DraftAI.get_search().choose(draft_state)
+        if champion:
+            book.put(draft_state, champion.name)
+        return champion
+
+    @classmethod
+    def get_scorer(cls, registry: ChampionRegistry) -> DraftScorer:
+        """Get the compiled scoring tables for a champion registry."""
+        scorer = cls._scorers.get(id(registry))
+        if scorer is None or scorer.registry is not registry:
+            scorer = DraftScorer(registry, cls.TIER_LIST, cls.SYNERGIES, cls.COUNTERS)
+            cls._scorers[id(registry)] = scorer
+        return scorer
+
+    @staticmethod
+    def _team_masks(draft_state: DraftState, team: Team) -> Tuple[int, int]:
+        """Bitmasks of the champions picked by team and by its opponent."""
+        own_mask = enemy_mask = 0
+        for pick in draft_state.picks:
+            if pick.team == team:
+                own_mask |= draft_state.registry.bit(pick.champion)
+            else:
+                enemy_mask |= draft_state.registry.bit(pick.champion)
+        return own_mask, enemy_mask
+
+    @staticmethod
+    def _is_on_clock(draft_state: DraftState, team: Team) -> bool:
+        """Check whether team is the one whose turn it is."""
+        return not draft_state.is_complete and draft_state.get_current_team() == team
+
     @staticmethod
     def get_pick_choice(draft_state: DraftState, team: Team, role: Role) -> Optional[Champion]:
         """Get the AI's pick choice for the given role."""
-        # Get all available champions that can play this role
-        available_champions = [
-            champ for champ in draft_state.available_champions.values()
-            if role in champ.roles and not champ.banned and not champ.picked
-        ]
-        
-        if not available_champions:
-            print(f"No available champions for role {role}")
-            return None
-            
-        # Get champions by tier for this role
-        tier_champions = {
-            'S': [c for c in available_champions if c.name in DraftAI.TIER_LIST[role]['S']],
-            'A': [c for c in available_champions if c.name in DraftAI.TIER_LIST[role]['A']],
-            'B': [c for c in available_champions if c.name in DraftAI.TIER_LIST[role]['B']],
-            'C': [c for c in available_champions if c.name in DraftAI.TIER_LIST[role]['C']]
-        }
-        
-        # Try to pick from each tier, starting with S
-        for tier in ['S', 'A', 'B', 'C']:
-            if tier_champions[tier]:
-                choice = random.choice(tier_champions[tier])
-                print(f"AI choosing {choice.name} ({tier} tier) for {role}")
+        # Search the rest of the draft when the pick is for the team on the clock
+        if DraftAI._is_on_clock(draft_state, team) and draft_state.get_next_role_to_pick(team) == role:
+            choice = DraftAI._searched_choice(draft_state)
+            if choice:
                 return choice
-                
-        # If no tiered champions available, pick randomly from available
-        choice = random.choice(available_champions)
-        print(f"AI choosing {choice.name} (untiered) for {role}")
-        return choice
+        return DraftAI.get_quick_pick(draft_state, team, role)
     
     @staticmethod
     def get_ban_choice(draft_state: DraftState, team: Team) -> Optional[Champion]:
         """Get the AI's ban choice."""
-        # Get all available champions that aren't banned or picked
-        available_champions = [
-            champ for champ in draft_state.available_champions.values()
-            if not champ.banned and not champ.picked
-        ]
-        
-        if not available_champions:
-            print("No available champions to ban")
-            return None
-            
-        # Collect all S and A tier champions across roles
-        high_tier_champions = set()  # Use set to avoid duplicates
-        for role in Role:
-            high_tier_champions.update(DraftAI.TIER_LIST[role]['S'])
-            high_tier_champions.update(DraftAI.TIER_LIST[role]['A'])
-            
-        # Filter available champions to high tier ones
-        ban_candidates = [c for c in available_champions if c.name in high_tier_champions]
-        
-        if ban_candidates:
-            choice = random.choice(ban_candidates)
-            print(f"AI banning high-tier champion {choice.name}")
-            return choice
-            
-        # If no high tier champions available, ban randomly
-        choice = random.choice(available_champions)
-        print(f"AI banning random champion {choice.name}")
-        return choice
+        if DraftAI._is_on_clock(draft_state, team):
+            choice = DraftAI._searched_choice(draft_state)
+            if choice:
+                return choice
+        return DraftAI.get_quick_ban(draft_state, team)
+
+    @staticmethod
+    def get_quick_pick(draft_state: DraftState, team: Team, role: Role) -> Optional[Champion]:
+        """Best pick for role by tier, synergy and counters, without searching ahead."""
+        scorer = DraftAI.get_scorer(draft_state.registry)
+        candidates = draft_state.available_mask & draft_state.registry.role_masks[role]
+        own_mask, enemy_mask = DraftAI._team_masks(draft_state, team)
+        return scorer.best(scorer.pick_scores(candidates, role, own_mask, enemy_mask))
+
+    @staticmethod
+    def get_quick_ban(draft_state: DraftState, team: Team) -> Optional[Champion]:
+        """Best ban by tier, synergy and counters, without searching ahead."""
+        scorer = DraftAI.get_scorer(draft_state.registry)
+        own_mask, enemy_mask = DraftAI._team_masks(draft_state, team)
+        return scorer.best(scorer.ban_scores(draft_state.available_mask, own_mask, enemy_mask))
+
+    @staticmethod
+    def auto_draft(draft_state: DraftState) -> None:
+        """Complete the rest of a draft with quick choices for both teams."""
+        while not draft_state.is_complete:
+            step = draft_state.current_step
+            team = draft_state.get_team(step.side)
+            if step.action == DraftAction.PICK:
+                role = draft_state.get_next_role_to_pick(team)
+                champion = DraftAI.get_quick_pick(draft_state, team, role)
+                if not champion or not draft_state.make_pick(champion, team):
+                    raise ValueError(f"No champion available for {team.name} {role.value}")
+            else:
+                champion = DraftAI.get_quick_ban(draft_state, team)
+                if not champion or not draft_state.make_ban(champion, team):
+                    raise ValueError(f"No champion available for {team.name} to ban")
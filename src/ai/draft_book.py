@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from ..models.draft import DraftState
+from ..models.player import Role
+
+
+def fingerprint(tier_list: Dict[Role, Dict[str, List[str]]],
+                synergies: Dict[str, List[str]],
+                counters: Dict[str, List[str]]) -> str:
+    """Hash the AI's champion data so a book built on another patch is discarded."""
+    data = {
+        'tiers': {role.value: tiers for role, tiers in tier_list.items()},
+        'synergies': synergies,
+        'counters': counters
+    }
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+class DraftBook:
+    """LRU cache of AI draft decisions that persists between sessions.
+
+    Positions are keyed canonically by the side on the clock, the turn, the
+    set of bans and each side's picks with their roles, so the same
+    position reached in a different order shares an entry. Decisions are
+    stored by champion name; the whole book is dropped when the tier list
+    fingerprint it was built with no longer matches.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[str] = "data/draft_book.json",
+                 tier_fingerprint: str = "", max_entries: int = 4096):
+        """Load the book from path, if it exists and matches tier_fingerprint.
+
+        Args:
+            path: JSON file the book is saved to, or None to keep it in memory
+            tier_fingerprint: Hash of the tier data decisions were made with
+            max_entries: Entries kept before the least recently used are dropped
+        """
+        self.path = path
+        self.tier_fingerprint = tier_fingerprint
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def key(draft_state: DraftState) -> str:
+        """Canonical key for the position at the draft's cursor."""
+        step = draft_state.current_step
+        picks = {side: [] for side in ('blue', 'red')}
+        for pick in draft_state.picks:
+            side = 'blue' if pick.team == draft_state.blue_team else 'red'
+            picks[side].append(f"{pick.champion.name}:{pick.player.role.value}")
+        parts = [
+            step.side.value if step else "",
+            str(draft_state.current_turn),
+            ",".join(sorted(ban.champion.name for ban in draft_state.bans)),
+            ",".join(sorted(picks['blue'])),
+            ",".join(sorted(picks['red']))
+        ]
+        return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+    def get(self, draft_state: DraftState) -> Optional[str]:
+        """Get the stored decision (a champion name) for this position."""
+        key = self.key(draft_state)
+        name = self.entries.get(key)
+        if name is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return name
+
+    def put(self, draft_state: DraftState, champion_name: str) -> None:
+        """Record the decision made at this position."""
+        key = self.key(draft_state)
+        self.entries[key] = champion_name
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._dirty = True
+
+    def clear(self) -> None:
+        """Forget every decision."""
+        self.entries.clear()
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the book to its file if anything changed since the last save."""
+        if not self.path or not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        data = {
+            'version': self.VERSION,
+            'tiers': self.tier_fingerprint,
+            'entries': list(self.entries.items())
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # A damaged book is only a cache; start over
+            return
+        if data.get('version') != self.VERSION or data.get('tiers') != self.tier_fingerprint:
+            return
+        for key, name in data.get('entries', [])[-self.max_entries:]:
+            self.entries[key] = name
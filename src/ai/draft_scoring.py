@@ -0,0 +1,119 @@
+import random
+from typing import Dict, List, Optional
+
+from ..models.champion import Champion, ChampionRegistry
+from ..models.player import Role
+
+
+# Score for a champion in each tier of its role
+TIER_VALUES = {'S': 12.0, 'A': 8.0, 'B': 4.0, 'C': 2.0}
+SYNERGY_BONUS = 5.0
+COUNTER_PENALTY = 5.0
+
+
+class DraftScorer:
+    """Tier, synergy and counter data compiled against a champion registry.
+
+    Tier lists become one dense score vector per role, indexed by champion
+    id. SYNERGIES and COUNTERS become champion x champion 0/1 matrices whose
+    rows are stored as registry bitmasks, so a row times a team's pick mask
+    is a single AND plus a popcount. Scoring every candidate against the
+    current picks is one pass over the candidate ids with no name lookups.
+    """
+
+    def __init__(
+        self,
+        registry: ChampionRegistry,
+        tier_list: Dict[Role, Dict[str, List[str]]],
+        synergies: Dict[str, List[str]],
+        counters: Dict[str, List[str]]
+    ):
+        """Compile the static AI tables.
+
+        Args:
+            registry: Registry whose champion ids index the vectors and masks
+            tier_list: Role -> tier letter -> champion names
+            synergies: Champion -> champions it combines well with
+            counters: Champion -> champions that counter it
+        """
+        self.registry = registry
+        size = len(registry)
+
+        self.tier_vectors: Dict[Role, List[float]] = {role: [0.0] * size for role in Role}
+        for role, by_tier in tier_list.items():
+            vector = self.tier_vectors[role]
+            for tier, names in by_tier.items():
+                for champion in self._lookup(names):
+                    vector[champion.champion_id] = TIER_VALUES[tier]
+        # A champion's ban value is its best tier in any role
+        self.ban_vector: List[float] = [max(values) for values in zip(*self.tier_vectors.values())]
+
+        # synergy_rows[i]: champions that combine with i (symmetric)
+        # counter_rows[i]: champions that counter i
+        # countering_rows[i]: champions that i counters (transpose of counter_rows)
+        self.synergy_rows: List[int] = [0] * size
+        self.counter_rows: List[int] = [0] * size
+        self.countering_rows: List[int] = [0] * size
+        for name, partners in synergies.items():
+            champion = registry.get(name)
+            if not champion:
+                continue
+            for partner in self._lookup(partners):
+                self.synergy_rows[champion.champion_id] |= registry.bit(partner)
+                self.synergy_rows[partner.champion_id] |= registry.bit(champion)
+        for name, threats in counters.items():
+            champion = registry.get(name)
+            if not champion:
+                continue
+            for threat in self._lookup(threats):
+                self.counter_rows[champion.champion_id] |= registry.bit(threat)
+                self.countering_rows[threat.champion_id] |= registry.bit(champion)
+
+    def _lookup(self, names: List[str]) -> List[Champion]:
+        """Resolve names to champions, skipping any the registry lacks."""
+        return [c for c in map(self.registry.get, names) if c]
+
+    def pick_scores(self, candidates: int, role: Role, own_mask: int, enemy_mask: int) -> Dict[int, float]:
+        """Score every candidate id for a pick in role against the current picks."""
+        tiers = self.tier_vectors[role]
+        synergy, counter, countering = self.synergy_rows, self.counter_rows, self.countering_rows
+        return {
+            i: tiers[i]
+            + SYNERGY_BONUS * _popcount(synergy[i] & own_mask)
+            + COUNTER_PENALTY * _popcount(countering[i] & enemy_mask)
+            - COUNTER_PENALTY * _popcount(counter[i] & enemy_mask)
+            for i in _ids(candidates)
+        }
+
+    def ban_scores(self, candidates: int, own_mask: int, enemy_mask: int) -> Dict[int, float]:
+        """Score every candidate id as a ban: how much it would help the enemy."""
+        tiers = self.ban_vector
+        synergy, countering = self.synergy_rows, self.countering_rows
+        return {
+            i: tiers[i]
+            + SYNERGY_BONUS * _popcount(synergy[i] & enemy_mask)
+            + COUNTER_PENALTY * _popcount(countering[i] & own_mask)
+            for i in _ids(candidates)
+        }
+
+    def best(self, scores: Dict[int, float]) -> Optional[Champion]:
+        """Pick the highest score, breaking ties at random."""
+        if not scores:
+            return None
+        top = max(scores.values())
+        return self.registry.champions[random.choice([i for i, s in scores.items() if s == top])]
+
+
+def _popcount(mask: int) -> int:
+    """Number of set bits (int.bit_count needs Python 3.10)."""
+    return bin(mask).count("1")
+
+
+def _ids(mask: int) -> List[int]:
+    """Champion ids of the bits set in mask."""
+    ids = []
+    while mask:
+        low_bit = mask & -mask
+        ids.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return ids
@@ -0,0 +1,217 @@
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..models.champion import Champion, ChampionRegistry
+from ..models.draft import DraftState, DraftAction, DraftSide, DraftPick, DRAFT_SEQUENCE
+from ..models.match import Match
+from .draft_scoring import DraftScorer
+
+
+# Transposition table entry bounds
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+class DraftSearch:
+    """Depth-limited alpha-beta search over the remaining draft.
+
+    Positions are scored from blue's point of view as blue's team value
+    minus red's, where a team's value is Match._analyze_team_composition
+    plus the DraftScorer pick score of each of its picks. Picks are scored
+    in draft order against the picks before them, as the win probability
+    estimator does, so each synergy or counter pair counts once. Candidates
+    are ordered by the scorer's tier vectors and only the best `branching`
+    are searched at each step.
+
+    The search deepens iteratively until the time budget runs out and
+    answers with the best move of the deepest completed iteration.
+    Results are kept in a transposition table keyed by the draft position,
+    so later decisions in the same draft reuse earlier work.
+    """
+
+    def __init__(
+        self,
+        get_scorer: Callable[[ChampionRegistry], DraftScorer],
+        time_budget: float = 0.5,
+        max_depth: int = 6,
+        branching: int = 6,
+        table_size: int = 200000
+    ):
+        """Build the search on the AI's compiled scoring tables.
+
+        Args:
+            get_scorer: Returns the DraftScorer for a draft's registry,
+                e.g. DraftAI.get_scorer
+            time_budget: Seconds allowed per decision
+            max_depth: Maximum number of draft steps to look ahead
+            branching: Candidates searched per step after move ordering
+            table_size: Transposition table entries kept before it is cleared
+        """
+        self.get_scorer = get_scorer
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.branching = branching
+        self.table_size = table_size
+
+        self.table: Dict[Tuple[int, int, int, int], Tuple[int, float, int, Optional[Champion]]] = {}
+        self._values: Dict[int, float] = {}
+        self._deadline = 0.0
+        self.nodes = 0
+
+    def choose(self, draft_state: DraftState) -> Optional[Champion]:
+        """Pick the best pick or ban for whoever is on the clock."""
+        if draft_state.is_complete:
+            return None
+
+        # Search a private copy so the caller's redo history is untouched
+        state = DraftState(
+            blue_team=draft_state.blue_team,
+            red_team=draft_state.red_team,
+            registry=draft_state.registry
+        )
+        state.restore(draft_state.snapshot())
+
+        if len(self.table) > self.table_size:
+            self.table.clear()
+            self._values.clear()
+
+        moves = self._ordered_moves(state)
+        if not moves:
+            return None
+        best = moves[0]
+
+        self.nodes = 0
+        self._deadline = time.perf_counter() + self.time_budget
+        remaining = len(DRAFT_SEQUENCE) - state.current_turn
+        for depth in range(1, min(self.max_depth, remaining) + 1):
+            try:
+                _, move = self._alphabeta(state, depth, float('-inf'), float('inf'))
+            except _SearchTimeout:
+                break
+            if move is not None:
+                best = move
+        return best
+
+    def _key(self, state: DraftState) -> Tuple[int, int, int, int]:
+        blue_mask = red_mask = 0
+        for pick in state.picks:
+            if pick.team is state.blue_team:
+                blue_mask |= state.registry.bit(pick.champion)
+            else:
+                red_mask |= state.registry.bit(pick.champion)
+        return (state.current_turn, state.banned_mask, blue_mask, red_mask)
+
+    def _ordered_moves(self, state: DraftState) -> List[Champion]:
+        """Legal moves for the current step, best tier first, cut to the branching factor."""
+        step = state.current_step
+        scorer = self.get_scorer(state.registry)
+        if step.action == DraftAction.PICK:
+            role = state.get_next_role_to_pick(state.get_team(step.side))
+            candidates = state.get_available_champions(role=role)
+            tiers = scorer.tier_vectors[role]
+        else:
+            candidates = state.get_available_champions()
+            tiers = scorer.ban_vector
+        candidates.sort(key=lambda c: -tiers[c.champion_id])
+        return candidates[:self.branching]
+
+    def _alphabeta(self, state: DraftState, depth: int, alpha: float, beta: float
+                   ) -> Tuple[float, Optional[Champion]]:
+        self.nodes += 1
+        if time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+        if depth == 0 or state.is_complete:
+            return self.evaluate(state), None
+
+        key = self._key(state)
+        entry = self.table.get(key)
+        hint = None
+        if entry:
+            entry_depth, value, bound, hint = entry
+            if entry_depth >= depth:
+                if bound == EXACT:
+                    return value, hint
+                if bound == LOWER:
+                    alpha = max(alpha, value)
+                elif bound == UPPER:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value, hint
+
+        moves = self._ordered_moves(state)
+        if hint in moves:
+            # Try the previous best move first
+            moves.remove(hint)
+            moves.insert(0, hint)
+
+        maximizing = state.current_step.side == DraftSide.BLUE
+        original_alpha, original_beta = alpha, beta
+        best_value = float('-inf') if maximizing else float('inf')
+        best_move = None
+        for champion in moves:
+            if not self._play(state, champion):
+                continue
+            try:
+                value, _ = self._alphabeta(state, depth - 1, alpha, beta)
+            finally:
+                state.undo()
+
+            if (value > best_value) if maximizing else (value < best_value):
+                best_value, best_move = value, champion
+            if maximizing:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+
+        if best_move is None:
+            return self.evaluate(state), None
+
+        if best_value <= original_alpha:
+            bound = UPPER
+        elif best_value >= original_beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table[key] = (depth, best_value, bound, best_move)
+        return best_value, best_move
+
+    def _play(self, state: DraftState, champion: Champion) -> bool:
+        step = state.current_step
+        team = state.get_team(step.side)
+        if step.action == DraftAction.PICK:
+            return state.make_pick(champion, team)
+        return state.make_ban(champion, team)
+
+    def evaluate(self, state: DraftState) -> float:
+        """Score a position from blue's point of view."""
+        scorer = self.get_scorer(state.registry)
+        blue_picks: List[DraftPick] = []
+        red_picks: List[DraftPick] = []
+        blue_mask = red_mask = 0
+        value = 0.0
+        for pick in state.picks:
+            i = pick.champion.champion_id
+            if pick.team is state.blue_team:
+                value += scorer.pick_scores(1 << i, pick.player.role, blue_mask, red_mask)[i]
+                blue_mask |= 1 << i
+                blue_picks.append(pick)
+            else:
+                value -= scorer.pick_scores(1 << i, pick.player.role, red_mask, blue_mask)[i]
+                red_mask |= 1 << i
+                red_picks.append(pick)
+        return value + self._composition(blue_mask, blue_picks) - self._composition(red_mask, red_picks)
+
+    def _composition(self, mask: int, picks: List[DraftPick]) -> float:
+        """Match._analyze_team_composition for one team's picks, cached by their mask."""
+        if not picks:
+            return 0.0
+        composition = self._values.get(mask)
+        if composition is None:
+            composition = self._values[mask] = Match._analyze_team_composition(picks)
+        return composition
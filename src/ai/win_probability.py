@@ -0,0 +1,132 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+from ..models.champion import Champion
+from ..models.draft import DraftState, DraftPick, DraftAction
+from ..models.player import Role
+from ..models.team import Team
+from .draft_scoring import DraftScorer
+
+
+# Draft points per point of player rating above or below AVERAGE_RATING
+RATING_WEIGHT = 0.5
+AVERAGE_RATING = 70.0
+# Score difference that moves the estimate from 50% to about 73%
+LOGISTIC_SCALE = 20.0
+
+
+class WinProbabilityEstimator:
+    """Running estimate of blue side's chance to win a draft.
+
+    Each team's score is a sum of per-pick terms: the champion's tier in
+    the role, its synergies with earlier picks on the same team, its
+    counters against earlier enemy picks, and the rating of the starter
+    playing that role. Pair terms are counted once, when the second
+    champion of the pair is picked, so the difference between the teams
+    does not depend on pick order and can be updated one pick at a time.
+    """
+
+    def __init__(self, draft_state: DraftState, scorer: DraftScorer):
+        """Start tracking draft_state.
+
+        Args:
+            draft_state: Draft to follow; call update() after it changes
+            scorer: Compiled tier, synergy and counter tables for its registry
+        """
+        self.draft_state = draft_state
+        self.scorer = scorer
+        self.rating_terms: Dict[int, Dict[Role, float]] = {}
+        for team in (draft_state.blue_team, draft_state.red_team):
+            lineup = team.get_starting_lineup()
+            self.rating_terms[id(team)] = {
+                role: (player.stats.overall_rating - AVERAGE_RATING) * RATING_WEIGHT if player else 0.0
+                for role, player in lineup.items()
+            }
+        self._reset()
+        self.update()
+
+    def _reset(self) -> None:
+        self.blue_score = 0.0
+        self.red_score = 0.0
+        self._masks = {id(self.draft_state.blue_team): 0, id(self.draft_state.red_team): 0}
+        self._folded: List[DraftPick] = []
+        self._previews: Optional[Dict[int, float]] = None
+        self._preview_key: Optional[Tuple[int, int]] = None
+
+    @property
+    def probability(self) -> float:
+        """Blue side's estimated chance to win (0-1)."""
+        return self._logistic(self.blue_score - self.red_score)
+
+    @staticmethod
+    def _logistic(difference: float) -> float:
+        return 1.0 / (1.0 + math.exp(-difference / LOGISTIC_SCALE))
+
+    def update(self) -> float:
+        """Fold in picks made since the last update and return the new probability.
+
+        Bans do not change either team's score. If picks were undone the
+        estimate is rebuilt from the remaining picks.
+        """
+        picks = self.draft_state.picks
+        folded = len(self._folded)
+        if folded > len(picks) or (folded and picks[folded - 1] is not self._folded[-1]):
+            self._reset()
+        for pick in picks[len(self._folded):]:
+            self._fold(pick)
+        return self.probability
+
+    def _fold(self, pick: DraftPick) -> None:
+        role = pick.player.role
+        delta = self._delta(pick.champion.champion_id, pick.team, role)
+        if pick.team == self.draft_state.blue_team:
+            self.blue_score += delta
+        else:
+            self.red_score += delta
+        self._masks[id(pick.team)] |= 1 << pick.champion.champion_id
+        self._folded.append(pick)
+
+    def _masks_for(self, team: Team) -> Tuple[int, int]:
+        own = self._masks[id(team)]
+        enemy_team = self.draft_state.red_team if team == self.draft_state.blue_team else self.draft_state.blue_team
+        return own, self._masks[id(enemy_team)]
+
+    def _delta(self, champion_id: int, team: Team, role: Role) -> float:
+        own_mask, enemy_mask = self._masks_for(team)
+        score = self.scorer.pick_scores(1 << champion_id, role, own_mask, enemy_mask)[champion_id]
+        return score + self.rating_terms[id(team)].get(role, 0.0)
+
+    def preview(self, champion: Champion) -> Optional[float]:
+        """Blue's win chance if the team on the clock picked champion now.
+
+        Returns None outside pick turns or if the champion cannot be picked.
+        """
+        return self.preview_all().get(champion.champion_id)
+
+    def preview_all(self) -> Dict[int, float]:
+        """What-if probabilities for every legal pick this turn, by champion id.
+
+        Computed in one pass over the candidates and reused until the draft changes.
+        """
+        self.update()
+        key = (self.draft_state.current_turn, self.draft_state.available_mask)
+        if self._preview_key == key and self._previews is not None:
+            return self._previews
+
+        previews: Dict[int, float] = {}
+        step = self.draft_state.current_step
+        if step and step.action == DraftAction.PICK:
+            team = self.draft_state.get_team(step.side)
+            role = self.draft_state.get_next_role_to_pick(team)
+            if role:
+                own_mask, enemy_mask = self._masks_for(team)
+                candidates = self.draft_state.available_mask & self.draft_state.registry.role_masks[role]
+                rating = self.rating_terms[id(team)].get(role, 0.0)
+                sign = 1.0 if team == self.draft_state.blue_team else -1.0
+                difference = self.blue_score - self.red_score
+                for i, score in self.scorer.pick_scores(candidates, role, own_mask, enemy_mask).items():
+                    previews[i] = self._logistic(difference + sign * (score + rating))
+
+        self._previews = previews
+        self._preview_key = key
+        return previews
@@ -0,0 +1,172 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, TypeVar
+
+from src.database.db_manager import DatabaseManager
+
+T = TypeVar('T')
+
+
+def _is_lock_error(error: sqlite3.OperationalError) -> bool:
+    """Check whether an OperationalError is a transient lock/busy error."""
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+class ConnectionManager:
+    """Hand out sqlite connections to parallel simulation workers.
+
+    Each thread (and each process, after a fork) gets its own read-only
+    connection, so workers can load rosters concurrently without sharing
+    a Connection across threads. All writes go through one writer
+    connection per process, serialized by a writer lock that readers never
+    take. File databases are switched to WAL so readers are not blocked
+    while the writer commits.
+
+    Lock errors from other processes are absorbed by sqlite's busy timeout
+    and, if that runs out, retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/game.db",
+        busy_timeout: float = 5.0,
+        max_retries: int = 5,
+        retry_delay: float = 0.05
+    ):
+        """Create the schema and switch file databases to WAL.
+
+        Args:
+            db_path: Database file or "file:" URI. Plain ":memory:" cannot
+                be shared between connections; use a shared-cache URI.
+            busy_timeout: Seconds sqlite waits on a lock before raising
+            max_retries: Extra attempts for a write that still hit a lock
+            retry_delay: Initial backoff between retries, doubled each time
+        """
+        if db_path == ":memory:":
+            raise ValueError(
+                "':memory:' is private to one connection; "
+                "use 'file:<name>?mode=memory&cache=shared'"
+            )
+
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._writer_lock = threading.Lock()
+        self._writer = None
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        # The setup connection creates the schema and, for in-memory
+        # shared-cache databases, keeps the database alive.
+        self._setup_db = DatabaseManager(db_path)
+        self._setup_db.conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+        if not self._setup_db.in_memory:
+            self._setup_db.conn.execute("PRAGMA journal_mode = WAL")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            uri=self.db_path.startswith("file:"),
+            check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        if "cache=shared" in self.db_path:
+            # Shared-cache connections use table locks, which busy_timeout
+            # does not wait on: a reader would fail with "table is locked"
+            # whenever the writer has a transaction open. Reads here are
+            # deliberately dirty instead and can see writes that are later
+            # rolled back. Only the in-memory databases of parallel
+            # simulation use shared cache, and their workers read rosters
+            # that no write changes during a run, so they never see a
+            # half-written team. File databases use WAL and read only
+            # committed data.
+            conn.execute("PRAGMA read_uncommitted = ON")
+        return conn
+
+    def _check_process(self) -> None:
+        """Drop connections inherited across a fork; they are not fork-safe."""
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._local = threading.local()
+            self._writer = None
+            self._writer_lock = threading.Lock()
+            self._readers = []
+            self._readers_lock = threading.Lock()
+
+    def reader(self) -> DatabaseManager:
+        """Get this thread's read-only DatabaseManager, creating it on first use."""
+        self._check_process()
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON")
+            with self._readers_lock:
+                self._readers.append(conn)
+            db = DatabaseManager(self.db_path, conn=conn)
+            self._local.db = db
+        return db
+
+    @contextmanager
+    def writer(self) -> Iterator[DatabaseManager]:
+        """Hold the writer for one transaction.
+
+        Everything written inside the block is committed together when it
+        exits. Use write() instead when the block should be retried on lock
+        errors.
+        """
+        self._check_process()
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = DatabaseManager(self.db_path, conn=self._connect())
+            with self._writer.batch():
+                yield self._writer
+
+    def write(self, operation: Callable[[DatabaseManager], T]) -> T:
+        """Run operation(db) in a write transaction, retrying on lock errors.
+
+        The operation may run more than once, so it should only touch the
+        database it is given. A failed attempt is rolled back first, so a
+        retry never replays writes into a transaction that is still open.
+        """
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.writer() as db:
+                    return operation(db)
+            except sqlite3.OperationalError as e:
+                self._rollback_writer()
+                if not _is_lock_error(e) or attempt == self.max_retries:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+
+    def _rollback_writer(self) -> None:
+        """Roll back what a failed write left open, e.g. after commit hit a lock."""
+        with self._writer_lock:
+            if self._writer is not None and self._writer.conn.in_transaction:
+                self._writer.conn.rollback()
+
+    def close(self) -> None:
+        """Close every connection opened by this process."""
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers = []
+        self._local = threading.local()
+
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        self._setup_db.close()
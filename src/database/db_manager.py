@@ -1,4 +1,7 @@
+import os
 import sqlite3
+import time
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
@@ -7,48 +10,200 @@ from src.models.player import Player, PlayerStats, Role
 from src.models.team import Team
 from src.models.match import Match, MatchResult
 from src.models.league import League
+from src.utils.tracing import traced
 
 
 class DatabaseManager:
-    def __init__(self, db_path: str = "data/game.db"):
-        """Initialize database connection and create tables if they don't exist."""
+    # Columns get_season_leaderboard can rank by
+    LEADERBOARD_STATS = (
+        'kda', 'kills', 'deaths', 'assists', 'cs',
+        'damage_dealt', 'gold_earned', 'wins', 'matches_played'
+    )
+    
+    def __init__(self, db_path: str = "data/game.db",
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: Optional[float] = None,
+                 conn: Optional[sqlite3.Connection] = None,
+                 check_same_thread: bool = True):
+        """Initialize database connection and create tables if they don't exist.
+        
+        Args:
+            db_path: Database file, ":memory:" or a "file:" URI such as
+                "file:sim?mode=memory&cache=shared"
+            checkpoint_path: File that checkpoint() copies the database to
+                when no path is given, typically the save file behind an
+                in-memory database
+            checkpoint_interval: Seconds between automatic checkpoints,
+                checked after each commit. None disables them, so an
+                in-memory database does no disk I/O until checkpoint().
+            conn: Existing connection to wrap instead of opening one. The
+                schema is assumed to exist already; see ConnectionManager.
+            check_same_thread: Passed to sqlite3.connect. False lets the
+                simulation worker and the GUI thread use the database in
+                turn; they must never use it at the same time.
+        """
         self.db_path = db_path
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.last_checkpoint = time.monotonic()
+        
+        # Nesting depth of batch() blocks; commits are deferred while > 0
+        self._batch_depth = 0
+        
+        if conn is not None:
+            self.conn = conn
+            self.conn.row_factory = sqlite3.Row
+            return
         
         # Create data directory if it doesn't exist
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        if not self.in_memory:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize database
-        self.conn = sqlite3.connect(db_path)
+        self.conn = sqlite3.connect(db_path, uri=db_path.startswith("file:"),
+                                    check_same_thread=check_same_thread)
         self.conn.row_factory = sqlite3.Row
         
         # Create tables
         self._create_tables()
     
+    @property
+    def in_memory(self) -> bool:
+        """Whether the live database is held in memory rather than a file."""
+        return self.db_path == ":memory:" or "mode=memory" in self.db_path
+    
     def _create_tables(self):
         """Create database tables from schema.sql."""
-        with open("src/database/schema.sql", "r") as f:
+        self._migrate()
+        with open(Path(__file__).with_name("schema.sql"), "r") as f:
             schema = f.read()
             self.conn.executescript(schema)
             self.conn.commit()
     
+    def _migrate(self):
+        """Add columns introduced after a database file was first created."""
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(matches)")}
+        if columns and 'season' not in columns:
+            self.conn.execute("ALTER TABLE matches ADD COLUMN season TEXT")
+            self.conn.commit()
+    
     def close(self):
         """Close database connection."""
         self.conn.close()
     
+    def _commit(self):
+        """Commit the current transaction unless a batch is open."""
+        if self._batch_depth == 0:
+            self.conn.commit()
+            self._maybe_checkpoint()
+    
+    def _maybe_checkpoint(self):
+        """Run a scheduled checkpoint if the interval has elapsed."""
+        if self.checkpoint_interval is None or not self.checkpoint_path:
+            return
+        if time.monotonic() - self.last_checkpoint >= self.checkpoint_interval:
+            self.checkpoint()
+    
+    @traced()
+    def checkpoint(self, path: Optional[str] = None) -> str:
+        """Copy the live database to a file with sqlite's online backup API.
+        
+        Args:
+            path: Destination file. Defaults to checkpoint_path.
+            
+        Returns:
+            str: The path that was written
+        """
+        path = path or self.checkpoint_path
+        if not path:
+            raise ValueError("No checkpoint path given")
+        
+        # Write to a temporary file first so a crash mid-copy never
+        # leaves a half-written save behind
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        target = sqlite3.connect(tmp_path)
+        try:
+            self.conn.backup(target)
+        finally:
+            target.close()
+        os.replace(tmp_path, path)
+        
+        self.last_checkpoint = time.monotonic()
+        return path
+    
+    @traced()
+    def restore(self, path: Optional[str] = None) -> None:
+        """Replace the live database with the contents of a file.
+        
+        Used to load a save into an in-memory database before simulating.
+        """
+        path = path or self.checkpoint_path
+        if not path:
+            raise ValueError("No restore path given")
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Database file not found: {path}")
+        
+        source = sqlite3.connect(path)
+        try:
+            source.backup(self.conn)
+        finally:
+            source.close()
+        
+        # Bring saves written by older versions up to the current schema
+        self._create_tables()
+    
+    @contextmanager
+    def batch(self):
+        """Group several save operations into a single transaction.
+        
+        Commits once when the outermost block exits, or rolls back
+        everything written inside it if an exception escapes.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.rollback()
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.commit()
+                self._maybe_checkpoint()
+    
     # Player operations
+    @traced()
     def save_player(self, player: Player) -> int:
-        """Save player to database. Return player ID."""
+        """Save player to database, updating the row if it has a player_id. Return player ID."""
         cursor = self.conn.cursor()
         
         query = """
         INSERT INTO players (
-            name, role, nationality, mechanical_skill, game_knowledge,
+            id, name, role, nationality, mechanical_skill, game_knowledge,
             communication, leadership, salary, contract_end, team_id,
             games_played, wins, losses
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            name = excluded.name,
+            role = excluded.role,
+            nationality = excluded.nationality,
+            mechanical_skill = excluded.mechanical_skill,
+            game_knowledge = excluded.game_knowledge,
+            communication = excluded.communication,
+            leadership = excluded.leadership,
+            salary = excluded.salary,
+            contract_end = excluded.contract_end,
+            team_id = excluded.team_id,
+            games_played = excluded.games_played,
+            wins = excluded.wins,
+            losses = excluded.losses
         """
         
         cursor.execute(query, (
+            player.player_id,
             player.name,
             player.role.value,
             player.nationality,
@@ -64,9 +219,12 @@ class DatabaseManager:
             player.losses
         ))
         
-        self.conn.commit()
-        return cursor.lastrowid
+        if player.player_id is None:
+            player.player_id = cursor.lastrowid
+        self._commit()
+        return player.player_id
     
+    @traced()
     def load_player(self, player_id: int) -> Optional[Player]:
         """Load player from database by ID."""
         cursor = self.conn.cursor()
@@ -92,7 +250,8 @@ class DatabaseManager:
             nationality=row['nationality'],
             salary=row['salary'],
             contract_end=date.fromisoformat(row['contract_end']),
-            team_id=row['team_id']
+            team_id=row['team_id'],
+            player_id=row['id']
         )
         
         player.games_played = row['games_played']
@@ -102,18 +261,28 @@ class DatabaseManager:
         return player
     
     # Team operations
+    @traced()
     def save_team(self, team: Team) -> int:
-        """Save team to database. Return team ID."""
+        """Save team and its roster, updating the rows of those that have IDs. Return team ID."""
         cursor = self.conn.cursor()
         
         query = """
         INSERT INTO teams (
-            name, region, budget, games_played, wins,
+            id, name, region, budget, games_played, wins,
             losses, championship_points
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            name = excluded.name,
+            region = excluded.region,
+            budget = excluded.budget,
+            games_played = excluded.games_played,
+            wins = excluded.wins,
+            losses = excluded.losses,
+            championship_points = excluded.championship_points
         """
         
         cursor.execute(query, (
+            team.team_id,
             team.name,
             team.region,
             team.budget,
@@ -123,7 +292,9 @@ class DatabaseManager:
             team.championship_points
         ))
         
-        team_id = cursor.lastrowid
+        if team.team_id is None:
+            team.team_id = cursor.lastrowid
+        team_id = team.team_id
         
         # Save all players in roster
         for role_players in team.roster.values():
@@ -131,9 +302,10 @@ class DatabaseManager:
                 player.team_id = team_id
                 self.save_player(player)
         
-        self.conn.commit()
+        self._commit()
         return team_id
     
+    @traced()
     def load_team(self, team_id: int) -> Optional[Team]:
         """Load team and its roster from database by ID."""
         cursor = self.conn.cursor()
@@ -169,8 +341,15 @@ class DatabaseManager:
         return team
     
     # Match operations
-    def save_match(self, match: Match) -> int:
-        """Save match to database. Return match ID."""
+    @traced()
+    def save_match(self, match: Match, season: Optional[str] = None) -> int:
+        """Save match to database. Return match ID.
+        
+        Args:
+            match: Completed match to save
+            season: Season label the match belongs to (e.g. "Spring 2024").
+                Defaults to the year of the match date.
+        """
         if not match.result:
             raise ValueError("Cannot save match without result")
         
@@ -179,13 +358,15 @@ class DatabaseManager:
         query = """
         INSERT INTO matches (
             team1_id, team2_id, winner_id, team1_score,
-            team2_score, match_date, league_id
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            team2_score, match_date, league_id, season
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
         
         result = match.result
         team1_score = result.winner_score if result.winner == match.team1 else result.loser_score
         team2_score = result.winner_score if result.winner == match.team2 else result.loser_score
+        if season is None:
+            season = str(match.match_date.year)
         
         cursor.execute(query, (
             match.team1.team_id,
@@ -194,12 +375,81 @@ class DatabaseManager:
             team1_score,
             team2_score,
             match.match_date.isoformat(),
-            None  # league_id will be set when leagues are implemented
+            None,  # league_id will be set when leagues are implemented
+            season
         ))
         
-        self.conn.commit()
-        return cursor.lastrowid
+        match_id = cursor.lastrowid
+        self._save_match_stats(cursor, match_id, result, season)
+        
+        self._commit()
+        return match_id
+    
+    def _save_match_stats(self, cursor: sqlite3.Cursor, match_id: int,
+                          result: MatchResult, season: str) -> None:
+        """Record player box scores and fold the match into the summary tables."""
+        for team, team_stats, won in ((result.winner, result.winner_stats, True),
+                                      (result.loser, result.loser_stats, False)):
+            games_won = result.winner_score if won else result.loser_score
+            games_lost = result.loser_score if won else result.winner_score
+            
+            cursor.execute("""
+                INSERT INTO team_season_stats (
+                    team_id, season, matches_played, wins, losses, games_won, games_lost
+                ) VALUES (?, ?, 1, ?, ?, ?, ?)
+                ON CONFLICT (team_id, season) DO UPDATE SET
+                    matches_played = matches_played + 1,
+                    wins = wins + excluded.wins,
+                    losses = losses + excluded.losses,
+                    games_won = games_won + excluded.games_won,
+                    games_lost = games_lost + excluded.games_lost
+            """, (team.team_id, season, int(won), int(not won), games_won, games_lost))
+            
+            # An archived match has no box scores in memory
+            if team_stats is None:
+                continue
+            
+            # TeamMatchStats pre-fills an entry for every rostered player, but
+            # Match.simulate only fields the first player listed in each role.
+            starters = {players[0] for players in team.roster.values() if players}
+            rows = [
+                (match_id, player.player_id, team.team_id, won,
+                 stats.kills, stats.deaths, stats.assists, stats.cs,
+                 stats.vision_score, stats.damage_dealt, stats.gold_earned)
+                for player, stats in team_stats.player_stats.items()
+                if player in starters and player.player_id is not None
+            ]
+            if not rows:
+                continue
+            
+            cursor.executemany("""
+                INSERT INTO player_match_stats (
+                    match_id, player_id, team_id, won, kills, deaths, assists,
+                    cs, vision_score, damage_dealt, gold_earned
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            cursor.executemany("""
+                INSERT INTO player_season_stats (
+                    player_id, season, team_id, matches_played, wins, kills,
+                    deaths, assists, cs, damage_dealt, gold_earned
+                ) VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (player_id, season) DO UPDATE SET
+                    team_id = excluded.team_id,
+                    matches_played = matches_played + 1,
+                    wins = wins + excluded.wins,
+                    kills = kills + excluded.kills,
+                    deaths = deaths + excluded.deaths,
+                    assists = assists + excluded.assists,
+                    cs = cs + excluded.cs,
+                    damage_dealt = damage_dealt + excluded.damage_dealt,
+                    gold_earned = gold_earned + excluded.gold_earned
+            """, [
+                (row[1], season, row[2], int(won), row[4], row[5], row[6],
+                 row[7], row[9], row[10])
+                for row in rows
+            ])
     
+    @traced()
     def load_match(self, match_id: int) -> Optional[Match]:
         """Load match from database by ID."""
         cursor = self.conn.cursor()
@@ -240,6 +490,7 @@ class DatabaseManager:
         return match
     
     # League operations
+    @traced()
     def save_league(self, league: League) -> int:
         """Save league to database. Return league ID."""
         cursor = self.conn.cursor()
@@ -273,9 +524,10 @@ class DatabaseManager:
                 (league_id, team.team_id)
             )
         
-        self.conn.commit()
+        self._commit()
         return league_id
     
+    @traced()
     def load_league(self, league_id: int) -> Optional[League]:
         """Load league from database by ID."""
         cursor = self.conn.cursor()
@@ -309,3 +561,198 @@ class DatabaseManager:
         league.season_started = bool(row['season_started'])
         
         return league
+    
+    # Match archive
+    @traced()
+    def archive_match(self, league: str, season: str, match: Match, detail: bytes) -> int:
+        """Store a completed match's summary and encoded detail. Return archive ID."""
+        result = match.result
+        team1_score = result.winner_score if result.winner == match.team1 else result.loser_score
+        team2_score = result.winner_score if result.winner == match.team2 else result.loser_score
+        
+        cursor = self.conn.execute("""
+            INSERT INTO match_archive (
+                league, season, match_date, team1, team2, winner,
+                team1_score, team2_score, duration, detail
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            league, season, match.match_date.isoformat(),
+            match.team1.name, match.team2.name, result.winner.name,
+            team1_score, team2_score, result.duration, detail
+        ))
+        self._commit()
+        return cursor.lastrowid
+    
+    @traced()
+    def load_match_detail(self, archive_id: int) -> Optional[bytes]:
+        """Get the encoded detail of an archived match."""
+        row = self.conn.execute(
+            "SELECT detail FROM match_archive WHERE id = ?", (archive_id,)
+        ).fetchone()
+        return row['detail'] if row else None
+    
+    @traced()
+    def get_archived_matches(self, league: str, season: str) -> List[Dict[str, Any]]:
+        """Get the summaries of a league's archived matches for a season, oldest first."""
+        rows = self.conn.execute("""
+            SELECT id, league, season, match_date, team1, team2, winner,
+                   team1_score, team2_score, duration
+            FROM match_archive
+            WHERE league = ? AND season = ?
+            ORDER BY match_date, id
+        """, (league, season)).fetchall()
+        return [dict(row) for row in rows]
+    
+    # Analytics queries
+    @traced()
+    def get_player_career_stats(self, player_id: int) -> Optional[Dict[str, Any]]:
+        """Get a player's career totals and KDA, summed over all seasons."""
+        row = self.conn.execute("""
+            SELECT
+                player_id,
+                COUNT(*) AS seasons,
+                SUM(matches_played) AS matches_played,
+                SUM(wins) AS wins,
+                SUM(kills) AS kills,
+                SUM(deaths) AS deaths,
+                SUM(assists) AS assists,
+                SUM(cs) AS cs,
+                SUM(damage_dealt) AS damage_dealt,
+                SUM(gold_earned) AS gold_earned,
+                ROUND(CAST(SUM(kills) + SUM(assists) AS REAL) / MAX(SUM(deaths), 1), 2) AS kda
+            FROM player_season_stats
+            WHERE player_id = ?
+            GROUP BY player_id
+        """, (player_id,)).fetchone()
+        return dict(row) if row else None
+    
+    @traced()
+    def get_player_season_stats(self, player_id: int) -> List[Dict[str, Any]]:
+        """Get a player's per-season lines in the order the seasons were first recorded."""
+        rows = self.conn.execute("""
+            SELECT
+                season, team_id, matches_played, wins, kills, deaths, assists,
+                cs, damage_dealt, gold_earned,
+                ROUND(CAST(kills + assists AS REAL) / MAX(deaths, 1), 2) AS kda
+            FROM player_season_stats
+            WHERE player_id = ?
+            ORDER BY rowid
+        """, (player_id,)).fetchall()
+        return [dict(row) for row in rows]
+    
+    @traced()
+    def get_head_to_head(self, team1_id: int, team2_id: int) -> Dict[str, int]:
+        """Get the all-time series and game record between two teams."""
+        row = self.conn.execute("""
+            SELECT
+                COUNT(*) AS matches_played,
+                COALESCE(SUM(winner_id = :t1), 0) AS team1_wins,
+                COALESCE(SUM(winner_id = :t2), 0) AS team2_wins,
+                COALESCE(SUM(CASE WHEN team1_id = :t1 THEN team1_score ELSE team2_score END), 0) AS team1_games,
+                COALESCE(SUM(CASE WHEN team1_id = :t2 THEN team1_score ELSE team2_score END), 0) AS team2_games
+            FROM matches
+            WHERE (team1_id = :t1 AND team2_id = :t2)
+               OR (team1_id = :t2 AND team2_id = :t1)
+        """, {'t1': team1_id, 't2': team2_id}).fetchone()
+        return dict(row)
+    
+    @traced()
+    def get_season_leaderboard(self, season: str, stat: str = 'kda',
+                               limit: int = 10, min_matches: int = 1) -> List[Dict[str, Any]]:
+        """Rank players in a season by a stat.
+        
+        Args:
+            season: Season label used when the matches were saved
+            stat: One of LEADERBOARD_STATS
+            limit: Maximum number of rows to return
+            min_matches: Minimum matches played to qualify
+        """
+        if stat not in self.LEADERBOARD_STATS:
+            raise ValueError(f"Unknown leaderboard stat: {stat}")
+        
+        # stat is validated above, so it is safe to interpolate
+        rows = self.conn.execute(f"""
+            SELECT
+                RANK() OVER (ORDER BY {stat} DESC) AS rank,
+                *
+            FROM (
+                SELECT
+                    s.player_id, p.name, p.role, s.team_id, s.matches_played,
+                    s.wins, s.kills, s.deaths, s.assists, s.cs,
+                    s.damage_dealt, s.gold_earned,
+                    ROUND(CAST(s.kills + s.assists AS REAL) / MAX(s.deaths, 1), 2) AS kda
+                FROM player_season_stats s
+                JOIN players p ON p.id = s.player_id
+                WHERE s.season = ? AND s.matches_played >= ?
+            )
+            ORDER BY rank, name
+            LIMIT ?
+        """, (season, min_matches, limit)).fetchall()
+        return [dict(row) for row in rows]
+    
+    @traced()
+    def get_team_season_standings(self, season: str) -> List[Dict[str, Any]]:
+        """Get season standings for every team with at least one saved match."""
+        rows = self.conn.execute("""
+            SELECT
+                RANK() OVER (
+                    ORDER BY s.wins DESC, s.games_won - s.games_lost DESC
+                ) AS rank,
+                s.team_id, t.name, s.matches_played, s.wins, s.losses,
+                s.games_won, s.games_lost,
+                s.games_won - s.games_lost AS game_diff
+            FROM team_season_stats s
+            JOIN teams t ON t.id = s.team_id
+            WHERE s.season = ?
+            ORDER BY rank, t.name
+        """, (season,)).fetchall()
+        return [dict(row) for row in rows]
+    
+    @traced()
+    def rebuild_summary_tables(self) -> None:
+        """Recompute the season summary tables from raw match data."""
+        with self.batch():
+            self.conn.execute("DELETE FROM player_season_stats")
+            self.conn.execute("DELETE FROM team_season_stats")
+            self.conn.execute("""
+                INSERT INTO player_season_stats (
+                    player_id, season, team_id, matches_played, wins, kills,
+                    deaths, assists, cs, damage_dealt, gold_earned
+                )
+                SELECT
+                    ps.player_id, m.season,
+                    -- team of the player's most recent match that season
+                    (SELECT ps2.team_id FROM player_match_stats ps2
+                     JOIN matches m2 ON m2.id = ps2.match_id
+                     WHERE ps2.player_id = ps.player_id AND m2.season = m.season
+                     ORDER BY m2.match_date DESC, m2.id DESC LIMIT 1),
+                    COUNT(*), SUM(ps.won), SUM(ps.kills), SUM(ps.deaths),
+                    SUM(ps.assists), SUM(ps.cs), SUM(ps.damage_dealt),
+                    SUM(ps.gold_earned)
+                FROM player_match_stats ps
+                JOIN matches m ON m.id = ps.match_id
+                WHERE m.season IS NOT NULL
+                GROUP BY ps.player_id, m.season
+                ORDER BY MIN(m.id)
+            """)
+            self.conn.execute("""
+                INSERT INTO team_season_stats (
+                    team_id, season, matches_played, wins, losses, games_won, games_lost
+                )
+                SELECT team_id, season, COUNT(*), SUM(won), SUM(1 - won),
+                       SUM(games_won), SUM(games_lost)
+                FROM (
+                    SELECT team1_id AS team_id, season, id,
+                           winner_id = team1_id AS won,
+                           team1_score AS games_won, team2_score AS games_lost
+                    FROM matches
+                    WHERE season IS NOT NULL
+                    UNION ALL
+                    SELECT team2_id, season, id, winner_id = team2_id,
+                           team2_score, team1_score
+                    FROM matches
+                    WHERE season IS NOT NULL
+                )
+                GROUP BY team_id, season
+                ORDER BY MIN(id)
+            """)
@@ -39,6 +39,7 @@ CREATE TABLE IF NOT EXISTS matches (
     team2_score INTEGER NOT NULL,
     match_date DATETIME NOT NULL,
     league_id INTEGER,
+    season TEXT,
     FOREIGN KEY (team1_id) REFERENCES teams(id),
     FOREIGN KEY (team2_id) REFERENCES teams(id),
     FOREIGN KEY (winner_id) REFERENCES teams(id),
@@ -63,3 +64,74 @@ CREATE TABLE IF NOT EXISTS league_teams (
     FOREIGN KEY (league_id) REFERENCES leagues(id),
     FOREIGN KEY (team_id) REFERENCES teams(id)
 );
+
+-- Per-player box score for each saved match (aggregated over the series)
+CREATE TABLE IF NOT EXISTS player_match_stats (
+    match_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    won BOOLEAN NOT NULL,
+    kills INTEGER NOT NULL DEFAULT 0,
+    deaths INTEGER NOT NULL DEFAULT 0,
+    assists INTEGER NOT NULL DEFAULT 0,
+    cs INTEGER NOT NULL DEFAULT 0,
+    vision_score INTEGER NOT NULL DEFAULT 0,
+    damage_dealt INTEGER NOT NULL DEFAULT 0,
+    gold_earned INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (match_id, player_id),
+    FOREIGN KEY (match_id) REFERENCES matches(id),
+    FOREIGN KEY (player_id) REFERENCES players(id),
+    FOREIGN KEY (team_id) REFERENCES teams(id)
+);
+
+-- Summary tables, maintained incrementally by DatabaseManager.save_match
+CREATE TABLE IF NOT EXISTS player_season_stats (
+    player_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    team_id INTEGER,
+    matches_played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    kills INTEGER NOT NULL DEFAULT 0,
+    deaths INTEGER NOT NULL DEFAULT 0,
+    assists INTEGER NOT NULL DEFAULT 0,
+    cs INTEGER NOT NULL DEFAULT 0,
+    damage_dealt INTEGER NOT NULL DEFAULT 0,
+    gold_earned INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_id, season),
+    FOREIGN KEY (player_id) REFERENCES players(id),
+    FOREIGN KEY (team_id) REFERENCES teams(id)
+);
+
+CREATE TABLE IF NOT EXISTS team_season_stats (
+    team_id INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    matches_played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    games_won INTEGER NOT NULL DEFAULT 0,
+    games_lost INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (team_id, season),
+    FOREIGN KEY (team_id) REFERENCES teams(id)
+);
+
+-- Completed matches whose full detail was moved out of memory; detail is
+-- the zlib-compressed JSON written by src/game/match_archive.py
+CREATE TABLE IF NOT EXISTS match_archive (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    league TEXT NOT NULL,
+    season TEXT NOT NULL,
+    match_date DATETIME NOT NULL,
+    team1 TEXT NOT NULL,
+    team2 TEXT NOT NULL,
+    winner TEXT NOT NULL,
+    team1_score INTEGER NOT NULL,
+    team2_score INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    detail BLOB NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_matches_teams ON matches (team1_id, team2_id);
+CREATE INDEX IF NOT EXISTS idx_matches_season ON matches (season);
+CREATE INDEX IF NOT EXISTS idx_player_season_stats_season ON player_season_stats (season);
+CREATE INDEX IF NOT EXISTS idx_team_season_stats_season ON team_season_stats (season);
+CREATE INDEX IF NOT EXISTS idx_match_archive_season ON match_archive (league, season);
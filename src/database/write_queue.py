@@ -0,0 +1,271 @@
+import copy
+import dataclasses
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.models.player import Player
+from src.models.team import Team
+from src.models.match import Match, TeamMatchStats
+from src.database.db_manager import DatabaseManager
+
+
+class _Snapshot:
+    """Detached copies of everything one queued save reads, paired with the originals.
+
+    Copies are taken on the caller's thread when the save is queued, so
+    the writer never reads objects the GUI thread may still be changing.
+    Database ids are the exception: the writer assigns them, so it copies
+    them onto the snapshot before writing (resolve_ids) and back onto the
+    originals afterwards (publish_ids).
+    """
+
+    def __init__(self):
+        self.teams: List[Tuple[Team, Team]] = []
+        self.players: List[Tuple[Player, Player]] = []
+        self._copies: Dict[int, object] = {}
+
+    def team(self, team: Optional[Team]) -> Optional[Team]:
+        if team is None:
+            return None
+        snapshot = self._copies.get(id(team))
+        if snapshot is None:
+            snapshot = self._copies[id(team)] = copy.copy(team)
+            snapshot.roster = {
+                role: [self.player(player) for player in players]
+                for role, players in team.roster.items()
+            }
+            self.teams.append((team, snapshot))
+        return snapshot
+
+    def player(self, player: Optional[Player]) -> Optional[Player]:
+        if player is None:
+            return None
+        snapshot = self._copies.get(id(player))
+        if snapshot is None:
+            snapshot = self._copies[id(player)] = copy.copy(player)
+            snapshot.stats = copy.copy(player.stats)
+            self.players.append((player, snapshot))
+        return snapshot
+
+    def match(self, match: Match) -> Match:
+        snapshot = copy.copy(match)
+        snapshot.team1 = self.team(match.team1)
+        snapshot.team2 = self.team(match.team2)
+        snapshot.draft_state = None
+        result = match.result
+        snapshot.result = dataclasses.replace(
+            result,
+            winner=self.team(result.winner),
+            loser=self.team(result.loser),
+            winner_stats=self._stats(result.winner_stats),
+            loser_stats=self._stats(result.loser_stats),
+            events=[],
+            mvp=self.player(result.mvp)
+        )
+        return snapshot
+
+    def _stats(self, stats: Optional[TeamMatchStats]) -> Optional[TeamMatchStats]:
+        if stats is None:
+            return None
+        return dataclasses.replace(
+            stats,
+            team=self.team(stats.team),
+            player_stats={
+                self.player(player): copy.copy(player_stats)
+                for player, player_stats in stats.player_stats.items()
+            }
+        )
+
+    def resolve_ids(self) -> None:
+        """Pick up ids the writer gave the originals after this snapshot was taken."""
+        for team, snapshot in self.teams:
+            if snapshot.team_id is None:
+                snapshot.team_id = team.team_id
+        for player, snapshot in self.players:
+            if snapshot.player_id is None:
+                snapshot.player_id = player.player_id
+
+    def publish_ids(self) -> None:
+        """Copy the ids assigned while writing back onto the originals."""
+        for team, snapshot in self.teams:
+            team.team_id = snapshot.team_id
+        for player, snapshot in self.players:
+            player.player_id = snapshot.player_id
+            player.team_id = snapshot.team_id
+
+
+class WriteBehindQueue:
+    """Persist teams, players and matches on a background writer thread.
+
+    Save calls only enqueue the object and return immediately. The writer
+    thread owns its own DatabaseManager (and therefore its own sqlite
+    connection), drains everything that is pending, keeps only the latest
+    request per object and writes the whole batch in one transaction.
+
+    Objects are copied when they are queued, so the writer never reads
+    objects the caller may still be changing; repeated saves of the same
+    team between batches still cost a single write of the latest copy.
+    Teams and players are upserted by id, so later saves update their rows.
+    The ids the writer assigns are set on the queued objects once written.
+    """
+
+    # Write order inside a batch: matches reference team ids assigned by
+    # save_team, so teams must land first.
+    _KINDS = ('team', 'player', 'match')
+    _STOP = object()
+
+    def __init__(self, db_path: str = "data/game.db", batch_delay: float = 0.05):
+        """Start the writer thread.
+
+        Args:
+            db_path: Database file the writer connection opens
+            batch_delay: Seconds the writer waits after the first pending
+                write so that bursts (e.g. a simulated week) share a batch
+        """
+        self.db_path = db_path
+        self.batch_delay = batch_delay
+        self.batches_written = 0
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._errors: List[Exception] = []
+        self._errors_lock = threading.Lock()
+        self._closed = False
+        self._ready = threading.Event()
+        self._setup_error: Optional[Exception] = None
+
+        self._thread = threading.Thread(
+            target=self._run, name="db-writer", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._setup_error is not None:
+            self._thread.join()
+            raise self._setup_error
+
+    # Producer API (safe to call from the GUI thread)
+    def save_team(self, team: Team) -> None:
+        """Queue a team (and its roster) for saving."""
+        snapshot = _Snapshot()
+        self._put('team', team, (snapshot, snapshot.team(team)))
+
+    def save_player(self, player: Player) -> None:
+        """Queue a single player for saving."""
+        snapshot = _Snapshot()
+        self._put('player', player, (snapshot, snapshot.player(player)))
+
+    def save_match(self, match: Match, season: Optional[str] = None) -> None:
+        """Queue a completed match for saving."""
+        if not match.result:
+            raise ValueError("Cannot save match without result")
+        snapshot = _Snapshot()
+        self._put('match', match, (snapshot, snapshot.match(match), season))
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued operations not yet picked up."""
+        return self._queue.qsize()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until everything queued before this call is on disk.
+
+        Raises:
+            TimeoutError: If the writer did not catch up within timeout
+            Exception: The first error hit by the writer since the last flush
+        """
+        if self._closed:
+            raise RuntimeError("Write queue is closed")
+
+        barrier = threading.Event()
+        self._queue.put(('barrier', barrier))
+        if not barrier.wait(timeout):
+            raise TimeoutError("Timed out waiting for pending writes")
+        self._raise_errors()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush pending writes and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._raise_errors()
+
+    def _put(self, kind: str, original, snapshot: Tuple) -> None:
+        if self._closed:
+            raise RuntimeError("Write queue is closed")
+        self._queue.put((kind, id(original), snapshot))
+
+    def _raise_errors(self) -> None:
+        with self._errors_lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    # Writer thread
+    def _run(self) -> None:
+        try:
+            db = DatabaseManager(self.db_path)
+        except Exception as e:
+            self._setup_error = e
+            return
+        finally:
+            self._ready.set()
+        try:
+            stopping = False
+            while not stopping:
+                ops = [self._queue.get()]
+                if ops[0] is not self._STOP and self.batch_delay:
+                    # Give a burst of saves time to arrive before writing
+                    time.sleep(self.batch_delay)
+
+                # Drain whatever else is already queued
+                while True:
+                    try:
+                        ops.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                pending: Dict[str, Dict[int, Tuple]] = {kind: {} for kind in self._KINDS}
+                barriers: List[threading.Event] = []
+                for op in ops:
+                    if op is self._STOP:
+                        stopping = True
+                        continue
+                    if op[0] == 'barrier':
+                        barriers.append(op[1])
+                    else:
+                        # Coalesce: later saves of the same object replace earlier ones
+                        kind, key, snapshot = op
+                        pending[kind][key] = snapshot
+
+                self._write_batch(db, pending)
+                for barrier in barriers:
+                    barrier.set()
+        finally:
+            db.close()
+
+    def _write_batch(self, db: DatabaseManager, pending: Dict[str, Dict[int, Tuple]]) -> None:
+        """Write one coalesced batch in a single transaction."""
+        if not any(pending.values()):
+            return
+
+        try:
+            with db.batch():
+                for snapshot, team in pending['team'].values():
+                    snapshot.resolve_ids()
+                    db.save_team(team)
+                    snapshot.publish_ids()
+                for snapshot, player in pending['player'].values():
+                    snapshot.resolve_ids()
+                    db.save_player(player)
+                    snapshot.publish_ids()
+                for snapshot, match, season in pending['match'].values():
+                    # Teams saved earlier in this batch have their ids by now
+                    snapshot.resolve_ids()
+                    db.save_match(match, season)
+            self.batches_written += 1
+        except Exception as e:
+            with self._errors_lock:
+                self._errors.append(e)
@@ -1,15 +1,43 @@
+import os
+import re
+import threading
+import weakref
 from datetime import datetime, date
-from typing import Dict, List, Optional
+from enum import Enum
+from typing import Callable, Dict, List, Optional
 from src.models.team import Team
 from src.models.player import Player, Role
 from src.models.match import Match, MatchResult
 from src.models.league import League, Split, SeasonPhase
 from src.models.tournament import Tournament
 from src.database.db_manager import DatabaseManager
+from src.database.write_queue import WriteBehindQueue
+from src.game.match_archive import MatchArchive
+from src.utils.tracing import span, traced
+
+# Each new game gets its own save database here
+SAVES_DIR = "data/saves"
+
+class GameChange(Enum):
+    """Kinds of game state change that listeners are told about."""
+    ROSTER = "roster"  # The player's team or its players changed
+    RESULTS = "results"  # Matches were played: standings, form and schedule moved
+    FINANCES = "finances"  # Budget, income, costs or facilities changed
+
 
 class GameState:
     def __init__(self):
-        self.db_manager = None  # Will be set when database is ready
+        self.db_manager = None  # The save database, opened by open_save
+        self.write_queue: Optional[WriteBehindQueue] = None  # Saves teams and matches in the background
+        # Played matches already queued for the save database
+        self._saved_matches: "weakref.WeakSet[Match]" = weakref.WeakSet()
+        
+        # Held while a worker thread simulates; the GUI must not read or
+        # change the state until it is released
+        self.simulation_lock = threading.Lock()
+        
+        # Called as listener(change) for every GameChange notified
+        self._listeners: List[Callable[[GameChange], None]] = []
         
         # Core game data
         self.current_team: Optional[Team] = None
@@ -21,6 +49,10 @@ class GameState:
         self.league: Optional[League] = None  # Player's league
         self.other_leagues: Dict[str, League] = {}  # Other leagues
         
+        # Holds the detail of old matches in the save database (in memory
+        # while no save is open); opened on first use by apply_retention
+        self.match_archive: Optional[MatchArchive] = None
+        
         # League data
         self.standings: Dict[str, Dict] = {}  # team_name -> {wins, losses, points}
         self.schedule: List[Match] = []
@@ -81,6 +113,28 @@ class GameState:
             
             # Calculate financial data
             self.calculate_finances()
+            self.notify(GameChange.ROSTER, GameChange.RESULTS)
+    
+    def subscribe(self, listener: Callable[[GameChange], None]) -> None:
+        """Call listener(change) whenever part of the game state changes."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def unsubscribe(self, listener: Callable[[GameChange], None]) -> None:
+        """Stop calling listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def notify(self, *changes: GameChange) -> None:
+        """Tell every listener about changes.
+        
+        Listeners are called on the thread making the change. Code that
+        changes the game state on a worker thread should notify once the
+        results are handed back to the GUI thread instead.
+        """
+        for change in changes:
+            for listener in list(self._listeners):
+                listener(change)
     
     def calculate_finances(self) -> None:
         """Calculate current financial status."""
@@ -98,6 +152,7 @@ class GameState:
         fanbase = self.current_team.fanbase
         self.sponsorship_income = fanbase * 0.1  # $0.10 per fan per month
         self.merchandise_revenue = fanbase * 0.05  # $0.05 per fan per month
+        self.notify(GameChange.FINANCES)
     
     def get_team_performance(self) -> Dict[str, float]:
         """Calculate team's current performance metrics."""
@@ -220,6 +275,7 @@ class GameState:
         tournament = Tournament(name, participating_leagues, start_date)
         self.scheduled_tournaments.append(tournament)
         
+    @traced()
     def update_tournaments(self) -> None:
         """Update tournament states and progress."""
         current_date = self.current_date
@@ -260,6 +316,7 @@ class GameState:
                     self.award_tournament_rewards()
                     self.current_tournament = None
 
+    @traced()
     def award_tournament_rewards(self) -> None:
         """Award prizes and championship points for tournament performance."""
         if not self.current_tournament or self.current_tournament.current_phase != "Finished":
@@ -319,8 +376,25 @@ class GameState:
         for match in quarter_finals:
             match.result.loser.budget += prize_pool * prize_distribution["quarter_finalist"]
 
-    def simulate_all_leagues(self) -> Dict[str, Dict[str, List[MatchResult]]]:
-        """Simulate matches for all leagues and tournaments."""
+    @property
+    def simulating(self) -> bool:
+        """Whether a worker thread holds the state for a simulation."""
+        return self.simulation_lock.locked()
+    
+    @traced()
+    def simulate_all_leagues(
+        self,
+        on_league: Optional[Callable[[str, Dict[str, List[MatchResult]], int, int], None]] = None
+    ) -> Dict[str, Dict[str, List[MatchResult]]]:
+        """Simulate matches for all leagues and tournaments.
+        
+        Every league plays the whole week, so the leagues stay in step;
+        a caller that wants to stop early does so between calls.
+        
+        Args:
+            on_league: Called as on_league(name, results, done, total) after
+                each league has been simulated
+        """
         all_results = {}
         
         # First check if any leagues need to start playoffs
@@ -333,32 +407,92 @@ class GameState:
                 if league.is_regular_season_finished():
                     league.start_playoffs()
         
-        # Then simulate matches for all leagues
-        if self.league:
-            if self.league.current_season.phase == SeasonPhase.REGULAR_SEASON:
-                all_results[self.league.name] = self.league.simulate_week(player_team=self.current_team)
-            elif self.league.current_season.phase == SeasonPhase.PLAYOFFS:
-                playoffs_complete = self.league.simulate_playoff_round()
-                playoff_div = self.league.divisions.get("Playoffs")
-                if playoff_div:
-                    all_results[self.league.name] = {"Playoffs": [m.result for m in playoff_div.matches if m.result]}
-            
-        # Simulate other leagues
-        for league_name, league in self.other_leagues.items():
-            if league.current_season.phase == SeasonPhase.REGULAR_SEASON:
-                all_results[league_name] = league.simulate_week()
-            elif league.current_season.phase == SeasonPhase.PLAYOFFS:
-                playoffs_complete = league.simulate_playoff_round()
-                playoff_div = league.divisions.get("Playoffs")
-                if playoff_div:
-                    all_results[league_name] = {"Playoffs": [m.result for m in playoff_div.matches if m.result]}
+        # Then simulate matches for all leagues, skipping the player's own matches
+        leagues = [(self.league, self.current_team)] if self.league else []
+        leagues += [(league, None) for league in self.other_leagues.values()]
+        for done, (league, player_team) in enumerate(leagues, 1):
+            with span("league", league=league.name):
+                if league.current_season.phase == SeasonPhase.REGULAR_SEASON:
+                    all_results[league.name] = league.simulate_week(player_team=player_team)
+                elif league.current_season.phase == SeasonPhase.PLAYOFFS:
+                    league.simulate_playoff_round()
+                    playoff_div = league.divisions.get("Playoffs")
+                    if playoff_div:
+                        all_results[league.name] = {"Playoffs": [m.result for m in playoff_div.matches if m.result]}
                     
+            if on_league and league.name in all_results:
+                on_league(league.name, all_results[league.name], done, len(leagues))
+                
         # Update tournaments
         self.update_tournaments()  # Check if any tournaments should start
         if self.current_tournament:
             self.update_tournaments()
             
+        self.apply_retention()
+        self.autosave()
         return all_results
+    
+    def open_save(self, path: str) -> None:
+        """Open (or create) the save database at path and save the game to it as it is played."""
+        self.close_save()
+        # The simulation worker and the GUI thread take turns with this connection
+        self.db_manager = DatabaseManager(path, check_same_thread=False)
+        self.write_queue = WriteBehindQueue(path)
+        # A new save has none of the matches played so far
+        self._saved_matches = weakref.WeakSet()
+    
+    def close_save(self) -> None:
+        """Write everything still queued and close the save database."""
+        if self.write_queue:
+            self.write_queue.close()
+            self.write_queue = None
+        if self.db_manager:
+            self.db_manager.close()
+            self.db_manager = None
+        # The next archive follows the next save; matches archived so far
+        # keep a reference to the archive that holds their detail
+        self.match_archive = None
+    
+    def autosave(self) -> None:
+        """Queue a save of every team and of the matches played since the last save.
+        
+        Team rows saved before are updated in place; each match is saved
+        once, under its league's current season.
+        """
+        if not self.write_queue:
+            return
+        leagues = ([self.league] if self.league else []) + list(self.other_leagues.values())
+        for league in leagues:
+            for team in league.get_all_teams():
+                self.write_queue.save_team(team)
+            
+            season = league.current_season
+            if not season:
+                continue
+            label = f"{season.split.value} {season.year}"
+            for division in league.divisions.values():
+                for match in division.matches:
+                    if match.result and match not in self._saved_matches:
+                        self.write_queue.save_match(match, label)
+                        self._saved_matches.add(match)
+    
+    @traced()
+    def apply_retention(self) -> int:
+        """Move the detail of matches past the retention window into the match archive.
+        
+        The archive lives in the save database, so archived detail is kept
+        with the game. Without a save it is held compressed in memory.
+        
+        Returns:
+            int: Number of matches archived
+        """
+        if self.match_archive is None:
+            if self.db_manager is not None:
+                self.match_archive = MatchArchive(self.db_manager)
+            else:
+                self.match_archive = MatchArchive(DatabaseManager(":memory:", check_same_thread=False))
+        leagues = ([self.league] if self.league else []) + list(self.other_leagues.values())
+        return sum(self.match_archive.apply(league) for league in leagues)
 
     def get_league_position(self) -> str:
         """Get current team's position in the league."""
@@ -418,3 +552,10 @@ class GameState:
             
         wins = sum(1 for m in matches if m.result.winner == self.current_team)
         return (wins / len(matches)) * 100
+
+
+def new_save_path(team_name: str, now: Optional[datetime] = None) -> str:
+    """Path for a new game's save database, named after the player's team."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", team_name).strip("_") or "game"
+    stamp = (now or datetime.now()).strftime("%Y%m%d-%H%M%S")
+    return os.path.join(SAVES_DIR, f"{slug}-{stamp}.db")
@@ -0,0 +1,259 @@
+"""Bounded retention for played matches.
+
+A played match holds its draft, every game's play-by-play and a box score
+per player. MatchArchive moves that detail into a database once a match
+is older than RETAINED_WEEKS weeks of the regular season, or once its
+season is over. Only a summary stays in memory: the match keeps its teams
+and date, and its result keeps the winner, loser, score, duration and
+MVP, which is all standings and results lists need. Match.detailed()
+loads the rest back for a screen that wants to show it.
+
+The detail is stored as zlib-compressed JSON that refers to teams by
+their side in the match and to players by name. Nothing in it pins any
+objects, and it can be read back after a roster change.
+"""
+import json
+import zlib
+from datetime import date
+from typing import Dict, List, Optional
+
+from src.database.db_manager import DatabaseManager
+from src.models.draft import DraftBan, DraftPick, DraftPlayer, DraftState
+from src.models.league import League, SeasonPhase
+from src.models.match import (DragonState, DragonType, EventType, Match, MatchEvent, MatchResult,
+                              PlayerMatchStats, TeamFightResult, TeamMatchStats)
+from src.models.player import Player, PlayerStats, Role
+from src.models.team import Team
+
+# Played regular season matches from this many most recent weeks keep their detail in memory
+RETAINED_WEEKS = 2
+
+_TEAM_TOTALS = ('kills', 'deaths', 'towers', 'inhibitors', 'barons', 'dragons', 'total_gold')
+_PLAYER_TOTALS = ('kills', 'deaths', 'assists', 'cs', 'vision_score', 'damage_dealt', 'gold_earned')
+_DRAGON_STACKS = ('infernal_stacks', 'ocean_stacks', 'mountain_stacks', 'cloud_stacks', 'has_elder')
+
+
+class _References:
+    """Converts one match's teams and players to plain JSON values and back."""
+
+    def __init__(self, match: Match):
+        self.teams = (match.team1, match.team2)
+        self.players: Dict[str, Player] = {}
+        for team in reversed(self.teams):
+            self.players.update((player.name, player) for player in team.players)
+
+    def team_ref(self, team: Optional[Team]) -> Optional[int]:
+        if team is None:
+            return None
+        return 0 if team is self.teams[0] else 1
+
+    def team(self, ref: Optional[int]) -> Optional[Team]:
+        return None if ref is None else self.teams[ref]
+
+    @staticmethod
+    def player_ref(player: Optional[Player]) -> Optional[list]:
+        return None if player is None else [player.name, player.role.value]
+
+    def player(self, ref: Optional[list]) -> Optional[Player]:
+        if ref is None:
+            return None
+        name, role = ref
+        player = self.players.get(name)
+        if player is None:
+            # Left both teams since the match; keep their name on the record
+            player = Player(name, Role(role), PlayerStats(1, 1, 1, 1), "", 0, date.min)
+            self.players[name] = player
+        return player
+
+
+def encode_detail(match: Match) -> bytes:
+    """The detail a summary leaves out: events, box scores and the draft."""
+    refs = _References(match)
+    result = match.result
+
+    def fight(f: Optional[TeamFightResult]):
+        if f is None:
+            return None
+        multi_player, multi_type = f.multi_kill if f.multi_kill else (None, None)
+        return [refs.team_ref(f.winner), refs.team_ref(f.loser), f.winner_kills, f.loser_kills,
+                f.location, f.objective_secured, refs.player_ref(f.mvp_player),
+                refs.player_ref(multi_player), multi_type.name if multi_type else None]
+
+    def stats(team_stats: TeamMatchStats):
+        dragons = team_stats.dragon_state
+        return {
+            "team": refs.team_ref(team_stats.team),
+            "totals": [getattr(team_stats, name) for name in _TEAM_TOTALS],
+            "dragons": [getattr(dragons, name) for name in _DRAGON_STACKS]
+                       + [dragons.dragon_soul.name if dragons.dragon_soul else None],
+            "players": [
+                [refs.player_ref(player)] + [getattr(player_stats, name) for name in _PLAYER_TOTALS]
+                for player, player_stats in team_stats.player_stats.items()
+            ],
+        }
+
+    detail = {
+        "events": [
+            [e.type.name, e.time, e.description, refs.player_ref(e.player), refs.team_ref(e.team),
+             fight(e.fight_result)]
+            for e in result.events
+        ],
+        "stats": [stats(result.winner_stats), stats(result.loser_stats)],
+        "draft": None,
+    }
+    draft = match.draft_state
+    if draft:
+        detail["draft"] = {
+            "blue": refs.team_ref(draft.blue_team),
+            "bans": [[b.champion.name, refs.team_ref(b.team), b.ban_number] for b in draft.bans],
+            "picks": [
+                [p.champion.name, refs.team_ref(p.team), p.pick_number, p.player.role.value,
+                 refs.player_ref(p.player) if isinstance(p.player, Player) else None]
+                for p in draft.picks
+            ],
+        }
+    return zlib.compress(json.dumps(detail, separators=(',', ':')).encode())
+
+
+def decode_detail(summary: Match, data: bytes) -> Match:
+    """A new Match with summary's teams and result, plus the detail in data."""
+    detail = json.loads(zlib.decompress(data))
+    refs = _References(summary)
+
+    def fight(f) -> Optional[TeamFightResult]:
+        if f is None:
+            return None
+        winner, loser, winner_kills, loser_kills, location, objective, mvp, multi_player, multi_type = f
+        return TeamFightResult(
+            winner=refs.team(winner), loser=refs.team(loser),
+            winner_kills=winner_kills, loser_kills=loser_kills, location=location,
+            objective_secured=objective, mvp_player=refs.player(mvp),
+            multi_kill=(refs.player(multi_player), EventType[multi_type]) if multi_type else None
+        )
+
+    def stats(data) -> TeamMatchStats:
+        team_stats = TeamMatchStats(team=refs.team(data["team"]))
+        for name, value in zip(_TEAM_TOTALS, data["totals"]):
+            setattr(team_stats, name, value)
+        *stacks, soul = data["dragons"]
+        team_stats.dragon_state = DragonState(*stacks, dragon_soul=DragonType[soul] if soul else None)
+        for player_ref, *totals in data["players"]:
+            player = refs.player(player_ref)
+            player_stats = team_stats.player_stats.get(player)
+            if player_stats is None:
+                player_stats = team_stats.player_stats[player] = PlayerMatchStats(player=player)
+            for name, value in zip(_PLAYER_TOTALS, totals):
+                setattr(player_stats, name, value)
+        return team_stats
+
+    summary_result = summary.result
+    match = Match(summary.team1, summary.team2, summary.match_date)
+    winner_stats, loser_stats = (stats(data) for data in detail["stats"])
+    match.result = MatchResult(
+        winner=summary_result.winner,
+        loser=summary_result.loser,
+        winner_score=summary_result.winner_score,
+        loser_score=summary_result.loser_score,
+        match_date=summary_result.match_date,
+        duration=summary_result.duration,
+        winner_stats=winner_stats,
+        loser_stats=loser_stats,
+        events=[
+            MatchEvent(type=EventType[event_type], time=time, description=description,
+                       player=refs.player(player), team=refs.team(team), fight_result=fight(f))
+            for event_type, time, description, player, team, f in detail["events"]
+        ],
+        mvp=summary_result.mvp
+    )
+
+    draft = detail["draft"]
+    if draft:
+        blue = refs.team(draft["blue"])
+        state = DraftState(blue_team=blue, red_team=refs.team(1 - draft["blue"]))
+        registry = state.registry
+        for name, team, number in draft["bans"]:
+            champion = registry.get(name)
+            state.bans.append(DraftBan(champion=champion, team=refs.team(team), ban_number=number))
+            state.banned_mask |= registry.bit(champion)
+        for name, team, number, role, player in draft["picks"]:
+            champion = registry.get(name)
+            state.picks.append(DraftPick(
+                champion=champion, team=refs.team(team),
+                player=refs.player(player) if player else DraftPlayer(role=Role(role)),
+                pick_number=number
+            ))
+            state.picked_mask |= registry.bit(champion)
+        state.current_turn = len(state.picks) + len(state.bans)
+        match.draft_state = state
+    return match
+
+
+class MatchArchive:
+    """Moves the detail of old matches into a database and loads it back on demand."""
+
+    def __init__(self, db_manager: DatabaseManager, retained_weeks: int = RETAINED_WEEKS):
+        self.db_manager = db_manager
+        self.retained_weeks = retained_weeks
+
+    def archive(self, match: Match, league: str, season: str) -> None:
+        """Store a played match's detail and cut the match down to its summary."""
+        if match.is_archived or not match.result:
+            return
+        match.archive_id = self.db_manager.archive_match(league, season, match, encode_detail(match))
+        result = match.result
+        match.result = MatchResult(
+            winner=result.winner,
+            loser=result.loser,
+            winner_score=result.winner_score,
+            loser_score=result.loser_score,
+            match_date=result.match_date,
+            duration=result.duration,
+            winner_stats=None,
+            loser_stats=None,
+            events=[],
+            mvp=result.mvp
+        )
+        match.draft_state = None
+        match.archive = self
+
+    def rehydrate(self, match: Match) -> Match:
+        """A new Match with the full detail of an archived match."""
+        data = self.db_manager.load_match_detail(match.archive_id)
+        if data is None:
+            raise ValueError(f"Match {match} is not in the archive")
+        return decode_detail(match, data)
+
+    def apply(self, league: League) -> int:
+        """Archive a league's played matches that are past the retention window.
+
+        Regular season matches are kept for the most recent
+        retained_weeks weeks. Once the season is over, every match goes.
+
+        Returns:
+            int: Number of matches archived
+        """
+        season = league.current_season
+        if not season:
+            return 0
+
+        finished = season.phase == SeasonPhase.OFF_SEASON
+        stale: List[Match] = []
+        for name, division in league.divisions.items():
+            if finished:
+                stale.extend(division.matches)
+            elif name == "Regular Season":
+                # Weeks are counted the way League.get_matches_for_week slices them
+                matches_per_week = len(division.teams) // 2 * 2
+                cutoff = (season.current_week - self.retained_weeks) * matches_per_week
+                stale.extend(division.matches[:max(0, cutoff)])
+
+        stale = [match for match in stale if match.result and not match.is_archived]
+        if stale:
+            label = f"{season.split.value} {season.year}"
+            with self.db_manager.batch():
+                for match in stale:
+                    self.archive(match, league.name, label)
+        return len(stale)
+
+    def close(self) -> None:
+        self.db_manager.close()
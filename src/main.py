@@ -1,9 +1,18 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-from src.ui.main_window import MainWindow
+from src.utils.startup_profiler import StartupProfiler
+from src.utils.tracing import finish_tracing, start_tracing_from_environment
 
 
 def main():
+    # Started before anything heavy is imported so the imports get timed
+    profiler = StartupProfiler.from_environment(sys.argv)
+    start_tracing_from_environment()
+    
+    from PyQt6.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+    if profiler:
+        profiler.mark("imports done")
+    
     # Create the application
     app = QApplication(sys.argv)
     
@@ -13,9 +22,18 @@ def main():
     # Create and show the main window
     window = MainWindow()
     window.show()
+    if profiler:
+        profiler.mark("main window shown")
+        
+        def on_first_paint():
+            profiler.mark("first paint")
+            profiler.finish()
+        window.first_painted.connect(on_first_paint)
     
     # Start the event loop
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    finish_tracing()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
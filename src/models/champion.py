@@ -1,11 +1,84 @@
-from dataclasses import dataclass, field
-from typing import List, Set
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from src.models.player import Role
 
-@dataclass
+@dataclass(frozen=True)
 class Champion:
-    """Represents a champion in the game."""
+    """Represents a champion in the game.
+
+    Champions are immutable and shared by every draft through the
+    ChampionRegistry; whether one is banned or picked is tracked per draft.
+    """
     name: str
-    roles: Set[Role]
-    banned: bool = False
-    picked: bool = False
+    roles: FrozenSet[Role]
+    champion_id: int = -1
+
+
+class ChampionRegistry:
+    """Immutable set of champions with integer ids and precomputed bitmasks.
+
+    Champion ids are assigned in alphabetical order, so bit i of a mask is
+    the i-th champion by name and iterating a mask yields sorted results.
+    """
+
+    def __init__(self, champions: Iterable[Tuple[str, Iterable[Role]]]):
+        entries = sorted(champions, key=lambda entry: entry[0])
+        self.champions: Tuple[Champion, ...] = tuple(
+            Champion(name=name, roles=frozenset(roles), champion_id=i)
+            for i, (name, roles) in enumerate(entries)
+        )
+        self.by_name: Dict[str, Champion] = {c.name: c for c in self.champions}
+        self.all_mask = (1 << len(self.champions)) - 1
+        self.role_masks: Dict[Role, int] = {role: 0 for role in Role}
+        for champion in self.champions:
+            for role in champion.roles:
+                self.role_masks[role] |= 1 << champion.champion_id
+        self._lower_names = tuple(c.name.lower() for c in self.champions)
+
+    def __len__(self) -> int:
+        return len(self.champions)
+
+    def __iter__(self) -> Iterator[Champion]:
+        return iter(self.champions)
+
+    def __contains__(self, champion: Champion) -> bool:
+        return (isinstance(champion, Champion)
+                and 0 <= champion.champion_id < len(self.champions)
+                and self.champions[champion.champion_id] is champion)
+
+    def get(self, name: str) -> Optional[Champion]:
+        """Look up a champion by exact name."""
+        return self.by_name.get(name)
+
+    def bit(self, champion: Champion) -> int:
+        """Get the single-bit mask for a champion."""
+        return 1 << champion.champion_id
+
+    def mask_of(self, champions: Iterable[Champion]) -> int:
+        """Build a mask from a collection of champions."""
+        mask = 0
+        for champion in champions:
+            mask |= 1 << champion.champion_id
+        return mask
+
+    def text_mask(self, filter_text: str) -> int:
+        """Mask of champions whose name contains filter_text (case-insensitive)."""
+        return self._text_mask(filter_text.lower())
+
+    @lru_cache(maxsize=256)
+    def _text_mask(self, text: str) -> int:
+        mask = 0
+        for i, name in enumerate(self._lower_names):
+            if text in name:
+                mask |= 1 << i
+        return mask
+
+    def champions_in(self, mask: int) -> List[Champion]:
+        """Get the champions whose bits are set in mask, sorted by name."""
+        champions = []
+        while mask:
+            low_bit = mask & -mask
+            champions.append(self.champions[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return champions
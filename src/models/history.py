@@ -0,0 +1,227 @@
+"""Compact, append-only season history.
+
+History only grows: every team and league gains a season each split for
+as long as the game runs. Each finished season is stored as one
+fixed-width struct record appended to a bytearray, 14 bytes for a team
+and 18 for a league. Teams in league records are ids from the shared
+TeamRegistry, not references, so history keeps no Team alive. Records are
+read back as named tuples.
+
+Records are appended in season order, so year range queries use a binary
+search instead of a scan.
+"""
+import struct
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .league import Season
+    from .team import Team
+
+# Split.value for each split code stored in a record
+SPLITS = ("Spring", "Summer")
+_NO_SPLIT = 0xFF
+
+# Team id stored where a record has no team
+NO_TEAM = 0xFFFF
+
+# Playoff seeds kept per league season
+PLAYOFF_SLOTS = 6
+
+
+class TeamRegistry:
+    """Small integer ids for teams, assigned by name on first use."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.regions: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id_of(self, team: Optional['Team']) -> int:
+        """The team's id, or NO_TEAM for None."""
+        if team is None:
+            return NO_TEAM
+        team_id = self._ids.get(team.name)
+        if team_id is None:
+            if len(self.names) >= NO_TEAM:
+                raise OverflowError("Too many teams for 16-bit team ids")
+            team_id = self._ids[team.name] = len(self.names)
+            self.names.append(team.name)
+            self.regions.append(team.region)
+        return team_id
+
+    def name(self, team_id: int) -> Optional[str]:
+        return None if team_id == NO_TEAM else self.names[team_id]
+
+    def region(self, team_id: int) -> Optional[str]:
+        return None if team_id == NO_TEAM else self.regions[team_id]
+
+
+_registry = None
+
+
+def get_team_registry() -> TeamRegistry:
+    """Get the shared team registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = TeamRegistry()
+    return _registry
+
+
+def _split_code(season: Optional['Season']) -> int:
+    if season is None or season.split.value not in SPLITS:
+        return _NO_SPLIT
+    return SPLITS.index(season.split.value)
+
+
+def _split_name(code: int) -> str:
+    return "" if code == _NO_SPLIT else SPLITS[code]
+
+
+class _SeasonArchive:
+    """Fixed-width records in a bytearray, oldest first.
+
+    Every record format starts with the year as an unsigned short.
+    """
+
+    __slots__ = ('_data',)
+    _format: struct.Struct
+    _year = struct.Struct('<H')
+
+    def __init__(self):
+        self._data = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._data) // self._format.size
+
+    def __iter__(self) -> Iterator:
+        for index in range(len(self)):
+            yield self._record(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("season index out of range")
+        return self._record(index)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the records."""
+        return len(self._data)
+
+    def last(self, count: int) -> List:
+        """The most recent count seasons, oldest first."""
+        return self[max(0, len(self) - count):]
+
+    def between(self, first_year: int, last_year: int) -> List:
+        """Seasons played from first_year to last_year inclusive, oldest first."""
+        return self[self._first_index(first_year):self._first_index(last_year + 1)]
+
+    def _first_index(self, year: int) -> int:
+        """Index of the first record from year or later."""
+        low, high = 0, len(self)
+        size = self._format.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._year.unpack_from(self._data, middle * size)[0] < year:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _append(self, *fields) -> None:
+        self._data += self._format.pack(*fields)
+
+    def _unpack(self, index: int) -> Tuple:
+        return self._format.unpack_from(self._data, index * self._format.size)
+
+    def _record(self, index: int):
+        raise NotImplementedError
+
+
+class TeamSeason(NamedTuple):
+    year: int
+    split: str
+    wins: int
+    losses: int
+    points: int
+    game_diff: int
+
+
+class TeamHistory(_SeasonArchive):
+    """A team's record in each season it played."""
+
+    __slots__ = ()
+    # year, split, wins, losses, championship points, game differential
+    _format = struct.Struct('<HBxHHih')
+
+    def append(self, season: Optional['Season'], wins: int, losses: int,
+               points: int, game_diff: int) -> None:
+        """Record a finished season; year 0 and no split when season is not known."""
+        year = season.year if season else 0
+        self._append(year, _split_code(season), wins, losses, points, game_diff)
+
+    def _record(self, index: int) -> TeamSeason:
+        year, split, wins, losses, points, game_diff = self._unpack(index)
+        return TeamSeason(year, _split_name(split), wins, losses, points, game_diff)
+
+
+class LeagueSeason(NamedTuple):
+    year: int
+    split: str
+    champion: Optional[str]
+    playoff_teams: Tuple[str, ...]  # Team names by seed
+
+
+class LeagueHistory(_SeasonArchive):
+    """A league's finished seasons: champion and playoff seeds."""
+
+    __slots__ = ()
+    # year, split, champion id, playoff team ids by seed (NO_TEAM when empty)
+    _format = struct.Struct(f'<HBxH{PLAYOFF_SLOTS}H')
+    _team_id = struct.Struct('<H')
+
+    def append(self, season: 'Season') -> None:
+        registry = get_team_registry()
+        seeds = [registry.id_of(team) for team in season.playoff_teams[:PLAYOFF_SLOTS]]
+        seeds += [NO_TEAM] * (PLAYOFF_SLOTS - len(seeds))
+        self._append(season.year, _split_code(season), registry.id_of(season.champion), *seeds)
+
+    def titles(self, team: Optional['Team'] = None) -> List[LeagueSeason]:
+        """Seasons that ended with a champion, or only those won by team."""
+        wanted = None if team is None else get_team_registry().id_of(team)
+        return [
+            self._record(index)
+            for index, champion in self._champions()
+            if champion != NO_TEAM and (wanted is None or champion == wanted)
+        ]
+
+    def _champions(self) -> Iterator[Tuple[int, int]]:
+        """(index, champion id) of every record, read without unpacking the rest."""
+        size = self._format.size
+        for index in range(len(self)):
+            yield index, self._team_id.unpack_from(self._data, index * size + 4)[0]
+
+    def _record(self, index: int) -> LeagueSeason:
+        registry = get_team_registry()
+        year, split, champion, *seeds = self._unpack(index)
+        return LeagueSeason(
+            year, _split_name(split), registry.name(champion),
+            tuple(registry.names[seed] for seed in seeds if seed != NO_TEAM)
+        )
+
+
+def titles_by_region(histories: Iterable[LeagueHistory]) -> Dict[str, List[LeagueSeason]]:
+    """Title-winning seasons from the given leagues, grouped by the champion's region."""
+    registry = get_team_registry()
+    regions: Dict[str, List[LeagueSeason]] = {}
+    for history in histories:
+        for index, champion in history._champions():
+            if champion != NO_TEAM:
+                regions.setdefault(registry.region(champion), []).append(history[index])
+    return regions
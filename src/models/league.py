@@ -5,6 +5,8 @@ import random
 
 from .team import Team
 from .match import Match, MatchResult
+from .history import LeagueHistory
+from ..utils.tracing import traced
 
 
 class SeasonPhase(Enum):
@@ -24,6 +26,7 @@ class Division:
         self.teams = teams
         self.matches: List[Match] = []
 
+    @traced()
     def get_standings(self) -> List[Dict]:
         """Get division standings with detailed stats."""
         standings = []
@@ -134,7 +137,7 @@ class League:
             for name, teams in divisions.items()
         }
         self.current_season: Optional[Season] = None
-        self.season_history: List[Season] = []
+        self.season_history = LeagueHistory()
         
         # Validate minimum teams
         total_teams = sum(len(div.teams) for div in self.divisions.values())
@@ -149,6 +152,7 @@ class League:
             for team in division.teams
         ]
 
+    @traced()
     def generate_schedule(self, start_date: datetime) -> Dict[str, List[Match]]:
         """Generate schedule for each division."""
         division_schedules = {}
@@ -225,8 +229,9 @@ class League:
     def start_new_season(self, split: Split, start_date: datetime) -> None:
         """Start a new season."""
         # Archive current season if exists
-        if self.current_season:
-            self.season_history.append(self.current_season)
+        finished = self.current_season
+        if finished:
+            self.season_history.append(finished)
         
         # Create new season
         year = start_date.year
@@ -238,7 +243,7 @@ class League:
         
         # Reset all team stats
         for team in self.get_all_teams():
-            team.reset_stats()
+            team.reset_stats(finished)
         
     def get_matches_for_week(self, week: int) -> Dict[str, List[Match]]:
         """Get all matches for a specific week by division."""
@@ -252,6 +257,7 @@ class League:
         
         return division_matches
 
+    @traced()
     def simulate_week(self, player_team: Optional[Team] = None) -> Dict[str, List[MatchResult]]:
         """Simulate all matches for the current week across all divisions."""
         if not self.current_season or self.current_season.phase != SeasonPhase.REGULAR_SEASON:
@@ -314,6 +320,7 @@ class League:
         
         return qualified_teams
 
+    @traced()
     def start_playoffs(self) -> None:
         """Initialize playoff bracket."""
         if not self.current_season:
@@ -360,6 +367,7 @@ class League:
         winner.championship_points += 50
         loser.championship_points += 20
 
+    @traced()
     def simulate_playoff_round(self) -> bool:
         """Simulate current playoff round and return True if playoffs are complete."""
         if "Playoffs" not in self.divisions:
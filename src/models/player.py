@@ -47,7 +47,8 @@ class Player:
         nationality: str,
         salary: int,
         contract_end: date,
-        team_id: Optional[int] = None
+        team_id: Optional[int] = None,
+        player_id: Optional[int] = None
     ):
         self.name = name
         self.role = role
@@ -56,6 +57,7 @@ class Player:
         self.salary = salary
         self.contract_end = contract_end
         self.team_id = team_id
+        self.player_id = player_id
         
         # Performance tracking
         self.games_played = 0
@@ -1,6 +1,10 @@
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+from .history import TeamHistory
 from .player import Player, Role
 
+if TYPE_CHECKING:
+    from .league import Season
+
 
 class TeamError(Exception):
     """Custom exception for team-related errors."""
@@ -39,7 +43,7 @@ class Team:
         self.championship_points = 0
         self.game_differential = 0  # For tiebreaker calculations
         self.current_streak = 0  # Positive for win streak, negative for loss streak
-        self.season_history = []  # Track performance across seasons
+        self.season_history = TeamHistory()  # Track performance across seasons
         self.world_championships = 0
         self.domestic_titles = 0
     
@@ -144,16 +148,16 @@ class Team:
             if player:
                 player.update_performance(won)
     
-    def reset_stats(self) -> None:
-        """Reset team's seasonal stats."""
+    def reset_stats(self, season: Optional['Season'] = None) -> None:
+        """Reset team's seasonal stats.
+        
+        Args:
+            season: The season that just ended, recorded with the stats
+        """
         # Archive current season stats
         if self.wins > 0 or self.losses > 0:
-            self.season_history.append({
-                'wins': self.wins,
-                'losses': self.losses,
-                'points': self.championship_points,
-                'game_diff': self.game_differential,
-            })
+            self.season_history.append(season, self.wins, self.losses,
+                                       self.championship_points, self.game_differential)
         
         # Reset current stats
         self.wins = 0
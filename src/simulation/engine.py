@@ -0,0 +1,597 @@
+import random
+from typing import Iterator, List, Optional, Sequence
+
+from ..models.match import DragonType, EventType, MatchEvent, TeamFightResult
+from ..models.player import Player, Role
+from ..models.team import Team
+from ..utils.tracing import traced
+from .state import (ASSISTS, BARONS, BLUE, CS, DAMAGE, DEATHS, DRAGON_COLUMNS, GOLD, INHIBITORS,
+                    KILLS, RED, TEAM, TOWERS, VISION, Change, MatchState, SideState, SimEvent)
+
+
+# Per-minute farming by role: (low, high)
+CS_PER_MINUTE = {
+    Role.TOP: (7, 9),
+    Role.JUNGLE: (6, 8),
+    Role.MID: (8, 10),
+    Role.ADC: (8, 10),
+    Role.SUPPORT: (0, 1)
+}
+VISION_PER_MINUTE = {Role.JUNGLE: (0, 2), Role.SUPPORT: (1, 3)}
+DAMAGE_PER_MINUTE = {Role.MID: (500, 900), Role.ADC: (500, 900)}
+DEFAULT_VISION = (0, 1)
+DEFAULT_DAMAGE = (250, 600)
+
+GOLD_PER_CS = 19
+KILL_GOLD = 300
+ASSIST_GOLD = 150
+# Objective gold is paid to every player on the team
+TOWER_GOLD = 100
+INHIBITOR_GOLD = 50
+DRAGON_GOLD = 60
+BARON_GOLD = 120
+
+FIRST_DRAGON, DRAGON_RESPAWN, ELDER_RESPAWN = 5, 5, 6
+FIRST_BARON, BARON_RESPAWN = 20, 6
+STEAL_CHANCE = 0.06
+PLAY_CHANCE = 0.45
+
+CARRIES = (Role.MID, Role.ADC)
+LANES = ("top", "mid", "bottom")
+LANE_ROLES = (Role.TOP, Role.MID, Role.ADC)
+TOWER_TIERS = ("outer", "inner", "inhibitor")
+ELEMENTAL_DRAGONS = [d for d in DragonType if d != DragonType.ELDER]
+
+FIGHT_LOCATIONS = [
+    "Baron pit", "Dragon pit", "top river", "bottom river",
+    "top jungle", "bottom jungle", "mid lane", "top lane", "bottom lane",
+    "enemy blue buff", "enemy red buff"
+]
+
+MULTI_KILLS = {
+    2: EventType.DOUBLE_KILL,
+    3: EventType.TRIPLE_KILL,
+    4: EventType.QUADRA_KILL,
+    5: EventType.PENTA_KILL
+}
+
+# Plays each role makes before 15 minutes and from 15 minutes on
+ROLE_PLAYS = {
+    Role.TOP: (
+        [EventType.TOP_SPLIT_PUSH, EventType.SOLO_KILL, EventType.OUTPLAY],
+        [EventType.TOP_SPLIT_PUSH, EventType.TEAM_FIGHT_WIN, EventType.OUTPLAY]
+    ),
+    Role.JUNGLE: (
+        [EventType.JUNGLE_INVADE, EventType.COUNTER_GANK, EventType.JUNGLE_OBJECTIVE],
+        [EventType.JUNGLE_OBJECTIVE, EventType.COUNTER_GANK, EventType.TEAM_FIGHT_WIN]
+    ),
+    Role.MID: (
+        [EventType.MID_ROAM, EventType.SOLO_KILL, EventType.OUTPLAY],
+        [EventType.MID_ROAM, EventType.TEAM_FIGHT_WIN, EventType.OUTPLAY]
+    ),
+    Role.ADC: (
+        [EventType.ADC_KITING, EventType.SOLO_KILL, EventType.OUTPLAY],
+        [EventType.ADC_KITING, EventType.TEAM_FIGHT_WIN, EventType.OUTPLAY]
+    ),
+    Role.SUPPORT: (
+        [EventType.SUPPORT_VISION, EventType.SUPPORT_SAVE, EventType.COUNTER_GANK],
+        [EventType.SUPPORT_VISION, EventType.SUPPORT_SAVE, EventType.TEAM_FIGHT_WIN]
+    )
+}
+# After 25 minutes the game is mostly decided in fights
+LATE_FIGHT_CHANCE = 0.5
+
+
+class MatchEngine:
+    """Tick-based simulation of a single game.
+
+    The game advances one minute at a time over a compact MatchState
+    (per-player stat rows, objectives, dragon buffs). events() is a
+    generator of SimEvents: each carries the state changes it made and,
+    except for routine farming, the MatchEvent to show in a play-by-play.
+    Every event is applied to engine.state before it is yielded, so the
+    state is always current for the consumer.
+
+    The winner is drawn up front from the win chance; the game is then
+    played out with contests tilting towards the winner as it goes on and
+    towards whichever team leads in gold and dragon buffs.
+
+    Batch simulation drains the generator with run(); the match screen
+    replays the same events at its own pace.
+    """
+
+    def __init__(self, blue: Team, red: Team, blue_win_chance: float = 0.5,
+                 rng: Optional[random.Random] = None, duration: Optional[int] = None):
+        """Set up a game.
+
+        Args:
+            blue: Blue side team
+            red: Red side team
+            blue_win_chance: Probability that blue wins
+            rng: Random source; the random module by default
+            duration: Game length in minutes; 25-45 at random by default
+        """
+        self.rng = rng if rng is not None else random
+        self.state = MatchState(SideState(blue, _lineup(blue)), SideState(red, _lineup(red)))
+        self.winner_side = BLUE if self.rng.random() < blue_win_chance else RED
+        self.duration = duration or self.rng.randint(25, 45)
+
+        self._slots = [{p.role: i for i, p in enumerate(side.players)} for side in self.state.sides]
+        self._lanes = [[0, 0, 0], [0, 0, 0]]  # Towers (4 = inhibitor) each side took per lane
+        self._next_dragon = FIRST_DRAGON
+        self._next_dragon_type = self.rng.choice(ELEMENTAL_DRAGONS)
+        self._next_baron = FIRST_BARON
+        self._first_blood = False
+        self.play_by_play: List[MatchEvent] = []
+
+    @property
+    def winner(self) -> Team:
+        return self.state.sides[self.winner_side].team
+
+    @property
+    def loser(self) -> Team:
+        return self.state.sides[1 - self.winner_side].team
+
+    @traced()
+    def run(self) -> List[MatchEvent]:
+        """Play the whole game without stopping; returns the play-by-play."""
+        for _ in self.events():
+            pass
+        return self.play_by_play
+
+    def events(self) -> Iterator[SimEvent]:
+        """Play the game minute by minute, yielding each step once applied.
+
+        The MatchEvents are also collected in play_by_play.
+        """
+        for sim_event in self._play_game():
+            if sim_event.event:
+                self.play_by_play.append(sim_event.event)
+            yield sim_event
+
+    def _play_game(self) -> Iterator[SimEvent]:
+        rng = self.rng
+        for minute in range(1, self.duration + 1):
+            yield from self._emit(self._farm(minute))
+            if minute == self.duration:
+                break
+
+            if minute >= self._next_dragon:
+                yield from self._dragon(minute)
+            if minute >= self._next_baron and rng.random() < 0.35:
+                yield from self._baron(minute)
+            if minute >= 8 and rng.random() < 0.1 + 0.25 * minute / self.duration:
+                tower = self._tower(self._contest(minute), minute)
+                if tower:
+                    yield from self._emit(tower)
+            if rng.random() < PLAY_CHANCE:
+                yield from self._play(minute)
+
+        yield from self._finish(self.duration)
+
+    # State helpers
+
+    def _emit(self, sim_event: SimEvent) -> Iterator[SimEvent]:
+        """Apply an event, yield it, and call out first blood."""
+        self.state.apply(sim_event)
+        yield sim_event
+        if self._first_blood:
+            return
+        for side, slot, column, _ in sim_event.changes:
+            if column == KILLS and slot != TEAM:
+                self._first_blood = True
+                team = self.state.sides[side].team
+                player = self.state.sides[side].players[slot]
+                yield SimEvent(sim_event.time, [], MatchEvent(
+                    type=EventType.FIRST_BLOOD,
+                    time=sim_event.time,
+                    description=f"{player.name} ({team.name}) drew first blood!",
+                    player=player,
+                    team=team
+                ))
+                return
+
+    def _contest(self, minute: int) -> int:
+        """Side that comes out ahead in a contest this minute."""
+        winner = self.state.sides[self.winner_side]
+        loser = self.state.sides[1 - self.winner_side]
+
+        # Early game is close to a coin flip; late game favours the winner
+        chance = 0.45 + 0.3 * minute / self.duration
+        chance += max(-0.1, min(0.1, (winner.gold - loser.gold) / 50000))
+        power = winner.dragon_state.get_power_multiplier() / loser.dragon_state.get_power_multiplier()
+        chance = chance * power / (chance * power + 1 - chance)
+
+        return self.winner_side if self.rng.random() < chance else 1 - self.winner_side
+
+    def _slot(self, side: int, roles: Sequence[Role]) -> int:
+        """A player slot on side in one of roles, or any slot if none play them."""
+        slots = [self._slots[side][role] for role in roles if role in self._slots[side]]
+        return self.rng.choice(slots or range(len(self.state.sides[side].players)))
+
+    def _team_gold(self, changes: List[Change], side: int, amount: int) -> None:
+        for slot in range(len(self.state.sides[side].players)):
+            changes.append((side, slot, GOLD, amount))
+
+    def _kill(self, changes: List[Change], side: int, killer: int, victim: int,
+              assisters: Sequence[int] = ()) -> None:
+        changes.append((side, killer, KILLS, 1))
+        changes.append((side, killer, GOLD, KILL_GOLD))
+        changes.append((side, killer, DAMAGE, self.rng.randint(800, 1600)))
+        changes.append((1 - side, victim, DEATHS, 1))
+        for assister in assisters:
+            changes.append((side, assister, ASSISTS, 1))
+            changes.append((side, assister, GOLD, ASSIST_GOLD))
+
+    def _player(self, side: int, slot: int) -> Player:
+        return self.state.sides[side].players[slot]
+
+    def _team(self, side: int) -> Team:
+        return self.state.sides[side].team
+
+    # Steps
+
+    def _farm(self, minute: int) -> SimEvent:
+        rng = self.rng
+        changes = []
+        for side, state in enumerate(self.state.sides):
+            for slot, player in enumerate(state.players):
+                cs = rng.randint(*CS_PER_MINUTE[player.role])
+                changes.append((side, slot, CS, cs))
+                changes.append((side, slot, GOLD, cs * GOLD_PER_CS))
+                changes.append((side, slot, VISION, rng.randint(*VISION_PER_MINUTE.get(player.role, DEFAULT_VISION))))
+                changes.append((side, slot, DAMAGE, rng.randint(*DAMAGE_PER_MINUTE.get(player.role, DEFAULT_DAMAGE))))
+        return SimEvent(minute, changes)
+
+    def _fight(self, side: int, minute: int, small: bool = False,
+               location: Optional[str] = None) -> SimEvent:
+        """A fight won by side; small fights are skirmishes of one or two kills."""
+        rng = self.rng
+        enemy = 1 - side
+        players = self.state.sides[side].players
+        enemies = self.state.sides[enemy].players
+        behind = self.state.sides[side].gold + 2000 < self.state.sides[enemy].gold
+
+        kills = min(rng.randint(1, 2) if small else rng.randint(2, 5), len(enemies))
+        trades = min(rng.randint(0, kills - 1), len(players))
+        changes: List[Change] = []
+
+        kills_by = [0] * len(players)
+        carries = [self._slots[side][role] for role in CARRIES if role in self._slots[side]]
+        others = [slot for slot in range(len(players)) if slot not in carries]
+        for victim in rng.sample(range(len(enemies)), kills):
+            if carries and (not others or rng.random() < (0.6 if small else 0.7)):
+                killer = rng.choice(carries)
+            else:
+                killer = rng.choice(others)
+            teammates = [slot for slot in range(len(players)) if slot != killer]
+            assisters = rng.sample(teammates, min(rng.randint(1, 2) if small else rng.randint(2, 3), len(teammates)))
+            self._kill(changes, side, killer, victim, assisters)
+            kills_by[killer] += 1
+        for victim in rng.sample(range(len(players)), trades):
+            self._kill(changes, enemy, rng.randrange(len(enemies)), victim)
+
+        top = max(range(len(players)), key=kills_by.__getitem__)
+        multi_kill = None
+        if kills_by[top] in MULTI_KILLS:
+            multi_kill = (players[top], MULTI_KILLS[kills_by[top]])
+
+        fight = TeamFightResult(
+            winner=self._team(side),
+            loser=self._team(enemy),
+            winner_kills=kills,
+            loser_kills=trades,
+            location=location or rng.choice(FIGHT_LOCATIONS),
+            mvp_player=players[top],
+            multi_kill=multi_kill
+        )
+        if fight.was_ace and kills >= 3:
+            event_type = EventType.PERFECT_ACE
+        elif behind:
+            event_type = EventType.COMEBACK_FIGHT
+        else:
+            event_type = EventType.TEAM_FIGHT_WIN
+        return SimEvent(minute, changes, MatchEvent(
+            type=event_type,
+            time=minute,
+            description=_describe_fight(fight),
+            team=fight.winner,
+            fight_result=fight
+        ))
+
+    def _objective(self, minute: int, small_fight: bool, fight_chance: float,
+                   location: str) -> Iterator[SimEvent]:
+        """Contest a neutral objective, maybe with a fight; returns the side that wins it."""
+        side = self._contest(minute)
+        if self.rng.random() < fight_chance:
+            yield from self._emit(self._fight(side, minute, small=small_fight, location=location))
+        return side
+
+    def _dragon(self, minute: int) -> Iterator[SimEvent]:
+        rng = self.rng
+        dragon_type = self._next_dragon_type
+        side = yield from self._objective(minute, True, 0.4, "Dragon pit")
+
+        stolen = rng.random() < STEAL_CHANCE
+        if stolen:
+            side = 1 - side
+        slot = self._slot(side, (Role.JUNGLE,))
+        player, team = self._player(side, slot), self._team(side)
+
+        changes = [(side, TEAM, DRAGON_COLUMNS[dragon_type], 1)]
+        self._team_gold(changes, side, DRAGON_GOLD)
+        if stolen:
+            event_type = EventType.OBJECTIVE_STEAL
+            description = f"INCREDIBLE! {player.name} steals the {dragon_type.value} Dragon for {team.name}!"
+        else:
+            event_type = EventType.DRAGON_SECURED
+            description = self._describe_dragon(dragon_type, side, player)
+        yield from self._emit(SimEvent(minute, changes, MatchEvent(
+            type=event_type, time=minute, description=description, player=player, team=team
+        )))
+
+        # Once a team has the soul, only the Elder Dragon spawns
+        if dragon_type == DragonType.ELDER or any(s.dragon_state.dragon_soul for s in self.state.sides):
+            self._next_dragon_type = DragonType.ELDER
+            self._next_dragon = minute + ELDER_RESPAWN
+        else:
+            self._next_dragon_type = rng.choice(ELEMENTAL_DRAGONS)
+            self._next_dragon = minute + DRAGON_RESPAWN
+
+    def _describe_dragon(self, dragon_type: DragonType, side: int, player: Player) -> str:
+        team = self._team(side)
+        if dragon_type == DragonType.ELDER:
+            return f"{team.name} secures the Elder Dragon! {player.name} gets the finishing blow"
+        # The fourth dragon completes the soul
+        if self.state.sides[side].dragons == 3:
+            return f"{team.name} claims the {dragon_type.value} Dragon Soul with {player.name} securing the final dragon!"
+        buff_descriptions = {
+            DragonType.INFERNAL: "increasing their team's damage",
+            DragonType.OCEAN: "boosting their sustain",
+            DragonType.MOUNTAIN: "strengthening their defenses",
+            DragonType.CLOUD: "enhancing their mobility"
+        }
+        return (f"{team.name} secures the {dragon_type.value} Dragon, "
+                f"{buff_descriptions[dragon_type]}! {player.name} gets the last hit!")
+
+    def _baron(self, minute: int) -> Iterator[SimEvent]:
+        rng = self.rng
+        side = yield from self._objective(minute, False, 0.8, "Baron pit")
+
+        stolen = rng.random() < STEAL_CHANCE
+        if stolen:
+            side = 1 - side
+        slot = self._slot(side, (Role.JUNGLE,))
+        player, team = self._player(side, slot), self._team(side)
+
+        changes = [(side, TEAM, BARONS, 1)]
+        self._team_gold(changes, side, BARON_GOLD)
+        if stolen:
+            event_type = EventType.OBJECTIVE_STEAL
+            description = f"INCREDIBLE! {player.name} steals Baron for {team.name}!"
+        else:
+            event_type = EventType.BARON_SECURED
+            description = f"{minute} min Baron secured by {team.name}, {player.name} dealt the final damage"
+        yield from self._emit(SimEvent(minute, changes, MatchEvent(
+            type=event_type, time=minute, description=description, player=player, team=team
+        )))
+        self._next_baron = minute + BARON_RESPAWN
+
+        # Baron buff usually converts into a tower
+        if rng.random() < 0.6:
+            tower = self._tower(side, minute)
+            if tower:
+                yield from self._emit(tower)
+
+    def _tower(self, side: int, minute: int, lane: Optional[int] = None,
+               slot: Optional[int] = None) -> Optional[SimEvent]:
+        """Side takes the next tower (or inhibitor) in lane, or in a random lane."""
+        lanes = self._lanes[side]
+        if lane is None:
+            towers = [i for i, taken in enumerate(lanes) if taken < 3]
+            inhibitors = [i for i, taken in enumerate(lanes) if taken == 3] if minute >= 20 else []
+            if inhibitors and (not towers or self.rng.random() < 0.5):
+                lane = self.rng.choice(inhibitors)
+            elif towers:
+                lane = self.rng.choice(towers)
+            else:
+                return None
+        if lanes[lane] > 3:
+            return None
+
+        if slot is None:
+            slot = self._slot(side, (LANE_ROLES[lane],))
+        player, team = self._player(side, slot), self._team(side)
+        changes: List[Change] = []
+        if lanes[lane] == 3:
+            changes.append((side, TEAM, INHIBITORS, 1))
+            self._team_gold(changes, side, INHIBITOR_GOLD)
+            event_type = EventType.INHIBITOR_DESTROYED
+            description = f"{team.name} breaks the {LANES[lane]} inhibitor, opening up the base"
+        else:
+            changes.append((side, TEAM, TOWERS, 1))
+            self._team_gold(changes, side, TOWER_GOLD)
+            event_type = EventType.TOWER_DESTROYED
+            description = f"{team.name} takes down the {TOWER_TIERS[lanes[lane]]} {LANES[lane]} tower"
+        lanes[lane] += 1
+        return SimEvent(minute, changes, MatchEvent(
+            type=event_type, time=minute, description=description, player=player, team=team
+        ))
+
+    def _play(self, minute: int) -> Iterator[SimEvent]:
+        """An individual or small-group play by one player."""
+        rng = self.rng
+        side = self._contest(minute)
+        enemy = 1 - side
+        players = self.state.sides[side].players
+        slot = rng.randrange(len(players))
+        player, team = players[slot], self._team(side)
+
+        if minute >= 25 and rng.random() < LATE_FIGHT_CHANCE:
+            event_type = EventType.TEAM_FIGHT_WIN
+        else:
+            event_type = rng.choice(ROLE_PLAYS[player.role][0 if minute < 15 else 1])
+        if event_type == EventType.TEAM_FIGHT_WIN:
+            yield from self._emit(self._fight(side, minute))
+            return
+
+        changes: List[Change] = []
+        follow_up = None
+        if event_type in (EventType.SOLO_KILL, EventType.OUTPLAY):
+            self._kill(changes, side, slot, self._slot(enemy, (player.role,)))
+        elif event_type == EventType.COUNTER_GANK:
+            helper_roles = [r for r in Role if r != player.role] if player.role == Role.JUNGLE else [Role.JUNGLE]
+            helper = self._slot(side, helper_roles)
+            self._kill(changes, side, slot, self._slot(enemy, list(Role)), [helper] if helper != slot else [])
+        elif event_type == EventType.MID_ROAM:
+            killer = self._slot(side, (Role.TOP, Role.ADC))
+            self._kill(changes, side, killer, self._slot(enemy, (Role.TOP, Role.ADC)), [slot] if killer != slot else [])
+        elif event_type == EventType.ADC_KITING:
+            enemies = len(self.state.sides[enemy].players)
+            for victim in rng.sample(range(enemies), min(rng.randint(1, 2), enemies)):
+                self._kill(changes, side, slot, victim)
+        elif event_type in (EventType.SUPPORT_VISION, EventType.SUPPORT_SAVE):
+            if event_type == EventType.SUPPORT_VISION:
+                changes.append((side, slot, VISION, rng.randint(5, 10)))
+                turned = rng.random() < 0.3
+            else:
+                changes.append((side, slot, GOLD, ASSIST_GOLD))
+                turned = rng.random() < 0.5
+            if turned:
+                killer = self._slot(side, CARRIES)
+                self._kill(changes, side, killer, self._slot(enemy, list(Role)), [slot] if killer != slot else [])
+        elif event_type == EventType.JUNGLE_INVADE:
+            changes.append((side, slot, GOLD, 200))  # Stolen camps
+            if rng.random() < 0.4:
+                follow_up = self._fight(side, minute, small=True, location="the enemy jungle")
+        elif event_type == EventType.JUNGLE_OBJECTIVE:
+            camps = rng.randint(2, 3)
+            changes.append((side, slot, GOLD, camps * 100))
+            changes.append((side, slot, VISION, camps))
+        elif event_type == EventType.TOP_SPLIT_PUSH:
+            changes.append((side, slot, GOLD, 200))
+            if rng.random() < 0.4:
+                follow_up = self._tower(side, minute, lane=0, slot=slot)
+
+        yield from self._emit(SimEvent(minute, changes, MatchEvent(
+            type=event_type,
+            time=minute,
+            description=_describe_play(event_type, player, team, rng),
+            player=player,
+            team=team
+        )))
+        if follow_up:
+            yield from self._emit(follow_up)
+
+    def _finish(self, minute: int) -> Iterator[SimEvent]:
+        """The winner breaks into the base and ends the game."""
+        side = self.winner_side
+        lanes = self._lanes[side]
+        lane = max(range(len(lanes)), key=lanes.__getitem__)
+        while lanes[lane] < 4:
+            yield from self._emit(self._tower(side, minute, lane=lane))
+
+        yield from self._emit(self._fight(side, minute, location="their base"))
+        team = self._team(side)
+        yield SimEvent(minute, [], MatchEvent(
+            type=EventType.TEAM_FIGHT_WIN,
+            time=minute,
+            description=f"{team.name} wins the game after a decisive team fight!",
+            team=team
+        ))
+
+
+def _lineup(team: Team) -> List[Player]:
+    """The team's starters in role order."""
+    lineup = team.get_starting_lineup()
+    players = [lineup[role] for role in Role if lineup[role]]
+    if not players:
+        raise ValueError(f"Team {team.name} has no players in roster")
+    return players
+
+
+@traced("event text")
+def _describe_fight(fight: TeamFightResult) -> str:
+    """Generate a detailed description of a team fight."""
+    description = []
+
+    # Basic fight outcome with team names
+    if fight.was_ace and fight.winner_kills >= 3:
+        description.append(f"{fight.winner.name} secured an ace against {fight.loser.name}")
+    else:
+        description.append(
+            f"{fight.winner.name} won a {fight.winner_kills}-{fight.loser_kills} "
+            f"fight against {fight.loser.name}"
+        )
+
+    # Location and objective context
+    description.append(f"near {fight.location}")
+    if fight.objective_secured:
+        description.append(f"and secured {fight.objective_secured}")
+
+    # Notable player performances
+    if fight.mvp_player:
+        if fight.was_ace:
+            description.append(f"with {fight.mvp_player.name} leading the clean sweep")
+        else:
+            description.append(f"with {fight.mvp_player.name} making crucial plays")
+
+    # Multi-kill achievements
+    if fight.multi_kill:
+        player, kill_type = fight.multi_kill
+        if kill_type == EventType.PENTA_KILL:
+            description.append(f"(PENTAKILL by {player.name}!)")
+        else:
+            description.append(f"({player.name} scored a {kill_type.value})")
+
+    return " ".join(description)
+
+
+@traced("event text")
+def _describe_play(event_type: EventType, player: Player, team: Team, rng) -> str:
+    """Generate a descriptive message for an individual play."""
+    if event_type == EventType.SOLO_KILL:
+        actions = [
+            f"{player.name} outplayed their opponent for a clean solo kill in {player.role.value}",
+            f"{player.name} secured a spectacular solo kill in the {player.role.value} lane",
+            f"Incredible mechanics by {player.name} to get a solo kill in {player.role.value}"
+        ]
+        return rng.choice(actions)
+
+    elif event_type == EventType.OUTPLAY:
+        scenarios = [
+            f"{player.name} pulls off an incredible 1v2 outplay in {player.role.value}",
+            f"Mechanical masterclass by {player.name} to turn around a gank",
+            f"{player.name} shows off their skills with a beautiful outplay"
+        ]
+        return rng.choice(scenarios)
+
+    elif event_type == EventType.JUNGLE_INVADE:
+        if player.role == Role.JUNGLE:
+            return f"{player.name} successfully invades the enemy jungle, denying crucial resources"
+        return f"{team.name} invades the enemy jungle with {player.name} leading the charge"
+
+    elif event_type == EventType.COUNTER_GANK:
+        if player.role == Role.JUNGLE:
+            return f"Perfect counter gank by {player.name} to turn the tide"
+        return f"{player.name} helps turn around a gank in {player.role.value}"
+
+    elif event_type == EventType.TOP_SPLIT_PUSH:
+        return f"{player.name} creates pressure with a successful split push in top lane"
+
+    elif event_type == EventType.MID_ROAM:
+        return f"{player.name} roams effectively to help out other lanes"
+
+    elif event_type == EventType.ADC_KITING:
+        return f"{player.name} kites perfectly in a team fight, avoiding damage"
+
+    elif event_type == EventType.SUPPORT_VISION:
+        return f"{player.name} establishes vision control, helping their team"
+
+    elif event_type == EventType.SUPPORT_SAVE:
+        return f"{player.name} makes a clutch save, turning around a team fight"
+
+    elif event_type == EventType.JUNGLE_OBJECTIVE:
+        return f"{player.name} secures multiple objectives, giving their team an advantage"
+
+    return f"{player.name} makes a great play for {team.name}"
@@ -0,0 +1,142 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from ..models.match import DragonState, DragonType, MatchEvent, PlayerMatchStats, TeamMatchStats
+from ..models.player import Player
+from ..models.team import Team
+
+
+# Player stat columns
+KILLS, DEATHS, ASSISTS, CS, GOLD, VISION, DAMAGE = range(7)
+PLAYER_COLUMNS = 7
+
+# Team objective columns; every dragon type gets its own column
+TOWERS, INHIBITORS, BARONS = range(3)
+DRAGON_COLUMNS = {dragon_type: 3 + i for i, dragon_type in enumerate(DragonType)}
+OBJECTIVE_COLUMNS = 3 + len(DRAGON_COLUMNS)
+_DRAGON_TYPES = {column: dragon_type for dragon_type, column in DRAGON_COLUMNS.items()}
+
+# Slot of changes that apply to the team rather than one player
+TEAM = -1
+
+BLUE, RED = 0, 1
+
+# (side, slot, column, amount)
+Change = Tuple[int, int, int, int]
+
+
+@dataclass
+class SimEvent:
+    """One step of a simulated game.
+
+    changes is everything the step adds to the game state. event is the
+    play-by-play entry for the step, or None for routine farming.
+    """
+    time: int  # Minutes into the game
+    changes: List[Change] = field(default_factory=list)
+    event: Optional[MatchEvent] = None
+
+
+class SideState:
+    """One team's running totals: a row of stat columns per player plus objectives."""
+
+    __slots__ = ('team', 'players', 'stats', 'objectives', 'dragon_state')
+
+    def __init__(self, team: Team, players: List[Player]):
+        self.team = team
+        self.players = players
+        self.stats: List[List[int]] = [[0] * PLAYER_COLUMNS for _ in players]
+        self.objectives: List[int] = [0] * OBJECTIVE_COLUMNS
+        self.dragon_state = DragonState()
+
+    def total(self, column: int) -> int:
+        """Sum of one stat column over the team's players."""
+        return sum(row[column] for row in self.stats)
+
+    @property
+    def kills(self) -> int:
+        return self.total(KILLS)
+
+    @property
+    def deaths(self) -> int:
+        return self.total(DEATHS)
+
+    @property
+    def gold(self) -> int:
+        return self.total(GOLD)
+
+    @property
+    def towers(self) -> int:
+        return self.objectives[TOWERS]
+
+    @property
+    def inhibitors(self) -> int:
+        return self.objectives[INHIBITORS]
+
+    @property
+    def barons(self) -> int:
+        return self.objectives[BARONS]
+
+    @property
+    def dragons(self) -> int:
+        return sum(self.objectives[column] for column in DRAGON_COLUMNS.values())
+
+    def add_to(self, team_stats: TeamMatchStats) -> None:
+        """Add these totals to team_stats; a series adds up every game."""
+        for player, row in zip(self.players, self.stats):
+            player_stats = team_stats.player_stats.get(player)
+            if player_stats is None:
+                player_stats = team_stats.player_stats[player] = PlayerMatchStats(player=player)
+            player_stats.kills += row[KILLS]
+            player_stats.deaths += row[DEATHS]
+            player_stats.assists += row[ASSISTS]
+            player_stats.cs += row[CS]
+            player_stats.gold_earned += row[GOLD]
+            player_stats.vision_score += row[VISION]
+            player_stats.damage_dealt += row[DAMAGE]
+
+        team_stats.kills += self.kills
+        team_stats.deaths += self.deaths
+        team_stats.total_gold += self.gold
+        team_stats.towers += self.towers
+        team_stats.inhibitors += self.inhibitors
+        team_stats.barons += self.barons
+        team_stats.dragons += self.dragons
+        # Dragon buffs don't carry between games; keep the latest game's
+        team_stats.dragon_state = self.dragon_state
+
+
+class MatchState:
+    """Both sides of one game, as of the last applied SimEvent."""
+
+    __slots__ = ('sides', 'minute')
+
+    def __init__(self, blue: SideState, red: SideState):
+        self.sides = (blue, red)
+        self.minute = 0
+
+    @property
+    def blue(self) -> SideState:
+        return self.sides[BLUE]
+
+    @property
+    def red(self) -> SideState:
+        return self.sides[RED]
+
+    def fresh(self) -> 'MatchState':
+        """A zeroed state with the same teams and lineups, to replay events into."""
+        return MatchState(*(SideState(side.team, side.players) for side in self.sides))
+
+    def apply(self, sim_event: SimEvent) -> None:
+        """Add one event's changes."""
+        self.minute = sim_event.time
+        sides = self.sides
+        for side, slot, column, amount in sim_event.changes:
+            state = sides[side]
+            if slot == TEAM:
+                state.objectives[column] += amount
+                dragon_type = _DRAGON_TYPES.get(column)
+                if dragon_type:
+                    state.dragon_state.add_dragon(dragon_type)
+            else:
+                state.stats[slot][column] += amount
@@ -0,0 +1,194 @@
+from typing import List, Optional, Tuple
+
+from PyQt6.QtCore import (QAbstractListModel, QModelIndex, QRect, QSize,
+                          QSortFilterProxyModel, Qt, pyqtSignal)
+from PyQt6.QtGui import QColor, QPainter, QPen
+from PyQt6.QtWidgets import QListView, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from ...models.champion import Champion
+from ...models.draft import DraftState, DraftAction
+from ...models.player import Role
+from .portrait_cache import PortraitCache, ICON_SIZE
+
+# Item roles
+ChampionRole = Qt.ItemDataRole.UserRole + 1
+AvailableRole = Qt.ItemDataRole.UserRole + 2
+SelectableRole = Qt.ItemDataRole.UserRole + 3
+
+CELL_SIZE = 80
+
+
+class ChampionListModel(QAbstractListModel):
+    """Every champion in the draft's registry, one row each, in name order.
+
+    Rows never move; after the draft changes call refresh_state(), which
+    emits dataChanged only for rows whose availability changed.
+    """
+
+    def __init__(self, draft_state: DraftState, parent=None):
+        super().__init__(parent)
+        self.draft_state = draft_state
+        self.champions = draft_state.registry.champions
+        self._state: List[Tuple[bool, bool]] = self._compute_state()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.champions)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        champion = self.champions[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return champion.name
+        if role == ChampionRole:
+            return champion
+        if role == AvailableRole:
+            return self._state[index.row()][0]
+        if role == SelectableRole:
+            return self._state[index.row()][1]
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid() or not self._state[index.row()][1]:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def _compute_state(self) -> List[Tuple[bool, bool]]:
+        """(available, selectable) for every row."""
+        draft_state = self.draft_state
+        available = draft_state.available_mask
+        selectable = available
+
+        # In pick phases only champions for the needed role can be chosen
+        step = draft_state.current_step
+        if step and step.action == DraftAction.PICK:
+            needed_role = draft_state.get_next_role_to_pick(draft_state.get_team(step.side))
+            if needed_role:
+                selectable &= draft_state.registry.role_masks[needed_role]
+
+        return [
+            (bool(available >> i & 1), bool(selectable >> i & 1))
+            for i in range(len(self.champions))
+        ]
+
+    def refresh_state(self) -> None:
+        """Re-read the draft and notify views about the rows that changed."""
+        new_state = self._compute_state()
+        old_state, self._state = self._state, new_state
+
+        # Emit one dataChanged per run of consecutive changed rows
+        start = None
+        for row, (old, new) in enumerate(zip(old_state, new_state)):
+            if old != new:
+                if start is None:
+                    start = row
+            elif start is not None:
+                self.dataChanged.emit(self.index(start), self.index(row - 1))
+                start = None
+        if start is not None:
+            self.dataChanged.emit(self.index(start), self.index(len(new_state) - 1))
+
+
+class ChampionFilterProxy(QSortFilterProxyModel):
+    """Filters the champion model by search text and role using registry bitmasks."""
+
+    def __init__(self, draft_state: DraftState, parent=None):
+        super().__init__(parent)
+        self.registry = draft_state.registry
+        self.filter_text = ""
+        self.filter_role: Optional[Role] = None
+        self._mask = self.registry.all_mask
+
+    def set_filter(self, text: str = "", role: Optional[Role] = None) -> None:
+        """Show only champions matching text and role."""
+        if text == self.filter_text and role == self.filter_role:
+            return
+        self.filter_text = text
+        self.filter_role = role
+
+        mask = self.registry.all_mask
+        if text:
+            mask &= self.registry.text_mask(text)
+        if role:
+            mask &= self.registry.role_masks[role]
+        self._mask = mask
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        # Source rows are in champion id order
+        return bool(self._mask >> source_row & 1)
+
+
+class ChampionDelegate(QStyledItemDelegate):
+    """Paints a champion cell from the shared portrait cache."""
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(CELL_SIZE, CELL_SIZE)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        champion: Champion = index.data(ChampionRole)
+        available = index.data(AvailableRole)
+        selectable = index.data(SelectableRole)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver) and selectable
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+
+        painter.save()
+        rect = option.rect.adjusted(1, 1, -1, -1)
+
+        # Background and border, matching the old button styles
+        if not available:
+            background, border = QColor("#0a0a0a"), QColor("#222222")
+        elif not selectable:
+            background, border = QColor("#3a3a3a"), QColor("#222222")
+        elif hovered:
+            background, border = QColor("#2a2a2a"), QColor("#666666")
+        else:
+            background, border = QColor("#1a1a1a"), QColor("#333333")
+        if selected:
+            border = QColor("#4CAF50")
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 5, 5)
+
+        pixmap = PortraitCache.instance().pixmap(champion.name, ICON_SIZE)
+        if pixmap:
+            if not selectable:
+                painter.setOpacity(0.5 if not available else 0.3)
+            target = QRect(0, 0, pixmap.width(), pixmap.height())
+            target.moveCenter(rect.center())
+            painter.drawPixmap(target, pixmap)
+        else:
+            # If portrait not found, fallback to text
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, champion.name)
+        painter.restore()
+
+
+class ChampionGridView(QListView):
+    """Icon-mode list of champions; emits hovered/unhovered for what-if previews."""
+
+    hovered = pyqtSignal(object)
+    unhovered = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setGridSize(QSize(CELL_SIZE + 5, CELL_SIZE + 5))
+        self.setSpacing(0)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.setItemDelegate(ChampionDelegate(self))
+        self.setStyleSheet("""
+            QListView {
+                border: none;
+                background-color: transparent;
+            }
+        """)
+        self.entered.connect(lambda index: self.hovered.emit(index.data(ChampionRole)))
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self.unhovered.emit()
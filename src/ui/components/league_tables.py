@@ -0,0 +1,211 @@
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+from ...models.match import Match
+
+
+# Item role returning the Match shown on a schedule row
+MatchRole = Qt.ItemDataRole.UserRole + 1
+
+HEADER_BACKGROUND = QColor("#2a2a2a")
+
+Row = Tuple[str, ...]
+
+
+class DiffTableModel(QAbstractTableModel):
+    """Read-only table whose rows are identified by a key.
+
+    set_rows() compares the new rows with the ones shown and notifies views
+    as little as possible: dataChanged for rows whose values changed,
+    layoutChanged when the same rows come back in a different order, and a
+    model reset only when rows were added or removed.
+    """
+
+    headers: Sequence[str] = ()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys: List[Hashable] = []
+        self._rows: List[Row] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def set_rows(self, keys: List[Hashable], rows: List[Row]) -> None:
+        """Show rows (one per key), emitting only the changes."""
+        old_keys, old_rows = self._keys, self._rows
+
+        if keys == old_keys:
+            self._rows = rows
+            self._emit_changed(
+                [row for row, (old, new) in enumerate(zip(old_rows, rows)) if old != new]
+            )
+            return
+
+        if len(keys) != len(old_keys) or set(keys) != set(old_keys):
+            self.beginResetModel()
+            self._keys, self._rows = keys, rows
+            self.endResetModel()
+            return
+
+        # Same rows in a new order: move persistent indexes (selection) along
+        new_positions = {key: row for row, key in enumerate(keys)}
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_positions[old_keys[index.row()]], index.column())
+            for index in old_indexes
+        ]
+        self._keys, self._rows = keys, rows
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+        old_values: Dict[Hashable, Row] = dict(zip(old_keys, old_rows))
+        self._emit_changed(
+            [row for row, key in enumerate(keys) if old_values[key] != rows[row]]
+        )
+
+    def _emit_changed(self, changed_rows: List[int]) -> None:
+        """Emit one dataChanged per run of consecutive changed rows."""
+        last_column = len(self.headers) - 1
+        start = previous = None
+        for row in changed_rows:
+            if start is not None and row != previous + 1:
+                self.dataChanged.emit(self.index(start, 0), self.index(previous, last_column))
+                start = None
+            if start is None:
+                start = row
+            previous = row
+        if start is not None:
+            self.dataChanged.emit(self.index(start, 0), self.index(previous, last_column))
+
+
+class StandingsModel(DiffTableModel):
+    """Division standings, one row per team, keyed by team name."""
+
+    headers = ("Position", "Team", "W", "L", "Win%", "Streak", "+/-", "Points", "Last 5")
+
+    TEAM_COLUMN = 1
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.TextAlignmentRole and index.isValid()
+                and index.column() != self.TEAM_COLUMN):
+            return Qt.AlignmentFlag.AlignCenter
+        return super().data(index, role)
+
+    def update_standings(self, standings: List[Dict]) -> None:
+        """Show standings as returned by Division.get_standings."""
+        keys = []
+        rows = []
+        for pos, team_stats in enumerate(standings):
+            streak = team_stats['streak']
+            diff = team_stats['game_diff']
+            keys.append(team_stats['team'].name)
+            rows.append((
+                str(pos + 1),
+                team_stats['team'].name,
+                str(team_stats['wins']),
+                str(team_stats['losses']),
+                f"{team_stats['win_rate']:.1f}%",
+                f"W{streak}" if streak > 0 else f"L{abs(streak)}",
+                f"+{diff}" if diff > 0 else str(diff),
+                str(team_stats['points']),
+                "---"  # Last 5 matches (placeholder for now)
+            ))
+        self.set_rows(keys, rows)
+
+
+class ScheduleModel(DiffTableModel):
+    """Match schedule grouped by week and date.
+
+    Besides one row per match there is a blank row between weeks and a
+    header row for each date, both drawn on a dark background.
+    """
+
+    headers = ("Week", "Day", "Home", "Away", "Score", "Status")
+
+    LEFT_COLUMNS = (1, 2, 3)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._matches: Dict[Hashable, Match] = {}
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        key = self._keys[index.row()]
+        is_match = key[0] == 'match'
+        if role == Qt.ItemDataRole.BackgroundRole and not is_match:
+            return HEADER_BACKGROUND
+        if role == Qt.ItemDataRole.TextAlignmentRole and is_match \
+                and index.column() not in self.LEFT_COLUMNS:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == MatchRole:
+            return self._matches.get(key)
+        return super().data(index, role)
+
+    def match_at(self, row: int) -> Optional[Match]:
+        """The match shown on row, or None for week and date rows."""
+        if 0 <= row < len(self._keys):
+            return self._matches.get(self._keys[row])
+        return None
+
+    def update_schedule(self, matches: List[Match], current_week: int) -> None:
+        """Show matches; current_week is the number of weeks already played."""
+        sorted_matches = sorted(matches, key=lambda m: m.match_date)
+        keys = []
+        rows = []
+        self._matches = {}
+
+        shown_week = None
+        shown_date = None
+        for match in sorted_matches:
+            # Calculate week number (1-based)
+            week_num = (match.match_date - sorted_matches[0].match_date).days // 7 + 1
+            date_str = match.match_date.strftime("%a %Y-%m-%d")
+
+            # Blank row before each new week
+            if week_num != shown_week:
+                if shown_week is not None:
+                    keys.append(('week', week_num))
+                    rows.append(("",) * len(self.headers))
+                shown_week = week_num
+                shown_date = None
+
+            # Header row for each new date
+            if date_str != shown_date:
+                shown_date = date_str
+                keys.append(('date', date_str))
+                rows.append(("", date_str, "", "", "", ""))
+
+            score = "-"
+            status = "Upcoming"
+            if match.result:
+                score = f"{match.result.winner_score}-{match.result.loser_score}"
+                status = "Completed"
+            elif week_num == current_week + 1:
+                status = "Next"
+
+            key = ('match', id(match))
+            self._matches[key] = match
+            keys.append(key)
+            rows.append((str(week_num), "", match.team1.name, match.team2.name, score, status))
+
+        self.set_rows(keys, rows)
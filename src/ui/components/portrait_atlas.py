@@ -0,0 +1,153 @@
+"""Champion portrait atlas: every portrait packed into one pre-scaled image.
+
+Build the atlas with:
+
+    python -m src.ui.components.portrait_atlas [source_dir] [output_dir]
+
+The output directory gets ATLAS_IMAGE and a small JSON index of where each
+portrait file sits in it. When both files are present in the portraits
+directory, PortraitCache slices portraits out of the atlas instead of
+opening and decoding the loose files.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import QCoreApplication, QRect, Qt
+from PyQt6.QtGui import QImage, QPainter
+
+from .portrait_cache import ICON_SIZE
+from ...utils.champion_assets import ChampionAssets
+
+
+ATLAS_IMAGE = "portraits_atlas.webp"
+ATLAS_INDEX = "portraits_atlas.json"
+ATLAS_VERSION = 1
+
+
+def build_atlas(source_dir: str, output_dir: str, cell_size: int = ICON_SIZE,
+                quality: int = 90) -> Tuple[str, str]:
+    """Pack every portrait in source_dir into one atlas image plus index.
+
+    Args:
+        source_dir: Directory of *Square.webp portraits
+        output_dir: Directory the atlas image and index are written to
+        cell_size: Size of each portrait in the atlas; the largest size the UI shows
+        quality: WebP quality of the atlas image
+
+    Returns:
+        Paths of the atlas image and the index
+    """
+    filenames = sorted(
+        name for name in os.listdir(source_dir)
+        if name.endswith("Square.webp")
+    )
+    if not filenames:
+        raise FileNotFoundError(f"No portraits found in {source_dir}")
+
+    columns = math.ceil(math.sqrt(len(filenames)))
+    rows = math.ceil(len(filenames) / columns)
+    atlas = QImage(columns * cell_size, rows * cell_size, QImage.Format.Format_ARGB32)
+    atlas.fill(Qt.GlobalColor.transparent)
+
+    portraits: Dict[str, list] = {}
+    painter = QPainter(atlas)
+    try:
+        for i, filename in enumerate(filenames):
+            image = QImage(os.path.join(source_dir, filename))
+            if image.isNull():
+                continue
+            image = image.scaled(cell_size, cell_size, Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+            x = (i % columns) * cell_size
+            y = (i // columns) * cell_size
+            painter.drawImage(x, y, image)
+            portraits[filename] = [x, y, image.width(), image.height()]
+    finally:
+        painter.end()
+
+    os.makedirs(output_dir, exist_ok=True)
+    image_path = os.path.join(output_dir, ATLAS_IMAGE)
+    index_path = os.path.join(output_dir, ATLAS_INDEX)
+    if not atlas.save(image_path, "WEBP", quality):
+        raise IOError(f"Could not write atlas image {image_path}")
+    with open(index_path, 'w') as f:
+        json.dump({
+            'version': ATLAS_VERSION,
+            'image': ATLAS_IMAGE,
+            'cell_size': cell_size,
+            'portraits': portraits
+        }, f, indent=1, sort_keys=True)
+    return image_path, index_path
+
+
+class PortraitAtlas:
+    """Loaded portrait atlas; slices pre-scaled portraits out of one image."""
+
+    def __init__(self, image: QImage, cell_size: int, portraits: Dict[str, QRect]):
+        self.atlas = image
+        self.cell_size = cell_size
+        self.portraits = portraits
+
+    @classmethod
+    def load(cls, directory: Optional[Path] = None) -> Optional['PortraitAtlas']:
+        """Load the atlas from directory (the portraits directory by default).
+
+        Returns None if there is no usable atlas there.
+        """
+        directory = Path(directory) if directory else ChampionAssets.get_portraits_dir()
+        index_path = directory / ATLAS_INDEX
+        if not index_path.exists():
+            return None
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get('version') != ATLAS_VERSION:
+            return None
+
+        image = QImage(str(directory / index['image']))
+        if image.isNull():
+            return None
+        portraits = {name: QRect(*rect) for name, rect in index['portraits'].items()}
+        return cls(image, index['cell_size'], portraits)
+
+    def __contains__(self, champion_name: str) -> bool:
+        return ChampionAssets.get_portrait_filename(champion_name) in self.portraits
+
+    def image(self, champion_name: str, size: int) -> Optional[QImage]:
+        """Get a champion's portrait scaled to size, or None if it isn't packed."""
+        rect = self.portraits.get(ChampionAssets.get_portrait_filename(champion_name))
+        if rect is None:
+            return None
+        image = self.atlas.copy(rect)
+        if size != self.cell_size:
+            image = image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        return image
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack champion portraits into an atlas")
+    parser.add_argument("source_dir", nargs="?", default=str(ChampionAssets.get_portraits_dir()))
+    parser.add_argument("output_dir", nargs="?", default="build/portrait_atlas")
+    parser.add_argument("--cell-size", type=int, default=ICON_SIZE)
+    parser.add_argument("--quality", type=int, default=90)
+    args = parser.parse_args(argv)
+
+    # Image format plugins are located through the application instance,
+    # which must stay alive until the atlas is written
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    image_path, index_path = build_atlas(args.source_dir, args.output_dir,
+                                         args.cell_size, args.quality)
+    del app
+    print(f"Wrote {image_path} and {index_path}")
+
+
+if __name__ == "__main__":
+    main()
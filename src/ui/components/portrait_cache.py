@@ -0,0 +1,134 @@
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon, QImage, QPixmap
+
+from ...utils.champion_assets import ChampionAssets
+
+
+# Portrait sizes the UI displays
+ICON_SIZE = 76  # Champion grid icons
+SLOT_SIZE = 70  # Pick and ban slots
+
+
+class _Entry:
+    __slots__ = ('image', 'pixmap')
+
+    def __init__(self, image: Optional[QImage]):
+        self.image = image
+        self.pixmap: Optional[QPixmap] = None
+
+
+class PortraitCache:
+    """LRU cache of decoded champion portraits, pre-scaled to each display size.
+
+    Decoding produces a QImage, which is safe to build on any thread, so the
+    portraits can be preloaded in the background while the title screen is
+    shown. QPixmaps must be made on the GUI thread; they are created from
+    the cached image on first use, which does not decode the file again.
+    Missing portraits are cached too, so they are only looked up once.
+
+    When a packed portrait atlas is installed next to the portraits, every
+    portrait is sliced out of it, so only one file is opened and decoded.
+    """
+
+    _instance: Optional['PortraitCache'] = None
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._preload_thread: Optional[threading.Thread] = None
+        self._atlas = None
+        self._atlas_loaded = False
+
+    @classmethod
+    def instance(cls) -> 'PortraitCache':
+        """Get the application-wide portrait cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, champion_name: str, size: int) -> _Entry:
+        key = (champion_name, size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        # Decode outside the lock so a preload doesn't block the GUI thread
+        entry = _Entry(self._decode(champion_name, size))
+
+        with self._lock:
+            # Another thread may have decoded it meanwhile; keep the first copy
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _get_atlas(self):
+        """Load the portrait atlas on first use; None if it isn't installed."""
+        # Imported here because the atlas module uses this module's sizes
+        from .portrait_atlas import PortraitAtlas
+
+        with self._lock:
+            if not self._atlas_loaded:
+                self._atlas = PortraitAtlas.load()
+                self._atlas_loaded = True
+            return self._atlas
+
+    def _decode(self, champion_name: str, size: int) -> Optional[QImage]:
+        atlas = self._get_atlas()
+        if atlas is not None and champion_name in atlas:
+            return atlas.image(champion_name, size)
+
+        try:
+            path = ChampionAssets.get_portrait_path(champion_name)
+        except FileNotFoundError:
+            return None
+        image = QImage(path)
+        if image.isNull():
+            return None
+        return image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation)
+
+    def image(self, champion_name: str, size: int) -> Optional[QImage]:
+        """Get the decoded portrait scaled to size (safe from any thread)."""
+        return self._entry(champion_name, size).image
+
+    def pixmap(self, champion_name: str, size: int) -> Optional[QPixmap]:
+        """Get the portrait as a pixmap scaled to size (GUI thread only)."""
+        entry = self._entry(champion_name, size)
+        if entry.pixmap is None and entry.image is not None:
+            entry.pixmap = QPixmap.fromImage(entry.image)
+        return entry.pixmap
+
+    def icon(self, champion_name: str, size: int = ICON_SIZE) -> Optional[QIcon]:
+        """Get the portrait as an icon (GUI thread only)."""
+        pixmap = self.pixmap(champion_name, size)
+        return QIcon(pixmap) if pixmap is not None else None
+
+    def preload(self, champion_names: Iterable[str],
+                sizes: Iterable[int] = (ICON_SIZE, SLOT_SIZE)) -> threading.Thread:
+        """Decode portraits on a background thread; returns the running thread."""
+        if self._preload_thread is not None and self._preload_thread.is_alive():
+            return self._preload_thread
+
+        names: List[str] = list(champion_names)
+        sizes = list(sizes)
+
+        def run():
+            for name in names:
+                for size in sizes:
+                    self._entry(name, size)
+
+        self._preload_thread = threading.Thread(target=run, name="portrait-preload", daemon=True)
+        self._preload_thread.start()
+        return self._preload_thread
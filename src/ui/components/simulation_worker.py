@@ -0,0 +1,114 @@
+import threading
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from ...models.league import League, SeasonPhase
+from ...models.match import MatchResult
+
+
+WeekResults = Dict[str, Dict[str, List[MatchResult]]]
+
+
+def remaining_regular_season_weeks(league: League) -> int:
+    """Number of scheduled regular season weeks the league has not played yet."""
+    division = league.divisions.get("Regular Season")
+    if not league.current_season or not division or len(division.teams) < 2:
+        return 0
+    matches_per_week = len(division.teams) // 2 * 2
+    total_weeks = -(-len(division.matches) // matches_per_week)
+    return max(0, total_weeks - league.current_season.current_week)
+
+
+class SimulationWorker(QObject):
+    """Simulate league weeks on a background thread.
+
+    Move the worker to a QThread (see start_simulation) and connect to its
+    signals; they are delivered on the GUI thread. The game state is
+    modified from the worker thread, so the run holds
+    game_state.simulation_lock and views check game_state.simulating
+    before reading or changing it. The lock is released before finished
+    or failed is emitted.
+
+    Cancelling takes effect between weeks, so every league always finishes
+    the week it started.
+    """
+
+    # steps done, total steps, description of the step just finished
+    progress = pyqtSignal(int, int, str)
+    # list of per-week results, True if the run was cancelled
+    finished = pyqtSignal(object, bool)
+    failed = pyqtSignal(str)
+
+    def __init__(self, game_state, weeks: int = 1, until_playoffs: bool = False):
+        """Prepare a simulation run.
+
+        Args:
+            game_state: GameState to simulate
+            weeks: Number of weeks to simulate
+            until_playoffs: Keep going until the player's league has played
+                every scheduled regular season week (overrides weeks)
+        """
+        super().__init__()
+        self.game_state = game_state
+        self.weeks = weeks
+        if until_playoffs and game_state.league:
+            self.weeks = max(1, remaining_regular_season_weeks(game_state.league))
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Ask the run to stop after the week in progress (thread-safe)."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def run(self):
+        """Simulate the requested weeks; runs on the worker thread."""
+        leagues = len(self.game_state.other_leagues) + (1 if self.game_state.league else 0)
+        total_steps = max(1, self.weeks * leagues)
+        weekly_results: List[WeekResults] = []
+
+        if not self.game_state.simulation_lock.acquire(blocking=False):
+            self.failed.emit("A simulation is already running")
+            return
+
+        error = None
+        try:
+            for week in range(self.weeks):
+                if self.cancelled:
+                    break
+
+                def on_league(name, results, done, total, week=week):
+                    self.progress.emit(week * leagues + done, total_steps,
+                                       f"Week {week + 1}/{self.weeks}: {name}")
+
+                week_results = self.game_state.simulate_all_leagues(on_league=on_league)
+                weekly_results.append(week_results)
+
+                league = self.game_state.league
+                if league and league.current_season.phase != SeasonPhase.REGULAR_SEASON:
+                    break
+        except Exception as e:
+            error = str(e)
+        finally:
+            self.game_state.simulation_lock.release()
+
+        if error is not None:
+            self.failed.emit(error)
+        else:
+            self.finished.emit(weekly_results, self.cancelled)
+
+
+def start_simulation(worker: SimulationWorker, parent: Optional[QObject] = None) -> QThread:
+    """Run worker on a new QThread that cleans itself up when the run ends."""
+    thread = QThread(parent)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    worker.finished.connect(thread.quit)
+    worker.failed.connect(thread.quit)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+    thread.start()
+    return thread
@@ -1,28 +1,26 @@
+from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from src.ui.screens.title_screen import TitleScreen
-from src.ui.screens.new_game_screen import NewGameScreen
-from src.ui.screens.load_game_screen import LoadGameScreen
-from src.ui.screens.settings_screen import SettingsScreen
-from src.ui.screens.team_setup_screen import TeamSetupScreen
-from src.ui.screens.main_hub_screen import MainHubScreen
-from src.ui.screens.match_preview_screen import MatchPreviewScreen
-from src.ui.screens.match_simulation_screen import MatchSimulationScreen
-from src.ui.screens.draft_screen import DraftScreen
-from src.ui.screens.league_view import LeagueView
-from src.game.game_state import GameState
-from src.models.match import Match
+
+# Every other screen, the game state and the data modules behind them are
+# imported on first navigation, so only the title screen loads at startup
+if TYPE_CHECKING:
+    from src.game.game_state import GameState
+    from src.models.match import Match
 
 
 class MainWindow(QMainWindow):
+    first_painted = pyqtSignal()  # Emitted once, after the first frame is drawn
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("League of Legends Manager")
         self.setMinimumSize(1024, 768)  # Set minimum window size
         
-        # Initialize game state
-        self.game_state = GameState()
-        print("Game state initialized")  # Debug print
+        # Game state is created on first use
+        self._game_state = None
+        self._painted = False
         
         # Initialize player's team
         self.player_team = None
@@ -31,28 +29,57 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
         
-        # Initialize screens
+        # Initialize screens; all but the title screen are created when needed
         self.title_screen = TitleScreen(self)
-        self.new_game_screen = NewGameScreen(self)
-        self.load_game_screen = LoadGameScreen(self)
-        self.settings_screen = SettingsScreen(self)
-        self.team_setup_screen = None  # Will be initialized when needed
-        self.main_hub_screen = None  # Will be initialized when needed
-        self.draft_screen = None  # Will be initialized when needed
-        
-        # Add screens to stacked widget
-        self.stacked_widget.addWidget(self.title_screen)
-        self.stacked_widget.addWidget(self.new_game_screen)
-        self.stacked_widget.addWidget(self.load_game_screen)
-        self.stacked_widget.addWidget(self.settings_screen)
+        self.new_game_screen = None
+        self.load_game_screen = None
+        self.settings_screen = None
+        self.team_setup_screen = None
+        self.main_hub_screen = None
+        self.draft_screen = None
         
         # Show title screen by default
+        self.stacked_widget.addWidget(self.title_screen)
         self.stacked_widget.setCurrentWidget(self.title_screen)
-        print("Showing title screen")  # Debug print
+        self.first_painted.connect(self.title_screen.start_preload)
         
         # Center the window on the screen
         self.center_window()
     
+    @property
+    def game_state(self) -> 'GameState':
+        """The game state, created on first use."""
+        if self._game_state is None:
+            from src.game.game_state import GameState
+            self._game_state = GameState()
+        return self._game_state
+    
+    def closeEvent(self, event):
+        """Write the pending saves before the window goes."""
+        if self._game_state is not None:
+            if self._game_state.simulating:
+                # The worker is still writing to the save; cancel it first
+                event.ignore()
+                return
+            self._game_state.close_save()
+        super().closeEvent(event)
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            # Emit after the rest of this paint pass has finished
+            QTimer.singleShot(0, self.first_painted.emit)
+    
+    def _show_persistent_screen(self, attribute: str, create):
+        """Show a screen that is kept once made, creating it on first navigation."""
+        screen = getattr(self, attribute)
+        if screen is None:
+            screen = create()
+            setattr(self, attribute, screen)
+            self.stacked_widget.addWidget(screen)
+        self.stacked_widget.setCurrentWidget(screen)
+    
     def center_window(self):
         """Center the main window on the screen."""
         screen = QApplication.primaryScreen().geometry()
@@ -68,21 +95,25 @@ class MainWindow(QMainWindow):
     
     def show_new_game_screen(self):
         """Switch to new game screen."""
+        from src.ui.screens.new_game_screen import NewGameScreen
         print("Showing new game screen")  # Debug print
-        self.stacked_widget.setCurrentWidget(self.new_game_screen)
+        self._show_persistent_screen('new_game_screen', lambda: NewGameScreen(self))
     
     def show_load_game_screen(self):
         """Switch to load game screen."""
+        from src.ui.screens.load_game_screen import LoadGameScreen
         print("Showing load game screen")  # Debug print
-        self.stacked_widget.setCurrentWidget(self.load_game_screen)
+        self._show_persistent_screen('load_game_screen', lambda: LoadGameScreen(self))
     
     def show_settings_screen(self):
         """Switch to settings screen."""
+        from src.ui.screens.settings_screen import SettingsScreen
         print("Showing settings screen")  # Debug print
-        self.stacked_widget.setCurrentWidget(self.settings_screen)
+        self._show_persistent_screen('settings_screen', lambda: SettingsScreen(self))
     
     def show_team_setup_screen(self, selected_region):
         """Initialize and show the team setup screen with the selected region."""
+        from src.ui.screens.team_setup_screen import TeamSetupScreen
         print(f"Showing team setup screen for region: {selected_region}")  # Debug print
         
         # Remove existing team setup screen if it exists
@@ -97,20 +128,13 @@ class MainWindow(QMainWindow):
     
     def show_main_hub_screen(self):
         """Switch to main hub screen."""
-        print(f"Showing main hub screen. Current team: {self.game_state.current_team.name if self.game_state.current_team else 'None'}")  # Debug print
-        
-        # Remove existing main hub screen if it exists
-        if self.main_hub_screen:
-            self.stacked_widget.removeWidget(self.main_hub_screen)
-            self.main_hub_screen.deleteLater()
-        
-        # Create new main hub screen with current game state
-        self.main_hub_screen = MainHubScreen(self, self.game_state)
-        self.stacked_widget.addWidget(self.main_hub_screen)
-        self.stacked_widget.setCurrentWidget(self.main_hub_screen)
+        from src.ui.screens.main_hub_screen import MainHubScreen
+        # The hub stays alive and refreshes the panels whose data changed
+        self._show_persistent_screen('main_hub_screen', lambda: MainHubScreen(self, self.game_state))
     
-    def show_match_preview(self, match: Match):
+    def show_match_preview(self, match: 'Match'):
         """Show the match preview screen."""
+        from src.ui.screens.match_preview_screen import MatchPreviewScreen
         match_preview = MatchPreviewScreen(self, match)
         match_preview.match_started.connect(self.show_match_simulation)
         match_preview.draft_started.connect(self.show_draft_screen)  # Connect new signal
@@ -118,8 +142,9 @@ class MainWindow(QMainWindow):
         self.stacked_widget.addWidget(match_preview)
         self.stacked_widget.setCurrentWidget(match_preview)
 
-    def show_draft_screen(self, match: Match, team1_is_blue: bool):
+    def show_draft_screen(self, match: 'Match', team1_is_blue: bool):
         """Show the draft screen."""
+        from src.ui.screens.draft_screen import DraftScreen
         # Initialize draft state with correct team sides
         draft_state = match.start_draft(team1_is_blue)
         
@@ -130,7 +155,7 @@ class MainWindow(QMainWindow):
         self.stacked_widget.addWidget(self.draft_screen)
         self.stacked_widget.setCurrentWidget(self.draft_screen)
     
-    def handle_draft_completion(self, match: Match):
+    def handle_draft_completion(self, match: 'Match'):
         """Handle completion of draft phase."""
         # Remove draft screen
         if self.draft_screen:
@@ -140,14 +165,9 @@ class MainWindow(QMainWindow):
         # Show match simulation screen
         self.show_match_simulation(match)
     
-    def show_match_simulation(self, match: Match):
+    def show_match_simulation(self, match: 'Match'):
         """Show the match simulation screen."""
-        # Remove existing main hub screen
-        if self.main_hub_screen:
-            self.stacked_widget.removeWidget(self.main_hub_screen)
-            self.main_hub_screen.deleteLater()
-            self.main_hub_screen = None
-            
+        from src.ui.screens.match_simulation_screen import MatchSimulationScreen
         # Create and show match simulation screen
         match_simulation_screen = MatchSimulationScreen(self, match)
         self.stacked_widget.addWidget(match_simulation_screen)
@@ -156,8 +176,10 @@ class MainWindow(QMainWindow):
         # Connect match completed signal
         match_simulation_screen.match_completed.connect(self.show_match_result)
     
-    def show_match_result(self, match: Match):
+    def show_match_result(self, match: 'Match'):
         """Show the match result screen."""
+        from src.game.game_state import GameChange
+        from src.ui.screens.league_view import LeagueView
         # TODO: Implement match result screen
         print(f"Match completed: {match.result.winner.name} defeats {match.result.loser.name} {match.result.winner_score}-{match.result.loser_score}")
         
@@ -165,6 +187,7 @@ class MainWindow(QMainWindow):
         simulation_screen = self.stacked_widget.currentWidget()
         self.stacked_widget.removeWidget(simulation_screen)
         simulation_screen.deleteLater()
+        self.game_state.notify(GameChange.RESULTS)
         
         # Update league view if it exists
         league_view = self.findChild(LeagueView)
@@ -248,4 +271,10 @@ class MainWindow(QMainWindow):
         for league in self.game_state.other_leagues.values():
             league.start_new_season(split, start_date)
 
+        # Each new game saves to its own database as it is played
+        from src.game.game_state import GameChange, new_save_path
+        self.game_state.open_save(new_save_path(self.game_state.current_team.name))
+        
+        # A new team and season: everything the hub shows is stale
+        self.game_state.notify(*GameChange)
         self.show_main_hub_screen()
@@ -1,51 +1,17 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QComboBox, QGridLayout, QFrame,
-                             QScrollArea, QLineEdit, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
-from PyQt6.QtGui import QPixmap, QColor, QPalette, QFont, QIcon
+                             QLineEdit, QSizePolicy)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QColor, QPalette, QFont
 
 from ...models.draft import DraftState, DraftPhase, Champion
 from ...models.team import Team
 from ...models.player import Role
-from ...utils.champion_assets import ChampionAssets
+from ..components.portrait_cache import PortraitCache, SLOT_SIZE
+from ..components.champion_grid import (ChampionListModel, ChampionFilterProxy,
+                                        ChampionGridView, ChampionRole)
 from ...ai.draft_ai import DraftAI
-
-class ChampionIcon(QPushButton):
-    """Custom widget for champion icons in the selection grid."""
-    def __init__(self, champion: Champion, parent=None):
-        super().__init__(parent)
-        self.champion = champion
-        self.setFixedSize(80, 80)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #1a1a1a;
-                border: 1px solid #333333;
-                border-radius: 5px;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #2a2a2a;
-                border: 1px solid #666666;
-            }
-            QPushButton:disabled {
-                background-color: #0a0a0a;
-                border: 1px solid #222222;
-                opacity: 0.5;
-            }
-        """)
-        
-        try:
-            # Load champion portrait
-            portrait_path = ChampionAssets.get_portrait_path(champion.name)
-            icon = QIcon(portrait_path)
-            self.setIcon(icon)
-            self.setIconSize(QSize(76, 76))  # Slightly smaller than button size
-            
-            # Add tooltip with champion name
-            self.setToolTip(champion.name)
-        except FileNotFoundError:
-            # If portrait not found, fallback to text
-            self.setText(champion.name)
+from ...ai.win_probability import WinProbabilityEstimator
 
 class PickBanSlot(QFrame):
     """Custom widget for pick/ban slots."""
@@ -87,6 +53,10 @@ class DraftScreen(QWidget):
         self.search_bar = None
         self.phase_label = None
         self.timer_label = None
+        self.win_prob_label = None
+        self.win_estimator = WinProbabilityEstimator(
+            draft_state, DraftAI.get_scorer(draft_state.registry)
+        )
         self.init_ui()
         
     def init_ui(self):
@@ -188,6 +158,17 @@ class DraftScreen(QWidget):
         """)
         layout.addWidget(self.phase_label)
         
+        # Estimated win chance, or the what-if for the hovered champion
+        self.win_prob_label = QLabel()
+        self.win_prob_label.setStyleSheet("""
+            QLabel {
+                color: #cccccc;
+                font-size: 14px;
+                margin: 0 20px;
+            }
+        """)
+        layout.addWidget(self.win_prob_label)
+        
         # Timer label
         self.timer_label = QLabel("30")
         self.timer_label.setStyleSheet("""
@@ -297,14 +278,19 @@ class DraftScreen(QWidget):
         role_layout.addStretch()
         layout.addLayout(role_layout)
         
-        # Champion grid in a scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
+        # Champion grid: one model row per champion, filtered by a proxy
+        self.champion_model = ChampionListModel(self.draft_state, self)
+        self.champion_proxy = ChampionFilterProxy(self.draft_state, self)
+        self.champion_proxy.setSourceModel(self.champion_model)
+        
+        self.champion_view = ChampionGridView()
+        self.champion_view.setModel(self.champion_proxy)
+        self.champion_view.clicked.connect(
+            lambda index: self._handle_champion_click(index.data(ChampionRole))
+        )
+        self.champion_view.hovered.connect(self._show_what_if)
+        self.champion_view.unhovered.connect(self._update_win_probability)
+        self.champion_view.verticalScrollBar().setStyleSheet("""
             QScrollBar:vertical {
                 border: none;
                 background: #2a2a2a;
@@ -320,88 +306,27 @@ class DraftScreen(QWidget):
                 height: 0px;
             }
         """)
-        
-        # Create widget for the grid
-        grid_widget = QWidget()
-        self.champion_grid = QGridLayout()
-        self.champion_grid.setSpacing(5)
-        self.champion_grid.setContentsMargins(5, 5, 5, 5)
-        
-        # Add champions to grid
-        self._populate_champion_grid()
-        
-        grid_widget.setLayout(self.champion_grid)
-        scroll_area.setWidget(grid_widget)
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.champion_view)
         
         return layout
 
-    def _populate_champion_grid(self, filter_text: str = "", role: Role = None):
-        """Populate the champion grid with filtered champions."""
-        # Clear existing grid
-        while self.champion_grid.count():
-            item = self.champion_grid.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Get filtered champions
-        champions = self.draft_state.get_available_champions(filter_text, role)
-        row = 0
-        col = 0
-        max_cols = 6
-        
-        # Sort champions alphabetically
-        sorted_champions = sorted(champions, key=lambda x: x.name)
-        
-        # Get current role needed if in pick phase
-        current_team = self.draft_state.get_current_team()
-        needed_role = None
-        if self.draft_state.current_phase in [DraftPhase.PICK_PHASE_1, DraftPhase.PICK_PHASE_2]:
-            needed_role = self.draft_state.get_next_role_to_pick(current_team)
-        
-        for champion in sorted_champions:
-            # Create champion icon
-            icon = ChampionIcon(champion)
-            
-            # Connect click handler with proper champion reference
-            icon.clicked.connect(lambda checked, ch=champion: self._handle_champion_click(ch))
-            
-            # Disable if champion is banned, picked, or doesn't fit needed role
-            if champion.banned or champion.picked:
-                icon.setEnabled(False)
-                icon.setStyleSheet(icon.styleSheet() + """
-                    QPushButton:disabled {
-                        opacity: 0.5;
-                    }
-                """)
-            elif needed_role and needed_role not in champion.roles:
-                icon.setEnabled(False)
-                icon.setStyleSheet(icon.styleSheet() + """
-                    QPushButton:disabled {
-                        opacity: 0.3;
-                        background-color: #3a3a3a;
-                    }
-                """)
-            
-            self.champion_grid.addWidget(icon, row, col)
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+    def _current_role_filter(self):
+        """Get the role whose filter button is checked, if any."""
+        return next((role for role, btn in self.role_buttons.items() if btn.isChecked()), None)
 
     def _filter_champions(self, text: str):
         """Filter champions based on search text."""
-        self._populate_champion_grid(filter_text=text)
+        self.champion_proxy.set_filter(text, self._current_role_filter())
 
     def _filter_by_role(self, role: Role, checked: bool):
         """Filter champions by role."""
         # Uncheck other role buttons if this one is checked
         if checked:
-            for button in self.findChildren(QPushButton):
-                if button.isCheckable() and button != self.sender():
+            for button in self.role_buttons.values():
+                if button != self.sender():
                     button.setChecked(False)
         
-        self._populate_champion_grid(role=role if checked else None)
+        self.champion_proxy.set_filter(self.search_bar.text(), role if checked else None)
 
     def _handle_champion_click(self, champion: Champion):
         """Handle champion selection."""
@@ -432,6 +357,7 @@ class DraftScreen(QWidget):
         if success:
             # Reset selection
             self.selected_champion = None
+            self.champion_view.clearSelection()
             self.lock_in_button.setEnabled(False)
             
             # Update UI
@@ -516,12 +442,27 @@ class DraftScreen(QWidget):
         # Update pick/ban slots
         self._update_pick_slots()
         self._update_ban_slots()
+        self._update_win_probability()
         
-        # Refresh champion grid to show updated availability
-        current_text = self.search_bar.text() if hasattr(self, 'search_bar') else ""
-        current_role = next((role for role, btn in self.role_buttons.items() 
-                           if btn.isChecked()), None) if hasattr(self, 'role_buttons') else None
-        self._populate_champion_grid(current_text, current_role)
+        # Repaint only the champions whose availability changed
+        self.champion_model.refresh_state()
+
+    def _format_win_probability(self, blue_chance: float) -> str:
+        blue = round(blue_chance * 100)
+        return (f"{self.draft_state.blue_team.name} {blue}% - "
+                f"{100 - blue}% {self.draft_state.red_team.name}")
+
+    def _update_win_probability(self):
+        """Show the current estimated win chance."""
+        self.win_prob_label.setText(self._format_win_probability(self.win_estimator.update()))
+
+    def _show_what_if(self, champion: Champion):
+        """Preview the win chance if the champion under the cursor were picked."""
+        blue_chance = self.win_estimator.preview(champion)
+        if blue_chance is None:
+            self._update_win_probability()
+            return
+        self.win_prob_label.setText(f"If {champion.name}: {self._format_win_probability(blue_chance)}")
 
     def _update_pick_slots(self):
         """Update the pick slots with current picks."""
@@ -543,12 +484,11 @@ class DraftScreen(QWidget):
             for i in reversed(range(slot.layout().count())):
                 slot.layout().itemAt(i).widget().deleteLater()
             
-            try:
+            pixmap = PortraitCache.instance().pixmap(pick.champion.name, SLOT_SIZE)
+            if pixmap:
                 # Add champion portrait
-                portrait_path = ChampionAssets.get_portrait_path(pick.champion.name)
-                pixmap = QPixmap(portrait_path)
                 label = QLabel()
-                label.setPixmap(pixmap.scaled(70, 70, Qt.AspectRatioMode.KeepAspectRatio))
+                label.setPixmap(pixmap)
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 slot.layout().addWidget(label)
                 
@@ -557,7 +497,7 @@ class DraftScreen(QWidget):
                 name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 name_label.setStyleSheet("color: white;")
                 slot.layout().addWidget(name_label)
-            except FileNotFoundError:
+            else:
                 # Fallback to text only
                 label = QLabel(f"{pick.champion.name}\n{pick.player.role.value}")
                 label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -591,12 +531,11 @@ class DraftScreen(QWidget):
                 for i in reversed(range(slot.layout().count())):
                     slot.layout().itemAt(i).widget().deleteLater()
                 
-                try:
+                pixmap = PortraitCache.instance().pixmap(ban.champion.name, SLOT_SIZE)
+                if pixmap:
                     # Add champion portrait
-                    portrait_path = ChampionAssets.get_portrait_path(ban.champion.name)
-                    pixmap = QPixmap(portrait_path)
                     label = QLabel()
-                    label.setPixmap(pixmap.scaled(70, 70, Qt.AspectRatioMode.KeepAspectRatio))
+                    label.setPixmap(pixmap)
                     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                     slot.layout().addWidget(label)
                     
@@ -605,7 +544,7 @@ class DraftScreen(QWidget):
                     name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                     name_label.setStyleSheet("color: white;")
                     slot.layout().addWidget(name_label)
-                except FileNotFoundError:
+                else:
                     # Fallback to text only
                     label = QLabel(ban.champion.name)
                     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -614,6 +553,4 @@ class DraftScreen(QWidget):
 
     def _enable_champion_selection(self, enable: bool):
         """Enable or disable champion selection."""
-        for widget in self.findChildren(QPushButton):
-            if isinstance(widget, ChampionIcon):
-                widget.setEnabled(enable)
+        self.champion_view.setEnabled(enable)
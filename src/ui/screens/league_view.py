@@ -1,192 +1,69 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QTableWidget, QTableWidgetItem, QLabel,
-    QPushButton, QComboBox, QHeaderView, QMessageBox
+    QTableView, QLabel,
+    QPushButton, QComboBox, QHeaderView, QMessageBox, QProgressDialog
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtGui import QFont
 from typing import Dict, List, Optional
 
+from ...game.game_state import GameChange
 from ...models.league import League, Division, SeasonPhase
 from ...models.team import Team
 from ...models.match import Match, MatchResult
+from ..components.league_tables import StandingsModel, ScheduleModel
+from ..components.simulation_worker import SimulationWorker, start_simulation
 
 
-class StandingsTable(QTableWidget):
+class StandingsTable(QTableView):
     def __init__(self):
         super().__init__()
+        self.standings_model = StandingsModel(self)
+        self.setModel(self.standings_model)
         self.setup_table()
     
     def setup_table(self):
-        """Configure table columns and headers."""
-        headers = [
-            "Position", "Team", "W", "L", "Win%", 
-            "Streak", "+/-", "Points", "Last 5"
-        ]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
+        """Configure column sizing."""
+        self.verticalHeader().setVisible(False)
         
         # Set column widths
-        self.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        for i in range(len(headers)):
-            if i != 1:  # All columns except team name
-                self.horizontalHeader().setSectionResizeMode(
-                    i, QHeaderView.ResizeMode.ResizeToContents
-                )
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(StandingsModel.TEAM_COLUMN, QHeaderView.ResizeMode.Stretch)
 
     def update_standings(self, standings: List[Dict]):
         """Update table with current standings."""
-        self.setRowCount(len(standings))
-        
-        for pos, team_stats in enumerate(standings):
-            team = team_stats['team']
-            
-            # Position
-            pos_item = QTableWidgetItem(str(pos + 1))
-            pos_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(pos, 0, pos_item)
-            
-            # Team name
-            team_item = QTableWidgetItem(team.name)
-            self.setItem(pos, 1, team_item)
-            
-            # Wins
-            wins_item = QTableWidgetItem(str(team_stats['wins']))
-            wins_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(pos, 2, wins_item)
-            
-            # Losses
-            losses_item = QTableWidgetItem(str(team_stats['losses']))
-            losses_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(pos, 3, losses_item)
-            
-            # Win Rate
-            winrate = f"{team_stats['win_rate']:.1f}%"
-            winrate_item = QTableWidgetItem(winrate)
-            winrate_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(pos, 4, winrate_item)
-            
-            # Streak
-            streak = team_stats['streak']
-            streak_text = f"W{streak}" if streak > 0 else f"L{abs(streak)}"
-            streak_item = QTableWidgetItem(streak_text)
-            streak_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(pos, 5, streak_item)
-            
-            # Game Differential
-            diff = team_stats['game_diff']
-            diff_text = f"+{diff}" if diff > 0 else str(diff)
-            diff_item = QTableWidgetItem(diff_text)
-            diff_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(pos, 6, diff_item)
-            
-            # Championship Points
-            points_item = QTableWidgetItem(str(team_stats['points']))
-            points_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(pos, 7, points_item)
-            
-            # Last 5 matches (placeholder for now)
-            last5_item = QTableWidgetItem("---")
-            last5_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(pos, 8, last5_item)
+        self.standings_model.update_standings(standings)
 
 
-class ScheduleTable(QTableWidget):
+class ScheduleTable(QTableView):
     match_selected = pyqtSignal(Match)
     
     def __init__(self):
         super().__init__()
+        self.schedule_model = ScheduleModel(self)
+        self.setModel(self.schedule_model)
         self.setup_table()
+        self.doubleClicked.connect(self._on_double_clicked)
     
     def setup_table(self):
-        """Configure table columns and headers."""
-        headers = ["Week", "Day", "Home", "Away", "Score", "Status"]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
+        """Configure column sizing."""
+        self.verticalHeader().setVisible(False)
         
         # Set column widths
-        self.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        self.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-        for i in [0, 1, 4, 5]:
-            self.horizontalHeader().setSectionResizeMode(
-                i, QHeaderView.ResizeMode.ResizeToContents
-            )
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
     
     def update_schedule(self, matches: List[Match], current_week: int):
         """Update table with match schedule."""
-        # Sort matches by date
-        sorted_matches = sorted(matches, key=lambda m: m.match_date)
-        self.setRowCount(len(sorted_matches))
-        
-        current_week = None
-        current_date = None
-        row_index = 0
-        
-        for match in sorted_matches:
-            # Calculate week number (1-based)
-            week_num = (match.match_date - sorted_matches[0].match_date).days // 7 + 1
-            date_str = match.match_date.strftime("%a %Y-%m-%d")
-            
-            # Add week header if new week
-            if week_num != current_week:
-                current_week = week_num
-                current_date = None
-                if row_index > 0:
-                    self.insertRow(row_index)
-                    self.set_empty_row(row_index)
-                    row_index += 1
-            
-            # Add date header if new date
-            if date_str != current_date:
-                current_date = date_str
-                self.insertRow(row_index)
-                date_item = QTableWidgetItem(date_str)
-                date_item.setBackground(QColor("#2a2a2a"))
-                self.setItem(row_index, 1, date_item)
-                self.set_empty_row(row_index, skip_date=True)
-                row_index += 1
-            
-            # Week
-            week_item = QTableWidgetItem(str(week_num))
-            week_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_index, 0, week_item)
-            
-            # Home Team
-            home_item = QTableWidgetItem(match.team1.name)
-            self.setItem(row_index, 2, home_item)
-            
-            # Away Team
-            away_item = QTableWidgetItem(match.team2.name)
-            self.setItem(row_index, 3, away_item)
-            
-            # Score
-            score_text = "-"
-            if match.result:
-                score_text = f"{match.result.winner_score}-{match.result.loser_score}"
-            score_item = QTableWidgetItem(score_text)
-            score_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_index, 4, score_item)
-            
-            # Status
-            status = "Upcoming"
-            if match.result:
-                status = "Completed"
-            elif week_num == current_week:
-                status = "Next"
-            status_item = QTableWidgetItem(status)
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row_index, 5, status_item)
-            
-            row_index += 1
+        self.schedule_model.update_schedule(matches, current_week)
     
-    def set_empty_row(self, row: int, skip_date: bool = False):
-        """Set empty items for a row to maintain consistent styling."""
-        for col in range(self.columnCount()):
-            if skip_date and col == 1:
-                continue
-            item = QTableWidgetItem("")
-            item.setBackground(QColor("#2a2a2a"))
-            self.setItem(row, col, item)
+    def _on_double_clicked(self, index):
+        match = self.schedule_model.match_at(index.row())
+        if match:
+            self.match_selected.emit(match)
 
 
 class LeagueView(QWidget):
@@ -194,6 +71,9 @@ class LeagueView(QWidget):
         super().__init__()
         self.league = league
         self.main_window = main_window
+        self.sim_worker = None
+        self.sim_thread = None
+        self.sim_progress = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -278,6 +158,13 @@ class LeagueView(QWidget):
         simulate_btn.clicked.connect(self.on_simulate_week)
         header_layout.addWidget(simulate_btn)
         
+        # Simulate to Playoffs button
+        simulate_all_btn = QPushButton("Simulate to Playoffs")
+        simulate_all_btn.setStyleSheet(simulate_btn.styleSheet())
+        simulate_all_btn.clicked.connect(self.on_simulate_to_playoffs)
+        header_layout.addWidget(simulate_all_btn)
+        self.simulate_buttons = [simulate_btn, simulate_all_btn]
+        
         layout.addLayout(header_layout)
         
         # Tabs for different views
@@ -358,6 +245,19 @@ class LeagueView(QWidget):
 
     def on_simulate_week(self):
         """Simulate all matches for the current week."""
+        self._start_simulation(weeks=1)
+    
+    def on_simulate_to_playoffs(self):
+        """Simulate the rest of the regular season."""
+        self._start_simulation(until_playoffs=True)
+    
+    def _start_simulation(self, weeks: int = 1, until_playoffs: bool = False):
+        """Run the simulation on a worker thread and show its progress."""
+        if self.sim_thread is not None:
+            return
+        if self.main_window.game_state and self.main_window.game_state.simulating:
+            return
+        
         try:
             # Get game state from main window
             game_state = self.main_window.game_state
@@ -368,30 +268,89 @@ class LeagueView(QWidget):
             player_team = game_state.current_team
             if not player_team:
                 raise ValueError("Player team not initialized")
-            
-            # Simulate all leagues
-            all_results = game_state.simulate_all_leagues()
-            self.update_view()
-            
-            # Show results in a message box
-            result_text = "Match Results:\n\n"
-            for league_name, league_results in all_results.items():
-                result_text += f"{league_name}:\n"
-                for division_name, division_results in league_results.items():
-                    if division_results:  # Only show divisions with results
-                        result_text += f"{division_name} Division:\n"
-                        for result in division_results:
-                            result_text += f"{result.winner.name} def. {result.loser.name} ({result.winner_score}-{result.loser_score})\n"
-                        result_text += "\n"
-                result_text += "\n"
-            
-            if not any(any(results.values()) for results in all_results.values()):
-                result_text = "No matches to simulate this week."
-            
-            QMessageBox.information(self, "Week Simulated", result_text)
-            
         except ValueError as e:
             QMessageBox.warning(self, "Error", str(e))
+            return
+        
+        self.sim_worker = SimulationWorker(game_state, weeks=weeks, until_playoffs=until_playoffs)
+        
+        # The worker owns the game state until it finishes, so block the window
+        self.sim_progress = QProgressDialog("Simulating...", "Cancel", 0, 0, self)
+        self.sim_progress.setWindowTitle("Simulating")
+        self.sim_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.sim_progress.setMinimumDuration(0)
+        self.sim_progress.canceled.connect(self.sim_worker.cancel)
+        for button in self.simulate_buttons:
+            button.setEnabled(False)
+        
+        self.sim_worker.progress.connect(self._on_simulation_progress)
+        self.sim_worker.finished.connect(self._on_simulation_finished)
+        self.sim_worker.failed.connect(self._on_simulation_failed)
+        self.sim_thread = start_simulation(self.sim_worker, self)
+    
+    def _on_simulation_progress(self, done: int, total: int, label: str):
+        if self.sim_progress:
+            self.sim_progress.setMaximum(total)
+            self.sim_progress.setValue(done)
+            self.sim_progress.setLabelText(label)
+    
+    def _end_simulation(self):
+        """Release the game state back to the view."""
+        if self.sim_progress:
+            self.sim_progress.reset()
+            self.sim_progress.deleteLater()
+        self.sim_progress = None
+        self.sim_worker = None
+        self.sim_thread = None
+        for button in self.simulate_buttons:
+            button.setEnabled(True)
+    
+    def _on_simulation_finished(self, weekly_results: list, cancelled: bool):
+        """Apply finished results to the view and summarize them."""
+        self._end_simulation()
+        # Listeners are told on the GUI thread, now that the worker is done
+        self.main_window.game_state.notify(GameChange.RESULTS, GameChange.FINANCES)
+        self.update_view()
+        if self.league.current_season and hasattr(self, 'season_info'):
+            self.season_info.setText(
+                f"{self.league.current_season.split.value} Split {self.league.current_season.year} - "
+                f"Week {self.league.current_season.current_week + 1}"
+            )
+        
+        # Summarize every league, but only list the shown league's results
+        total_matches = 0
+        league_lines = []
+        for week_results in weekly_results:
+            for league_name, league_results in week_results.items():
+                for division_name, division_results in league_results.items():
+                    total_matches += len(division_results)
+                    if league_name == self.league.name:
+                        league_lines.extend(
+                            f"{r.winner.name} def. {r.loser.name} ({r.winner_score}-{r.loser_score})"
+                            for r in division_results
+                        )
+        
+        if not total_matches:
+            result_text = "No matches to simulate this week."
+        else:
+            result_text = f"Simulated {total_matches} matches over {len(weekly_results)} week(s)."
+            if cancelled:
+                result_text += "\nSimulation was cancelled after the last complete week."
+            if league_lines:
+                # Keep the dialog a readable size for multi-week runs
+                shown = league_lines[-20:]
+                result_text += f"\n\n{self.league.name}:\n" + "\n".join(shown)
+                if len(league_lines) > len(shown):
+                    result_text += f"\n... and {len(league_lines) - len(shown)} earlier results"
+        
+        QMessageBox.information(self, "Week Simulated", result_text)
+    
+    def _on_simulation_failed(self, message: str):
+        self._end_simulation()
+        # Matches played before the failure still count
+        self.main_window.game_state.notify(GameChange.RESULTS, GameChange.FINANCES)
+        self.update_view()
+        QMessageBox.warning(self, "Error", message)
     
     def view_playoffs(self):
         """Switch to playoff view."""
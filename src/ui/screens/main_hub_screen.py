@@ -1,131 +1,120 @@
+from typing import Optional
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                QLabel, QFrame, QGridLayout, QScrollArea, QTableWidget,
                                QTableWidgetItem, QProgressBar, QTabWidget, QGroupBox)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 
-from src.game.game_state import GameState
+from src.game.game_state import GameChange, GameState
 from src.database.db_manager import DatabaseManager
 from src.models.player import Player, PlayerStats, Role
 from src.models.match import Match
 from src.models.team import Team
 from src.ui.screens.league_view import LeagueView, ScheduleTable
 
+# Hub panels and the game state changes that make each one stale
+PANEL_DEPENDENCIES = {
+    'header': {GameChange.ROSTER},
+    'standing': {GameChange.RESULTS},
+    'budget': {GameChange.FINANCES},
+    'performance': {GameChange.ROSTER, GameChange.RESULTS},
+    'results': {GameChange.RESULTS},
+    'roster': {GameChange.ROSTER},
+    'schedule': {GameChange.RESULTS},
+    'finances': {GameChange.FINANCES},
+    'facilities': {GameChange.FINANCES},
+}
+
+# Rows of the key stats grid
+POSITION_ROW, SEASON_ROW, WIN_RATE_ROW, BUDGET_ROW = range(4)
+
+
+def _set_cell(table: QTableWidget, row: int, column: int, text: str, color: Optional[str] = None):
+    """Set a table cell, leaving it alone if it already shows text."""
+    item = table.item(row, column)
+    if item is None:
+        item = QTableWidgetItem(text)
+        table.setItem(row, column, item)
+    elif item.text() != text:
+        item.setText(text)
+    if color is not None and item.foreground().color() != QColor(color):
+        item.setForeground(QColor(color))
+
+
 class MainHubScreen(QWidget):
+    """The team's home screen.
+    
+    Panels are refreshed from the game state only when a GameChange they
+    depend on (see PANEL_DEPENDENCIES) has been notified since they were
+    last shown, so coming back to the hub is cheap when nothing happened.
+    """
+    
     def __init__(self, main_window, game_state: GameState = None):
         super().__init__()
         self.main_window = main_window
         self.game_state = game_state
+        # Every panel starts out stale
+        self.dirty_panels = set(PANEL_DEPENDENCIES)
         self.init_ui()
-        # Call update_ui after initialization
-        self.update_ui()
+        if self.game_state:
+            self.game_state.subscribe(self.on_game_changed)
+        self.refresh()
 
     def showEvent(self, event):
         """Called when the screen becomes visible."""
         super().showEvent(event)
-        # Update UI whenever screen is shown
-        self.update_ui()
+        # Catch up on whatever changed while the hub was hidden
+        self.refresh()
+
+    def on_game_changed(self, change: GameChange):
+        """Mark the panels that depend on change as stale."""
+        self.dirty_panels.update(
+            panel for panel, changes in PANEL_DEPENDENCIES.items() if change in changes
+        )
+        if self.isVisible():
+            self.refresh()
+
+    def refresh(self):
+        """Recompute and repaint the stale panels."""
+        if not self.dirty_panels or not self.game_state or not self.game_state.current_team:
+            return
+        if self.game_state.simulating:
+            # The panels stay dirty until the finished run notifies again
+            return
+        
+        dirty, self.dirty_panels = self.dirty_panels, set()
+        for panel in PANEL_DEPENDENCIES:
+            if panel in dirty:
+                getattr(self, f'update_{panel}')()
 
     def update_ui(self):
         """Update all UI elements with current game state."""
-        if not self.game_state or not self.game_state.current_team:
-            print("No game state or team available")
-            return
+        self.dirty_panels = set(PANEL_DEPENDENCIES)
+        self.refresh()
 
-        team = self.game_state.current_team
-        print(f"Updating UI with team: {team.name}")
+    def _set_stat(self, row: int, value: str):
+        self.stats_grid.itemAtPosition(row, 1).widget().setText(value)
 
-        # Update header
+    def update_header(self):
+        """Update the team name and region."""
+        team = self.game_state.current_team
         self.team_name_label.setText(team.name)
         self.team_region_label.setText(f"Region: {team.region}")
 
-        # Update key stats
-        stats = [
-            ("League Position", self.game_state.get_league_position()),
-            ("Season", self.game_state.season),
-            ("Win Rate", f"{self.game_state.get_win_rate():.1f}%"),
-            ("Budget", f"${team.budget:,}")
-        ]
-
-        for i, (label, value) in enumerate(stats):
-            self.stats_grid.itemAtPosition(i, 1).widget().setText(value)
-
-        # Update performance metrics
-        self.update_performance_metrics()
+    def update_standing(self):
+        """Update league position, season and win rate."""
+        self._set_stat(POSITION_ROW, self.game_state.get_league_position())
+        self._set_stat(SEASON_ROW, self.game_state.season)
+        self._set_stat(WIN_RATE_ROW, f"{self.game_state.get_win_rate():.1f}%")
 
-        # Update recent results
-        results = self.game_state.get_recent_results()
-        
-        # Clear existing items first
-        for row in range(self.results_table.rowCount()):
-            for col in range(self.results_table.columnCount()):
-                self.results_table.setItem(row, col, QTableWidgetItem(""))
-        
-        # Add new results
-        for i, result in enumerate(results):
-            if i < self.results_table.rowCount():  # Make sure we don't exceed table rows
-                self.results_table.setItem(i, 0, QTableWidgetItem(result["date"]))
-                self.results_table.setItem(i, 1, QTableWidgetItem(result["opponent"]))
-                self.results_table.setItem(i, 2, QTableWidgetItem(result["score"]))
-                result_item = QTableWidgetItem(result["result"])
-                result_item.setForeground(QColor("#4CAF50" if result["result"] == "WIN" else "#F44336"))
-                self.results_table.setItem(i, 3, result_item)
-
-        # Update roster
-        self.update_roster_table()
-
-        # Update schedule
-        if (hasattr(self.game_state, 'league') and 
-            self.game_state.league and 
-            self.game_state.league.current_season and
-            self.game_state.current_team):
-            
-            league = self.game_state.league
-            current_week = league.current_season.current_week
-            current_team = self.game_state.current_team
-            
-            # Get all matches from all divisions
-            team_matches = []
-            
-            # First get all matches from the league
-            for division in league.divisions.values():
-                if division and division.matches:
-                    # Filter matches involving the player's team
-                    division_matches = [
-                        match for match in division.matches 
-                        if match.team1 == current_team or match.team2 == current_team
-                    ]
-                    team_matches.extend(division_matches)
-            
-            # Sort matches by date
-            if team_matches:
-                team_matches.sort(key=lambda m: m.match_date)
-                self.schedule_table.update_schedule(team_matches, current_week)
-                print(f"Found {len(team_matches)} matches for team {current_team.name}")  # Debug print
-            else:
-                print(f"No matches found for team: {current_team.name}")  # Debug print
-                print(f"League: {league.name}, Season: {league.current_season.split}")
-                print(f"Divisions: {[d.name for d in league.divisions.values()]}")
-                for div in league.divisions.values():
-                    print(f"Division {div.name} has {len(div.matches)} matches")
-
-        # Update finances
-        finances = self.game_state.get_financial_overview()
-        for i, (label, value) in enumerate(finances.items()):
-            self.finance_grid.itemAtPosition(i, 1).widget().setText(value)
-
-        # Update facilities
-        facilities = self.game_state.get_facility_levels()
-        for facility, level in facilities.items():
-            self.facility_bars[facility].setValue(level)
+    def update_budget(self):
+        """Update the budget in the key stats."""
+        self._set_stat(BUDGET_ROW, f"${self.game_state.current_team.budget:,}")
 
-    def update_performance_metrics(self):
+    def update_performance(self):
         """Update the performance metrics display."""
-        if not self.game_state or not self.game_state.current_team:
-            return
-            
         performance = self.game_state.get_team_performance()
-        print(f"Team performance metrics: {performance}")  # Debug print
         
         # Update progress bars
         self.synergy_bar.setValue(int(performance["synergy"]))
@@ -139,43 +128,69 @@ class MainHubScreen(QWidget):
         self.form_label.setText(f"Current Form: {performance['form']}%")
         self.overall_label.setText(f"Overall Performance: {performance['overall']}%")
 
-    def update_roster_table(self):
+    def update_results(self):
+        """Update the recent results table."""
+        results = self.game_state.get_recent_results()
+        
+        for row in range(self.results_table.rowCount()):
+            if row < len(results):
+                result = results[row]
+                _set_cell(self.results_table, row, 0, result["date"])
+                _set_cell(self.results_table, row, 1, result["opponent"])
+                _set_cell(self.results_table, row, 2, result["score"])
+                _set_cell(self.results_table, row, 3, result["result"],
+                          "#4CAF50" if result["result"] == "WIN" else "#F44336")
+            else:
+                for column in range(self.results_table.columnCount()):
+                    _set_cell(self.results_table, row, column, "")
+
+    def update_roster(self):
         """Update the roster table with current team data."""
-        if not self.game_state or not self.game_state.current_team:
-            print("No game state or team available")  # Debug print
-            return
-            
         team = self.game_state.current_team
-        print(f"Updating roster table for team {team.name}")  # Debug print
-        print(f"Roster: {team.roster}")  # Debug print
-        
-        # Clear existing rows
-        self.roster_table.setRowCount(0)
-        
-        # Add players to table
-        row = 0
-        for role in Role:  # Use Role enum
-            players = team.roster[role]  # Access roster with Role enum
-            print(f"Role {role.name}: {len(players)} players")  # Debug print
-            
-            for player in players:
-                print(f"Adding player {player.name} to row {row}")  # Debug print
-                self.roster_table.insertRow(row)
-                
-                # Add player data to table
-                self.roster_table.setItem(row, 0, QTableWidgetItem(player.name))
-                self.roster_table.setItem(row, 1, QTableWidgetItem(role.value))  # Use role.value for display
-                self.roster_table.setItem(row, 2, QTableWidgetItem(str(player.stats.mechanical_skill)))
-                self.roster_table.setItem(row, 3, QTableWidgetItem(str(player.stats.game_knowledge)))
-                self.roster_table.setItem(row, 4, QTableWidgetItem(str(player.stats.communication)))
-                self.roster_table.setItem(row, 5, QTableWidgetItem(str(player.stats.leadership)))
-                self.roster_table.setItem(row, 6, QTableWidgetItem(f"${player.salary:,}"))
-                self.roster_table.setItem(row, 7, QTableWidgetItem(player.contract_end.strftime("%Y-%m-%d")))
-                
-                row += 1
+        players = [(role, player) for role in Role for player in team.roster[role]]
+        
+        resized = self.roster_table.rowCount() != len(players)
+        self.roster_table.setRowCount(len(players))
+        for row, (role, player) in enumerate(players):
+            _set_cell(self.roster_table, row, 0, player.name)
+            _set_cell(self.roster_table, row, 1, role.value)
+            _set_cell(self.roster_table, row, 2, str(player.stats.mechanical_skill))
+            _set_cell(self.roster_table, row, 3, str(player.stats.game_knowledge))
+            _set_cell(self.roster_table, row, 4, str(player.stats.communication))
+            _set_cell(self.roster_table, row, 5, str(player.stats.leadership))
+            _set_cell(self.roster_table, row, 6, f"${player.salary:,}")
+            _set_cell(self.roster_table, row, 7, player.contract_end.strftime("%Y-%m-%d"))
         
         # Auto-adjust row heights
-        self.roster_table.resizeRowsToContents()
+        if resized:
+            self.roster_table.resizeRowsToContents()
+
+    def update_schedule(self):
+        """Update the schedule with the team's matches across all divisions."""
+        league = self.game_state.league
+        if not league or not league.current_season:
+            return
+        
+        current_team = self.game_state.current_team
+        team_matches = [
+            match for division in league.divisions.values()
+            for match in (division.matches or [])
+            if match.team1 == current_team or match.team2 == current_team
+        ]
+        team_matches.sort(key=lambda m: m.match_date)
+        self.schedule_table.update_schedule(team_matches, league.current_season.current_week)
+
+    def update_finances(self):
+        """Update the financial overview."""
+        finances = self.game_state.get_financial_overview()
+        for i, (label, value) in enumerate(finances.items()):
+            self.finance_grid.itemAtPosition(i, 1).widget().setText(value)
+
+    def update_facilities(self):
+        """Update the facility levels."""
+        facilities = self.game_state.get_facility_levels()
+        for facility, level in facilities.items():
+            self.facility_bars[facility].setValue(level)
 
     def init_ui(self):
         """Initialize the main hub screen UI."""
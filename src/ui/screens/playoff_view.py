@@ -1,71 +1,116 @@
+from typing import List, Optional
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFrame, QScrollArea, QGridLayout
+    QPushButton, QFrame, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QPainter, QPen, QColor
+from PyQt6.QtCore import Qt, QPointF, QRectF, pyqtSignal
+from PyQt6.QtGui import QFont, QPainter, QPainterPath, QPen, QColor
 
 from ...models.league import League, SeasonPhase
 from ...models.match import Match
 from ...models.team import Team
 
+# Bracket geometry
+MATCH_WIDTH = 200
+MATCH_HEIGHT = 80
+ROUND_SPACING = 60  # Horizontal gap between rounds
+MATCH_SPACING = 20  # Minimum vertical gap between matches of a round
+MARGIN = 10
+
+
+def bracket_rounds(match_count: int) -> List[int]:
+    """Number of matches in each round, first round first.
+    
+    Counting back from the final each round has twice the matches of the
+    next; the first round takes whatever is left, so a partial first round
+    feeds teams that had a bye.
+    """
+    rounds = []
+    size = 1
+    while match_count > 0:
+        rounds.append(min(size, match_count))
+        match_count -= rounds[-1]
+        size *= 2
+    return rounds[::-1]
+
+
 class PlayoffMatchWidget(QFrame):
     match_selected = pyqtSignal(Match)
     
-    def __init__(self, match: Match = None):
-        super().__init__()
-        self.match = match
+    def __init__(self, match: Match = None, parent=None):
+        super().__init__(parent)
+        self.match = None
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
         self.setLineWidth(2)
-        self.setMinimumSize(200, 80)
+        self.setFixedSize(MATCH_WIDTH, MATCH_HEIGHT)
         
         # Create layout
         layout = QVBoxLayout()
         self.setLayout(layout)
         
-        # Match labels
+        self.team1_label = QLabel("TBD")
+        self.team2_label = QLabel("TBD")
+        layout.addWidget(self.team1_label)
+        layout.addWidget(QLabel("vs"))
+        layout.addWidget(self.team2_label)
+        
+        self.set_match(match)
+    
+    def set_match(self, match: Optional[Match]):
+        """Show match in place, updating the labels only if they changed."""
+        team1_text, team2_text = "TBD", "TBD"
+        winner = None
         if match:
-            team1_label = QLabel(f"{match.team1.name if match.team1 else 'TBD'}")
-            team2_label = QLabel(f"{match.team2.name if match.team2 else 'TBD'}")
+            team1_text = f"{match.team1.name if match.team1 else 'TBD'}"
+            team2_text = f"{match.team2.name if match.team2 else 'TBD'}"
             
             # Add scores if match is completed
             if match.result:
-                team1_label.setText(f"{team1_label.text()} ({match.result.winner_score if match.result.winner == match.team1 else match.result.loser_score})")
-                team2_label.setText(f"{team2_label.text()} ({match.result.winner_score if match.result.winner == match.team2 else match.result.loser_score})")
-            
+                team1_text += f" ({match.result.winner_score if match.result.winner == match.team1 else match.result.loser_score})"
+                team2_text += f" ({match.result.winner_score if match.result.winner == match.team2 else match.result.loser_score})"
+                winner = 1 if match.result.winner == match.team1 else 2
+        
+        for label, text, is_winner in ((self.team1_label, team1_text, winner == 1),
+                                       (self.team2_label, team2_text, winner == 2)):
+            if label.text() != text:
+                label.setText(text)
             # Highlight winner if match is completed
-            if match.result:
-                winner_font = QFont()
-                winner_font.setBold(True)
-                if match.result.winner == match.team1:
-                    team1_label.setFont(winner_font)
-                else:
-                    team2_label.setFont(winner_font)
-        else:
-            team1_label = QLabel("TBD")
-            team2_label = QLabel("TBD")
-            
-        layout.addWidget(team1_label)
-        layout.addWidget(QLabel("vs"))
-        layout.addWidget(team2_label)
+            if label.font().bold() != is_winner:
+                font = label.font()
+                font.setBold(is_winner)
+                label.setFont(font)
         
         # Make widget clickable if match exists
-        if match:
-            self.setCursor(Qt.CursorShape.PointingHandCursor)
+        if match is not self.match:
+            self.match = match
+            if match:
+                self.setCursor(Qt.CursorShape.PointingHandCursor)
+            else:
+                self.unsetCursor()
             
     def mousePressEvent(self, event):
         if self.match:
             self.match_selected.emit(self.match)
 
 class PlayoffBracketWidget(QWidget):
+    """Playoff bracket: one match widget per match plus connector lines.
+    
+    Match widgets are only created when the bracket's shape (matches per
+    round) changes; otherwise results are updated in place. Match
+    positions and the connector path are computed once per shape and
+    again only when the widget's height changes, so painting just draws
+    the cached path.
+    """
+    
     def __init__(self, league: League):
         super().__init__()
         self.league = league
         self.setMinimumSize(800, 400)
         
-        # Create grid layout for bracket
-        self.layout = QGridLayout()
-        self.setLayout(self.layout)
+        self.match_widgets: List[PlayoffMatchWidget] = []
+        self._rounds: List[int] = []
+        self._connectors = QPainterPath()
         
         self.update_bracket()
         
@@ -77,65 +122,75 @@ class PlayoffBracketWidget(QWidget):
         playoff_matches = self.league.divisions["Playoffs"].matches
         if not playoff_matches:
             return
-            
-        # Clear existing widgets
-        for i in reversed(range(self.layout.count())):
-            self.layout.itemAt(i).widget().setParent(None)
-            
-        # Quarter-finals (first round)
-        for i, match in enumerate(playoff_matches[:2]):
-            match_widget = PlayoffMatchWidget(match)
-            self.layout.addWidget(match_widget, i*2, 0)
-            
-        # Semi-finals
-        for i, match in enumerate(playoff_matches[2:4]):
-            match_widget = PlayoffMatchWidget(match)
-            self.layout.addWidget(match_widget, i*4+1, 1)
-            
-        # Finals
-        if len(playoff_matches) > 4:
-            finals_widget = PlayoffMatchWidget(playoff_matches[4])
-            self.layout.addWidget(finals_widget, 2, 2)
+        
+        rounds = bracket_rounds(len(playoff_matches))
+        if rounds != self._rounds:
+            # New bracket shape: rebuild the match widgets and geometry
+            for widget in self.match_widgets:
+                widget.setParent(None)
+                widget.deleteLater()
+            self.match_widgets = [PlayoffMatchWidget(match, self) for match in playoff_matches]
+            for widget in self.match_widgets:
+                widget.show()
+            self._rounds = rounds
+            self._layout_bracket()
+        else:
+            for widget, match in zip(self.match_widgets, playoff_matches):
+                widget.set_match(match)
+    
+    def _layout_bracket(self):
+        """Position the match widgets and build the connector path."""
+        rounds = self._rounds
+        if not rounds:
+            return
+        
+        # Matches of each round are spread evenly over the bracket height,
+        # which puts every match level with the middle of its feeders
+        height = max(self.height(), max(rounds) * (MATCH_HEIGHT + MATCH_SPACING) + 2 * MARGIN)
+        width = 2 * MARGIN + len(rounds) * MATCH_WIDTH + (len(rounds) - 1) * ROUND_SPACING
+        self.setMinimumSize(max(800, width), max(400, max(rounds) * (MATCH_HEIGHT + MATCH_SPACING) + 2 * MARGIN))
+        
+        rects: List[List[QRectF]] = []
+        widgets = iter(self.match_widgets)
+        for round_index, size in enumerate(rounds):
+            x = MARGIN + round_index * (MATCH_WIDTH + ROUND_SPACING)
+            slot = (height - 2 * MARGIN) / size
+            round_rects = []
+            for i in range(size):
+                center_y = MARGIN + (i + 0.5) * slot
+                rect = QRectF(x, center_y - MATCH_HEIGHT / 2, MATCH_WIDTH, MATCH_HEIGHT)
+                next(widgets).move(int(rect.x()), int(rect.y()))
+                round_rects.append(rect)
+            rects.append(round_rects)
+        
+        # Right-angled line from each match to the match its winner plays next
+        path = QPainterPath()
+        for round_index in range(len(rounds) - 1):
+            size, next_size = rounds[round_index], rounds[round_index + 1]
+            for i, rect in enumerate(rects[round_index]):
+                target = rects[round_index + 1][i * next_size // size]
+                start = QPointF(rect.right(), rect.center().y())
+                end = QPointF(target.left(), target.center().y())
+                mid_x = (start.x() + end.x()) / 2
+                path.moveTo(start)
+                path.lineTo(mid_x, start.y())
+                path.lineTo(mid_x, end.y())
+                path.lineTo(end)
+        self._connectors = path
+        self.update()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Only the height affects the bracket geometry
+        if event.size().height() != event.oldSize().height():
+            self._layout_bracket()
             
     def paintEvent(self, event):
         """Draw connecting lines between matches."""
         super().paintEvent(event)
         painter = QPainter(self)
         painter.setPen(QPen(QColor(200, 200, 200), 2))
-        
-        # Get widget positions
-        widgets = []
-        for i in range(self.layout.count()):
-            widget = self.layout.itemAt(i).widget()
-            if widget:
-                widgets.append((widget, self.layout.getItemPosition(i)))
-                
-        # Draw lines between matches
-        for widget, pos in widgets:
-            if pos[1] < 2:  # Not the finals
-                # Find the next round's match
-                next_round = pos[1] + 1
-                next_row = (pos[0] // 2) * 2 + 1
-                
-                # Find target widget
-                target = None
-                for w, p in widgets:
-                    if p[1] == next_round and abs(p[0] - next_row) <= 1:
-                        target = w
-                        break
-                        
-                if target:
-                    # Draw line from this match to next match
-                    start_x = widget.x() + widget.width()
-                    start_y = widget.y() + widget.height()/2
-                    end_x = target.x()
-                    end_y = target.y() + target.height()/2
-                    
-                    # Draw line with right angle
-                    mid_x = (start_x + end_x) / 2
-                    painter.drawLine(start_x, start_y, mid_x, start_y)
-                    painter.drawLine(mid_x, start_y, mid_x, end_y)
-                    painter.drawLine(mid_x, end_y, end_x, end_y)
+        painter.drawPath(self._connectors)
 
 class PlayoffView(QWidget):
     def __init__(self, league: League, main_window):
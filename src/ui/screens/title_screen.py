@@ -10,6 +10,17 @@ class TitleScreen(QWidget):
         self.main_window = main_window
         self.init_ui()
     
+    def start_preload(self):
+        """Decode champion portraits while the player is on the title screen.
+        
+        Called once the title screen has painted, so loading the champion
+        data and the portrait cache doesn't delay the first frame.
+        """
+        from ..components.portrait_cache import PortraitCache
+        from ...data.champions import get_champion_registry
+        
+        PortraitCache.instance().preload(c.name for c in get_champion_registry())
+    
     def init_ui(self):
         """Initialize the title screen UI."""
         # Create main layout
@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 import logging
 import sys
+from typing import Dict, Optional
 
 class ChampionAssets:
     """Utility class for managing champion assets like portraits."""
@@ -18,6 +19,57 @@ class ChampionAssets:
             
         return base_path / "ChampionPortraits"
     
+    # Champion names whose portrait file name doesn't follow the usual rules
+    NAME_MAPPING = {
+        "Aurelion Sol": "Aurelion_Sol",
+        "Bel'Veth": "Bel%27Veth",
+        "Cho'Gath": "Cho%27Gath",
+        "Dr. Mundo": "Dr._Mundo",
+        "Jarvan IV": "Jarvan_IV",
+        "Kai'Sa": "Kai%27Sa",
+        "Kha'Zix": "Kha%27Zix",
+        "Kog'Maw": "Kog%27Maw",
+        "K'Sante": "K%27Sante",
+        "Lee Sin": "Lee_Sin",
+        "Master Yi": "Master_Yi",
+        "Miss Fortune": "MissFortune",
+        "Nunu & Willump": "Nunu_%26_Willump",
+        "Rek'Sai": "Rek%27Sai",
+        "Renata Glasc": "Renata_Glasc",
+        "Tahm Kench": "Tahm_Kench",
+        "Twisted Fate": "Twisted_Fate",
+        "Vel'Koz": "Vel%27Koz",
+        "Xin Zhao": "Xin_Zhao"
+    }
+    
+    # File name -> path for every portrait, built on first lookup
+    _portrait_index: Optional[Dict[str, Path]] = None
+    
+    @classmethod
+    def get_portrait_filename(cls, champion_name: str) -> str:
+        """Get the portrait file name for a champion."""
+        formatted_name = cls.NAME_MAPPING.get(champion_name)
+        if formatted_name is None:
+            # Handle special characters in the filename
+            formatted_name = champion_name.replace("'", "%27")
+            formatted_name = formatted_name.replace(" ", "_")
+            formatted_name = formatted_name.replace("&", "%26")
+        return f"{formatted_name}Square.webp"
+    
+    @classmethod
+    def get_portrait_index(cls) -> Dict[str, Path]:
+        """Get the file name -> path index of the portraits directory."""
+        if cls._portrait_index is None:
+            portraits_dir = cls.get_portraits_dir()
+            index = {}
+            if portraits_dir.is_dir():
+                with os.scandir(portraits_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            index[entry.name] = Path(entry.path)
+            cls._portrait_index = index
+        return cls._portrait_index
+    
     @classmethod
     def get_portrait_path(cls, champion_name: str) -> str:
         """
@@ -32,47 +84,12 @@ class ChampionAssets:
         Raises:
             FileNotFoundError: If the portrait file doesn't exist
         """
-        # Handle special cases
-        name_mapping = {
-            "Aurelion Sol": "Aurelion_Sol",
-            "Bel'Veth": "Bel%27Veth",
-            "Cho'Gath": "Cho%27Gath",
-            "Dr. Mundo": "Dr._Mundo",
-            "Jarvan IV": "Jarvan_IV",
-            "Kai'Sa": "Kai%27Sa",
-            "Kha'Zix": "Kha%27Zix",
-            "Kog'Maw": "Kog%27Maw",
-            "K'Sante": "K%27Sante",
-            "Lee Sin": "Lee_Sin",
-            "Master Yi": "Master_Yi",
-            "Miss Fortune": "MissFortune",
-            "Nunu & Willump": "Nunu_%26_Willump",
-            "Rek'Sai": "Rek%27Sai",
-            "Renata Glasc": "Renata_Glasc",
-            "Tahm Kench": "Tahm_Kench",
-            "Twisted Fate": "Twisted_Fate",
-            "Vel'Koz": "Vel%27Koz",
-            "Xin Zhao": "Xin_Zhao"
-        }
-        
-        # Map the champion name if it's in our special cases
-        formatted_name = name_mapping.get(champion_name, champion_name)
-        
-        # Handle special characters in the filename
-        if champion_name not in name_mapping:
-            formatted_name = formatted_name.replace("'", "%27")
-            formatted_name = formatted_name.replace(" ", "_")
-            formatted_name = formatted_name.replace("&", "%26")
-        
-        # Create the filename
-        filename = f"{formatted_name}Square.webp"
-        
-        # Get the full path
-        portrait_path = cls.get_portraits_dir() / filename
+        filename = cls.get_portrait_filename(champion_name)
+        portrait_path = cls.get_portrait_index().get(filename)
         
         # Check if file exists
-        if not portrait_path.exists():
-            logging.error(f"Portrait not found for champion {champion_name} at path {portrait_path}")
+        if portrait_path is None:
+            logging.error(f"Portrait not found for champion {champion_name} at path {cls.get_portraits_dir() / filename}")
             raise FileNotFoundError(f"Portrait not found for champion {champion_name}")
             
         return str(portrait_path)
@@ -80,8 +97,4 @@ class ChampionAssets:
     @classmethod
     def is_portrait_available(cls, champion_name: str) -> bool:
         """Check if a portrait is available for the given champion."""
-        try:
-            cls.get_portrait_path(champion_name)
-            return True
-        except FileNotFoundError:
-            return False
+        return cls.get_portrait_filename(champion_name) in cls.get_portrait_index()
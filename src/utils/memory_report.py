@@ -0,0 +1,203 @@
+"""Memory accounting for a game in progress.
+
+measure() walks everything reachable from a GameState and adds up the
+bytes and objects held, by category: matches, events, drafts, stats,
+teams, history and other. Every object is counted once, under the
+category it was first reached through; typed objects (a MatchEvent, a
+DraftState, ...) always count under their own category, and plain
+containers and values count under the object holding them.
+
+From the command line this plays a number of weeks on the built-in
+leagues and prints the report:
+
+    python -m src.utils.memory_report --weeks 10
+    python -m src.utils.memory_report --weeks 10 --tracemalloc
+
+--tracemalloc also plays one more week under tracemalloc and lists the
+source lines that allocated the most memory during it.
+"""
+import argparse
+import sys
+import tracemalloc
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from src.models.champion import Champion, ChampionRegistry
+from src.models.draft import DraftBan, DraftPick, DraftPlayer, DraftState
+from src.models.history import LeagueHistory, TeamHistory
+from src.models.league import Season
+from src.models.match import (DragonState, Match, MatchEvent, MatchResult, PlayerMatchStats,
+                              TeamFightResult, TeamMatchStats)
+from src.models.player import Player, PlayerStats
+from src.models.team import Team
+
+CATEGORIES = ("matches", "events", "drafts", "stats", "teams", "history", "other")
+
+# Objects of these types count under their category wherever they are reached
+TYPE_CATEGORIES = {
+    Match: "matches",
+    MatchResult: "matches",
+    MatchEvent: "events",
+    TeamFightResult: "events",
+    DraftState: "drafts",
+    DraftPick: "drafts",
+    DraftBan: "drafts",
+    DraftPlayer: "drafts",
+    ChampionRegistry: "drafts",
+    Champion: "drafts",
+    TeamMatchStats: "stats",
+    PlayerMatchStats: "stats",
+    DragonState: "stats",
+    Team: "teams",
+    Player: "teams",
+    PlayerStats: "teams",
+    Season: "history",
+    TeamHistory: "history",
+    LeagueHistory: "history",
+}
+
+# Attributes holding past seasons and results; what they hold counts as history
+HISTORY_ATTRIBUTES = {"season_history", "match_history"}
+
+# Attributes that lead out of the game data (database connections and the like)
+SKIPPED_ATTRIBUTES = {"db_manager", "_listeners"}
+
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+
+
+class CategoryUsage:
+    """Bytes and object count held by one category."""
+
+    __slots__ = ('bytes', 'objects')
+
+    def __init__(self):
+        self.bytes = 0
+        self.objects = 0
+
+
+def _is_game_object(obj) -> bool:
+    """Whether obj is one of the game's own objects, whose attributes are walked."""
+    return type(obj).__module__.startswith("src.") and not isinstance(obj, (Enum, type))
+
+
+def _attributes(obj) -> List[Tuple[str, object]]:
+    attributes = list(getattr(obj, '__dict__', {}).items())
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if hasattr(obj, name):
+                attributes.append((name, getattr(obj, name)))
+    return attributes
+
+
+def measure(root) -> Dict[str, CategoryUsage]:
+    """Bytes and objects reachable from root (typically a GameState), by category."""
+    usage = {category: CategoryUsage() for category in CATEGORIES}
+    seen = set()
+    stack = [(root, "other")]
+    while stack:
+        obj, category = stack.pop()
+        if id(obj) in seen or isinstance(obj, (Enum, type)):
+            continue
+        seen.add(id(obj))
+        category = TYPE_CATEGORIES.get(type(obj), category)
+        usage[category].bytes += sys.getsizeof(obj)
+        usage[category].objects += 1
+
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                stack.append((key, category))
+                stack.append((value, category))
+        elif isinstance(obj, _CONTAINERS):
+            stack.extend((item, category) for item in obj)
+        elif _is_game_object(obj):
+            for name, value in _attributes(obj):
+                if name in SKIPPED_ATTRIBUTES:
+                    continue
+                stack.append((value, "history" if name in HISTORY_ATTRIBUTES else category))
+    return usage
+
+
+def format_report(usage: Dict[str, CategoryUsage]) -> str:
+    """Table of bytes and objects per category, largest first."""
+    total_bytes = sum(u.bytes for u in usage.values())
+    lines = [f"  {'category':<12}{'KiB':>12}{'share':>8}{'objects':>12}"]
+    for category, u in sorted(usage.items(), key=lambda item: item[1].bytes, reverse=True):
+        share = u.bytes / total_bytes if total_bytes else 0
+        lines.append(f"  {category:<12}{u.bytes / 1024:12.1f}{share:8.1%}{u.objects:12,}")
+    lines.append(f"  {'total':<12}{total_bytes / 1024:12.1f}{'':>8}{sum(u.objects for u in usage.values()):12,}")
+    return "\n".join(lines)
+
+
+def diff_week_allocations(game_state, limit: int = 15) -> str:
+    """Simulate one week under tracemalloc and list the biggest allocation sites.
+
+    Sizes are what is still allocated at the end of the week, so sites
+    that keep data alive rank above ones that only allocate temporarily.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        game_state.simulate_all_leagues()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Leave out tracemalloc's own bookkeeping
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+    lines = [f"  {'KiB':>10}{'blocks':>10}  site"]
+    for stat in stats[:limit]:
+        frame = stat.traceback[0]
+        lines.append(f"  {stat.size_diff / 1024:10.1f}{stat.count_diff:10,}  {frame.filename}:{frame.lineno}")
+    return "\n".join(lines)
+
+
+def build_game_state(player_league: str = "LCK"):
+    """A fresh game on the built-in leagues, managing the first team of player_league."""
+    from datetime import datetime
+    from src.data.lck_teams import create_lck_league
+    from src.data.lcs_teams import create_lcs_league
+    from src.data.lec_teams import create_lec_league
+    from src.data.lpl_teams import create_lpl_league
+    from src.game.game_state import GameState
+    from src.models.league import Split
+
+    leagues = {
+        "LCK": create_lck_league(), "LEC": create_lec_league(),
+        "LPL": create_lpl_league(), "LCS": create_lcs_league(),
+    }
+    game_state = GameState()
+    game_state.league = leagues.pop(player_league)
+    game_state.current_team = game_state.league.get_all_teams()[0]
+    game_state.other_leagues = leagues
+    for league in [game_state.league] + list(leagues.values()):
+        league.start_new_season(Split.SPRING, datetime(2024, 1, 15))
+    return game_state
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.utils.memory_report",
+                                     description="Report the memory a game in progress holds, by category.")
+    parser.add_argument("--weeks", type=int, default=10, help="weeks to play before reporting (default 10)")
+    parser.add_argument("--league", default="LCK", choices=["LCK", "LEC", "LPL", "LCS"],
+                        help="the player's league; the player's own matches are simulated too")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="also list the top allocation sites of one more simulated week")
+    args = parser.parse_args(argv)
+
+    game_state = build_game_state(args.league)
+    # Nobody plays the player's matches here, so simulate them as well
+    game_state.current_team = None
+    for _ in range(args.weeks):
+        game_state.simulate_all_leagues()
+
+    print(f"Memory held after {args.weeks} weeks")
+    print(format_report(measure(game_state)))
+    if args.tracemalloc:
+        print("Top allocation sites over one more week")
+        print(diff_week_allocations(game_state))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
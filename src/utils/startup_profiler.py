@@ -0,0 +1,153 @@
+"""Startup timing report: time spent importing each module and time to first paint.
+
+Run the game with the LOL_MANAGER_STARTUP_REPORT environment variable set
+(or with --startup-report) to print the report once the title screen has
+painted. Set the variable to a file path to write the report there
+instead. Works in the frozen PyInstaller build as well, where it is the
+only way to see where startup time goes.
+"""
+import importlib.abc
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+STARTUP_REPORT_ENV = "LOL_MANAGER_STARTUP_REPORT"
+STARTUP_REPORT_FLAG = "--startup-report"
+
+# Time to first paint we aim for, in seconds
+FIRST_PAINT_TARGET = 1.0
+
+
+class _TimingLoader(importlib.abc.Loader):
+    """Wraps a module's real loader to time it."""
+
+    def __init__(self, loader, profiler: 'StartupProfiler'):
+        self.loader = loader
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        # Anything else (get_data, get_resource_reader, ...) goes to the real loader
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        # Extension modules do their work here rather than in exec_module
+        self.profiler._begin(spec.name)
+        try:
+            return self.loader.create_module(spec)
+        finally:
+            self.profiler._end(spec.name)
+
+    def exec_module(self, module):
+        # The module itself only ever sees its real loader
+        module.__loader__ = self.loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self.loader
+        self.profiler._begin(module.__name__)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profiler._end(module.__name__)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path finder that asks the other finders and times what they load."""
+
+    def __init__(self, profiler: 'StartupProfiler'):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimingLoader(spec.loader, self.profiler)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects import times and startup milestones.
+
+    Import times are measured per module: cumulative includes the modules
+    it imported, self excludes them.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self.imports: Dict[str, List[float]] = {}  # name -> [self, cumulative]
+        self._stack: List[List] = []  # [name, start, time spent in nested imports]
+        self._timer: Optional[_ImportTimer] = None
+
+    @classmethod
+    def from_environment(cls, argv: Sequence[str] = ()) -> Optional['StartupProfiler']:
+        """A running profiler if the report was asked for, otherwise None."""
+        if STARTUP_REPORT_FLAG not in argv and not os.environ.get(STARTUP_REPORT_ENV):
+            return None
+        profiler = cls()
+        profiler.install_import_timer()
+        return profiler
+
+    def install_import_timer(self) -> None:
+        """Start timing imports."""
+        if self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+
+    def uninstall_import_timer(self) -> None:
+        """Stop timing imports."""
+        if self._timer is not None:
+            if self._timer in sys.meta_path:
+                sys.meta_path.remove(self._timer)
+            self._timer = None
+
+    def _begin(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _end(self, name: str) -> None:
+        name, started, nested = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        times = self.imports.setdefault(name, [0.0, 0.0])
+        times[0] += elapsed - nested
+        times[1] += elapsed
+
+    def mark(self, label: str) -> float:
+        """Record a milestone; returns seconds since the profiler started."""
+        elapsed = time.perf_counter() - self.start
+        self.marks.append((label, elapsed))
+        return elapsed
+
+    def report(self, limit: int = 25, first_paint_target: float = FIRST_PAINT_TARGET) -> str:
+        """Format the milestones and the slowest imports."""
+        lines = ["Startup timing (seconds since startup began)"]
+        for label, elapsed in self.marks:
+            line = f"  {label:<28}{elapsed:8.3f}"
+            if label == "first paint":
+                verdict = "OK" if elapsed <= first_paint_target else "OVER"
+                line += f"  (target {first_paint_target:.3f}: {verdict})"
+            lines.append(line)
+
+        total_imports = sum(times[0] for times in self.imports.values())
+        lines.append(f"Imports: {len(self.imports)} modules, {total_imports:.3f} s")
+        lines.append(f"  {'module':<44}{'self ms':>10}{'cumul ms':>10}")
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (own, cumulative) in slowest[:limit]:
+            lines.append(f"  {name:<44}{own * 1000:10.1f}{cumulative * 1000:10.1f}")
+        return "\n".join(lines)
+
+    def finish(self) -> str:
+        """Stop timing imports and output the report where it was asked for."""
+        self.uninstall_import_timer()
+        report = self.report()
+        destination = os.environ.get(STARTUP_REPORT_ENV, "")
+        if destination and destination != "1":
+            with open(destination, 'w') as f:
+                f.write(report + "\n")
+        else:
+            print(report, file=sys.stderr)
+        return report
@@ -0,0 +1,184 @@
+"""Spans around the phases of a simulated week, exported as a Chrome trace.
+
+Wrap a phase in ``with span("name"):`` or decorate a function with
+``@traced()``. While no tracer is running both cost one global lookup,
+so they can stay in hot code. Start a tracer with start_tracing(), or
+run the game with the LOL_MANAGER_TRACE environment variable set to a
+file path: the trace is written there on exit (open it in
+chrome://tracing or https://ui.perfetto.dev) and a summary table of
+time per phase is printed.
+"""
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+TRACE_ENV = "LOL_MANAGER_TRACE"
+
+# The running tracer, or None when tracing is off
+_active: Optional['Tracer'] = None
+
+# Returned by span() while tracing is off; nullcontext can be entered any number of times
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    """One timed phase; records itself on the tracer when it exits."""
+
+    __slots__ = ('tracer', 'name', 'args', 'start', 'nested')
+
+    def __init__(self, tracer: 'Tracer', name: str, args: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.nested = 0  # Nanoseconds spent in child spans
+
+    def __enter__(self):
+        self.tracer._stack().append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        stack = self.tracer._stack()
+        stack.pop()
+        elapsed = end - self.start
+        if stack:
+            stack[-1].nested += elapsed
+        self.tracer._record(self, elapsed)
+        return False
+
+
+class Tracer:
+    """Collects spans from every thread.
+
+    Each span becomes a Chrome trace "complete" event and is added to
+    per-name totals: total includes nested spans, self excludes them.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter_ns()
+        self.events: List[Dict] = []
+        self.totals: Dict[str, List[int]] = {}  # name -> [calls, total ns, self ns]
+        self.threads: Dict[int, str] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+            thread = threading.current_thread()
+            self.threads[thread.ident] = thread.name
+        return stack
+
+    def _record(self, span: _Span, elapsed: int) -> None:
+        event = {
+            "name": span.name,
+            "ph": "X",
+            "ts": (span.start - self.start) / 1000,
+            "dur": elapsed / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if span.args:
+            event["args"] = span.args
+        with self._lock:
+            self.events.append(event)
+            totals = self.totals.setdefault(span.name, [0, 0, 0])
+            totals[0] += 1
+            totals[1] += elapsed
+            totals[2] += elapsed - span.nested
+
+    def span(self, name: str, args: Optional[Dict] = None) -> _Span:
+        return _Span(self, name, args or {})
+
+    def chrome_trace(self) -> Dict:
+        """The spans in Chrome trace-event format."""
+        with self._lock:
+            events = list(self.events)
+        names = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": ident, "args": {"name": name}}
+            for ident, name in self.threads.items()
+        ]
+        return {"traceEvents": names + events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self, limit: int = 30) -> str:
+        """Time per span name, the most self time first."""
+        with self._lock:
+            totals = sorted(self.totals.items(), key=lambda item: item[1][2], reverse=True)
+        lines = [f"  {'span':<40}{'calls':>8}{'total ms':>12}{'self ms':>12}{'mean ms':>10}"]
+        for name, (calls, total, own) in totals[:limit]:
+            lines.append(f"  {name:<40}{calls:>8}{total / 1e6:12.1f}{own / 1e6:12.1f}{total / calls / 1e6:10.2f}")
+        return "\n".join(lines)
+
+
+def start_tracing() -> Tracer:
+    """Start recording spans; returns the running tracer."""
+    global _active
+    if _active is None:
+        _active = Tracer()
+    return _active
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """Stop recording spans; returns the tracer that was running, if any."""
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def start_tracing_from_environment() -> Optional[Tracer]:
+    """Start tracing if LOL_MANAGER_TRACE names a file to write the trace to."""
+    if not os.environ.get(TRACE_ENV):
+        return None
+    return start_tracing()
+
+
+def finish_tracing() -> Optional[Tracer]:
+    """Stop tracing, write the trace where LOL_MANAGER_TRACE says and print the summary."""
+    tracer = stop_tracing()
+    if tracer is not None:
+        path = os.environ.get(TRACE_ENV)
+        if path:
+            tracer.write_chrome_trace(path)
+        print("Trace summary\n" + tracer.summary(), file=sys.stderr)
+    return tracer
+
+
+def span(name: str, **args):
+    """Context manager timing the block as a span named name.
+
+    Keyword arguments are attached to the trace event.
+    """
+    tracer = _active
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, args)
+
+
+def traced(name: Optional[str] = None):
+    """Decorator timing every call of the function as a span.
+
+    The span is named after the function's qualified name unless name is given.
+    """
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _active
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
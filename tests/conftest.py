@@ -0,0 +1,24 @@
+import pytest
+from datetime import date, timedelta
+from typing import Optional
+
+from src.models.player import Player, PlayerStats, Role
+from src.models.team import Team
+
+
+@pytest.fixture
+def make_team():
+    """Factory for a team with one player per role, all of the same skill."""
+    def make(name: str, team_id: Optional[int] = None, skill: int = 80) -> Team:
+        team = Team(name, "LCK", 1000000, team_id)
+        for role in Role:
+            team.add_player(Player(
+                name=f"{name}_{role.value}",
+                role=role,
+                stats=PlayerStats(skill, skill, skill, skill),
+                nationality="South Korea",
+                salary=100000,
+                contract_end=date.today() + timedelta(days=365)
+            ))
+        return team
+    return make
@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks.suite import compare, run_suite
+from benchmarks.world import LEAGUE_SIZE, build_world, world_teams
+
+
+def results(**medians):
+    return {"results": {key: {"median": median} for key, median in medians.items()}}
+
+
+def test_world_is_the_same_for_a_seed():
+    first = world_teams(build_world(20, seed=5))
+    second = world_teams(build_world(20, seed=5))
+
+    assert len(first) == 20
+    assert [t.name for t in first] == [t.name for t in second]
+    assert [p.stats for t in first for p in t.players] == [p.stats for t in second for p in t.players]
+
+
+def test_world_size_must_fill_leagues():
+    with pytest.raises(ValueError):
+        build_world(LEAGUE_SIZE + 1, seed=0)
+
+
+def test_compare_flags_slowdowns_over_the_threshold():
+    baseline = results(a=1.0, b=1.0, c=1.0, gone=1.0)
+    current = results(a=1.1, b=1.5, c=0.5, added=1.0)
+
+    statuses = {row["key"]: row["status"] for row in compare(baseline, current, threshold=0.15)}
+
+    assert statuses == {"a": "ok", "b": "regression", "c": "improvement",
+                        "gone": "missing", "added": "new"}
+
+
+def test_compare_ignores_changes_below_the_noise_floor():
+    rows = compare(results(a=0.001), results(a=0.002), threshold=0.15, min_delta=0.002)
+    assert rows[0]["status"] == "ok"
+
+
+def test_run_suite_reports_each_size():
+    output = run_suite(repeat=1, max_teams=10, only=["division_get_standings"])
+
+    result = output["results"]["division_get_standings[10]"]
+    assert result["teams"] == 10
+    assert len(result["times"]) == 1
+    assert output["meta"]["seed"] == 0
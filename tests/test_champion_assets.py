@@ -0,0 +1,17 @@
+import pytest
+from src.utils.champion_assets import ChampionAssets
+from src.data.champions import get_champion_registry
+
+
+def test_every_champion_has_a_portrait():
+    missing = [c.name for c in get_champion_registry() if not ChampionAssets.is_portrait_available(c.name)]
+    assert missing == []
+
+
+def test_special_names_and_index_reuse():
+    assert ChampionAssets.get_portrait_path("Kai'Sa").endswith("Kai%27SaSquare.webp")
+    assert ChampionAssets.get_portrait_path("Nunu & Willump").endswith("Nunu_%26_WillumpSquare.webp")
+    assert ChampionAssets.get_portrait_index() is ChampionAssets.get_portrait_index()
+
+    with pytest.raises(FileNotFoundError):
+        ChampionAssets.get_portrait_path("Not A Champion")
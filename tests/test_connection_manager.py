@@ -0,0 +1,124 @@
+import os
+import sqlite3
+import threading
+import pytest
+from datetime import datetime
+
+from src.database.connection_manager import ConnectionManager
+from src.models.team import Team
+from src.models.match import Match
+
+
+TEST_DB_PATH = "data/test_connections.db"
+
+
+def _remove_db_files():
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(TEST_DB_PATH + suffix):
+            os.remove(TEST_DB_PATH + suffix)
+
+
+@pytest.fixture
+def connections():
+    _remove_db_files()
+    manager = ConnectionManager(TEST_DB_PATH)
+    yield manager
+    manager.close()
+    _remove_db_files()
+
+
+def test_readers_are_per_thread_and_read_only(connections):
+    main_reader = connections.reader()
+    assert connections.reader() is main_reader
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(connections.reader()))
+    thread.start()
+    thread.join()
+    assert other[0] is not main_reader
+
+    with pytest.raises(sqlite3.OperationalError):
+        main_reader.save_team(Team("T1", "LCK", 1000000))
+
+
+def test_parallel_workers_read_and_write(connections, make_team):
+    team_ids = []
+    for name in ("T1", "GenG", "DRX", "KT"):
+        team = make_team(name)
+        team_ids.append(connections.write(lambda db, team=team: db.save_team(team)))
+
+    errors = []
+
+    def worker(team1_id: int, team2_id: int):
+        try:
+            reader = connections.reader()
+            for _ in range(5):
+                team1 = reader.load_team(team1_id)
+                team2 = reader.load_team(team2_id)
+                match = Match(team1, team2, datetime.now())
+                match.simulate()
+                connections.write(lambda db: db.save_match(match, season="Spring 2024"))
+        except Exception as e:
+            errors.append(e)
+
+    workers = [
+        threading.Thread(target=worker, args=(team_ids[i], team_ids[(i + 1) % 4]))
+        for i in range(4)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    assert errors == []
+    count = connections.reader().conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+    assert count == 20
+
+
+def test_write_retries_lock_errors(connections):
+    attempts = []
+
+    def flaky(db):
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise sqlite3.OperationalError("database is locked")
+        return db.save_team(Team("T1", "LCK", 1000000))
+
+    assert connections.write(flaky) is not None
+    assert len(attempts) == 3
+
+
+class LockedOnFirstCommit:
+    """Connection wrapper whose first commit fails the way a locked database does."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        object.__setattr__(self, 'conn', conn)
+        object.__setattr__(self, 'failed', False)
+
+    def commit(self):
+        if not self.failed:
+            object.__setattr__(self, 'failed', True)
+            raise sqlite3.OperationalError("database is locked")
+        self.conn.commit()
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.conn, name, value)
+
+
+def test_write_retry_after_failed_commit_does_not_duplicate(connections):
+    with connections.writer():
+        pass
+    connections._writer.conn = LockedOnFirstCommit(connections._writer.conn)
+
+    connections.write(lambda db: db.save_team(Team("T1", "LCK", 1000000)))
+
+    count = connections.reader().conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0]
+    assert count == 1
+
+
+def test_plain_memory_database_rejected():
+    with pytest.raises(ValueError):
+        ConnectionManager(":memory:")
@@ -11,18 +11,25 @@ from src.models.league import League
 
 @pytest.fixture
 def db_manager():
-    """Create a test database manager."""
-    test_db_path = "data/test.db"
+    """Create an in-memory test database manager."""
+    db = DatabaseManager(":memory:")
+    yield db
+    
+    # Cleanup
+    db.close()
+
+@pytest.fixture
+def checkpoint_path():
+    """Path for checkpoint files written during a test."""
+    test_db_path = "data/test_checkpoint.db"
     
     # Remove test database if it exists
     if os.path.exists(test_db_path):
         os.remove(test_db_path)
     
-    db = DatabaseManager(test_db_path)
-    yield db
+    yield test_db_path
     
     # Cleanup
-    db.close()
     if os.path.exists(test_db_path):
         os.remove(test_db_path)
 
@@ -147,3 +154,82 @@ def test_league_save_load(db_manager, sample_team):
     assert loaded_league.name == league.name
     assert len(loaded_league.teams) == len(teams)
     assert loaded_league.teams[0].name == teams[0].name
+
+def test_season_aggregates(db_manager, make_team):
+    """Test summary tables and analytics queries after saving matches."""
+    team1 = make_team("T1")
+    team2 = make_team("GenG")
+    team1.team_id = db_manager.save_team(team1)
+    team2.team_id = db_manager.save_team(team2)
+    
+    results = []
+    for _ in range(4):
+        match = Match(team1, team2, datetime.now())
+        match.simulate()
+        db_manager.save_match(match, season="Spring 2024")
+        results.append(match.result)
+    
+    # Head-to-head comes straight from the matches table
+    h2h = db_manager.get_head_to_head(team1.team_id, team2.team_id)
+    team1_wins = sum(1 for r in results if r.winner == team1)
+    assert h2h['matches_played'] == 4
+    assert h2h['team1_wins'] == team1_wins
+    assert h2h['team2_wins'] == 4 - team1_wins
+    
+    # Career stats match the raw per-match box scores
+    mid = team1.roster[Role.MID][0]
+    career = db_manager.get_player_career_stats(mid.player_id)
+    expected_kills = sum(
+        (r.winner_stats if r.winner == team1 else r.loser_stats).player_stats[mid].kills
+        for r in results
+    )
+    assert career['matches_played'] == 4
+    assert career['wins'] == team1_wins
+    assert career['kills'] == expected_kills
+    
+    standings = db_manager.get_team_season_standings("Spring 2024")
+    assert [row['matches_played'] for row in standings] == [4, 4]
+    assert standings[0]['wins'] >= standings[1]['wins']
+    assert standings[0]['rank'] == 1
+    
+    leaderboard = db_manager.get_season_leaderboard("Spring 2024", stat='kills', limit=3)
+    assert len(leaderboard) == 3
+    assert leaderboard[0]['rank'] == 1
+    assert leaderboard[0]['kills'] >= leaderboard[-1]['kills']
+    
+    with pytest.raises(ValueError):
+        db_manager.get_season_leaderboard("Spring 2024", stat='name; DROP TABLE players')
+    
+    # Rebuilding from raw data gives the same incrementally maintained totals
+    db_manager.rebuild_summary_tables()
+    assert db_manager.get_player_career_stats(mid.player_id) == career
+    assert db_manager.get_team_season_standings("Spring 2024") == standings
+
+def test_in_memory_checkpoint_and_restore(checkpoint_path, sample_team, sample_player):
+    """Test that an in-memory database only reaches disk on checkpoint."""
+    db = DatabaseManager(":memory:", checkpoint_path=checkpoint_path)
+    assert db.in_memory
+    
+    sample_team.add_player(sample_player)
+    team_id = db.save_team(sample_team)
+    assert not os.path.exists(checkpoint_path)
+    
+    assert db.checkpoint() == checkpoint_path
+    assert os.path.exists(checkpoint_path)
+    db.close()
+    
+    # A fresh in-memory database can be loaded from the checkpoint
+    restored = DatabaseManager(":memory:")
+    restored.restore(checkpoint_path)
+    loaded_team = restored.load_team(team_id)
+    assert loaded_team.name == sample_team.name
+    assert len(loaded_team.roster[Role.MID]) == 1
+    restored.close()
+
+def test_scheduled_checkpoint(checkpoint_path, sample_team):
+    """Test that commits trigger a checkpoint once the interval has elapsed."""
+    db = DatabaseManager(":memory:", checkpoint_path=checkpoint_path,
+                         checkpoint_interval=0)
+    db.save_team(sample_team)
+    assert os.path.exists(checkpoint_path)
+    db.close()
@@ -0,0 +1,151 @@
+import pytest
+from src.models.player import Role
+from src.models.team import Team
+from src.models.draft import (
+    DraftState, DraftPhase, DraftSide, DraftAction, DRAFT_SEQUENCE
+)
+from src.data.champions import get_champion_registry, get_all_champions
+
+
+@pytest.fixture
+def draft_state():
+    blue = Team("T1", "LCK", 1000000, 1)
+    red = Team("GenG", "LCK", 1000000, 2)
+    return DraftState(blue_team=blue, red_team=red)
+
+
+def test_drafts_share_registry(draft_state):
+    other = DraftState(blue_team=draft_state.blue_team, red_team=draft_state.red_team)
+    assert other.registry is draft_state.registry
+    assert get_all_champions()["Ahri"] is draft_state.registry.get("Ahri")
+
+
+def test_registry_ids_and_role_masks():
+    registry = get_champion_registry()
+    names = [c.name for c in registry]
+    assert names == sorted(names)
+    assert all(c.champion_id == i for i, c in enumerate(registry))
+
+    supports = registry.champions_in(registry.role_masks[Role.SUPPORT])
+    assert supports and all(Role.SUPPORT in c.roles for c in supports)
+
+
+def test_filtering_by_text_and_role(draft_state):
+    result = draft_state.get_available_champions("ka", Role.ADC)
+    assert result
+    assert all("ka" in c.name.lower() and Role.ADC in c.roles for c in result)
+    assert [c.name for c in result] == sorted(c.name for c in result)
+
+
+def test_ban_updates_availability(draft_state):
+    ahri = draft_state.registry.get("Ahri")
+    assert draft_state.make_ban(ahri, draft_state.blue_team)
+
+    assert draft_state.is_banned(ahri)
+    assert not draft_state.is_available(ahri)
+    assert ahri not in draft_state.get_available_champions()
+    assert ahri in draft_state.get_available_champions(include_unavailable=True)
+    assert "Ahri" not in draft_state.available_champions
+
+    # Banning does not leak into other drafts sharing the registry
+    other = DraftState(blue_team=draft_state.blue_team, red_team=draft_state.red_team)
+    assert other.is_available(ahri)
+
+    # A banned champion cannot be banned again
+    assert not draft_state.make_ban(ahri, draft_state.red_team)
+
+
+def test_full_draft_marks_picks(draft_state):
+    registry = draft_state.registry
+    ban_names = ["Aatrox", "Camille", "Darius", "Fiora", "Gangplank", "Garen"]
+    for name in ban_names:
+        assert draft_state.make_ban(registry.get(name), draft_state.get_current_team())
+    assert draft_state.current_phase == DraftPhase.PICK_PHASE_1
+
+    team = draft_state.get_current_team()
+    role = draft_state.get_next_role_to_pick(team)
+    champion = draft_state.get_available_champions(role=role)[0]
+    assert draft_state.make_pick(champion, team)
+    assert draft_state.is_picked(champion)
+
+
+def _play_turn(draft_state):
+    """Ban or pick the first legal champion for whoever is on the clock."""
+    step = draft_state.current_step
+    team = draft_state.get_current_team()
+    if step.action == DraftAction.BAN:
+        champion = draft_state.get_available_champions()[0]
+        assert draft_state.make_ban(champion, team)
+    else:
+        role = draft_state.get_next_role_to_pick(team)
+        champion = draft_state.get_available_champions(role=role)[0]
+        assert draft_state.make_pick(champion, team)
+    return champion
+
+
+def test_draft_sequence_matches_pro_order():
+    assert len(DRAFT_SEQUENCE) == 20
+    order = "".join(step.side.value[0] for step in DRAFT_SEQUENCE)
+    assert order == "BRBRBR" + "BRRBBR" + "RRBB" + "RBRB"
+
+    for side in DraftSide:
+        bans = [s.number for s in DRAFT_SEQUENCE if s.side == side and s.action == DraftAction.BAN]
+        picks = [s.number for s in DRAFT_SEQUENCE if s.side == side and s.action == DraftAction.PICK]
+        assert bans == [1, 2, 3, 4, 5]
+        assert picks == [1, 2, 3, 4, 5]
+
+
+def test_full_draft_completes(draft_state):
+    while not draft_state.is_complete:
+        _play_turn(draft_state)
+
+    assert draft_state.current_phase is None
+    assert draft_state.get_current_team() is None
+    assert len(draft_state.picks) == 10
+    assert len(draft_state.bans) == 10
+    for team in (draft_state.blue_team, draft_state.red_team):
+        roles = {p.player.role for p in draft_state.picks if p.team == team}
+        assert roles == set(Role)
+
+
+def test_undo_redo(draft_state):
+    for _ in range(7):
+        _play_turn(draft_state)
+    mask = draft_state.available_mask
+
+    last_pick = draft_state.picks[-1].champion
+    assert draft_state.undo() is last_pick
+    assert draft_state.current_turn == 6
+    assert draft_state.is_available(last_pick)
+    assert draft_state.current_phase == DraftPhase.PICK_PHASE_1
+
+    last_ban = draft_state.bans[-1].champion
+    assert draft_state.undo() is last_ban
+    assert draft_state.current_phase == DraftPhase.BAN_PHASE_1
+    assert not draft_state.is_banned(last_ban)
+
+    assert draft_state.redo() is last_ban
+    assert draft_state.redo() is last_pick
+    assert draft_state.redo() is None
+    assert draft_state.available_mask == mask
+
+    # A new action discards the redo history
+    draft_state.undo()
+    _play_turn(draft_state)
+    assert draft_state.redo() is None
+
+
+def test_snapshot_restore(draft_state):
+    for _ in range(4):
+        _play_turn(draft_state)
+    snapshot = draft_state.snapshot()
+
+    for _ in range(8):
+        _play_turn(draft_state)
+    draft_state.restore(snapshot)
+
+    assert draft_state.current_turn == 4
+    assert len(draft_state.bans) == 4
+    assert not draft_state.picks
+    assert draft_state.picked_mask == 0
+    assert draft_state.banned_mask == draft_state.registry.mask_of(b.champion for b in draft_state.bans)
@@ -0,0 +1,113 @@
+import time
+import pytest
+from datetime import datetime
+from src.models.player import Role
+from src.models.team import Team
+from src.models.match import Match
+from src.models.draft import DraftState, DraftAction
+from src.ai.draft_ai import DraftAI
+from src.ai.draft_search import DraftSearch
+from src.ai.draft_scoring import DraftScorer, SYNERGY_BONUS, COUNTER_PENALTY, TIER_VALUES
+
+
+@pytest.fixture
+def draft_state():
+    blue = Team("T1", "LCK", 1000000, 1)
+    red = Team("GenG", "LCK", 1000000, 2)
+    return DraftState(blue_team=blue, red_team=red)
+
+
+@pytest.fixture
+def search():
+    return DraftSearch(DraftAI.get_scorer, time_budget=0.2)
+
+
+def test_search_completes_draft_within_budget(draft_state, search):
+    while not draft_state.is_complete:
+        step = draft_state.current_step
+        team = draft_state.get_current_team()
+
+        start = time.perf_counter()
+        champion = search.choose(draft_state)
+        # Allow for one node finishing after the deadline
+        assert time.perf_counter() - start < search.time_budget + 0.2
+
+        if step.action == DraftAction.PICK:
+            assert draft_state.make_pick(champion, team)
+        else:
+            assert draft_state.make_ban(champion, team)
+
+    assert len(draft_state.picks) == 10
+    assert search.table
+
+
+def test_search_leaves_draft_untouched(draft_state, search):
+    ahri = draft_state.registry.get("Ahri")
+    draft_state.make_ban(ahri, draft_state.blue_team)
+    draft_state.undo()
+    snapshot = draft_state.snapshot()
+
+    search.choose(draft_state)
+
+    assert draft_state.snapshot() == snapshot
+    assert draft_state.redo() is ahri
+
+
+def test_first_ban_is_top_tier(draft_state, search):
+    champion = search.choose(draft_state)
+    ban_vector = DraftAI.get_scorer(draft_state.registry).ban_vector
+    assert ban_vector[champion.champion_id] == TIER_VALUES['S']
+
+
+def test_evaluation_counts_synergies(draft_state):
+    registry = draft_state.registry
+    for name in ["Aatrox", "Camille", "Darius", "Fiora", "Gangplank", "Garen"]:
+        draft_state.make_ban(registry.get(name), draft_state.get_current_team())
+    # Blue picks top, red picks two, then blue picks jungle
+    draft_state.make_pick(registry.get("Malphite"), draft_state.blue_team)
+    draft_state.make_pick(registry.get("Jax"), draft_state.red_team)
+    draft_state.make_pick(registry.get("Vi"), draft_state.red_team)
+    draft_state.make_pick(registry.get("Diana"), draft_state.blue_team)
+
+    plain = DraftSearch(lambda r: DraftScorer(r, DraftAI.TIER_LIST, {}, {}))
+    combo = DraftSearch(lambda r: DraftScorer(r, DraftAI.TIER_LIST, {'Malphite': ['Diana']}, {}))
+    assert combo.evaluate(draft_state) - plain.evaluate(draft_state) == pytest.approx(SYNERGY_BONUS)
+
+
+def test_quick_pick_scores_synergy_and_counters(draft_state):
+    registry = draft_state.registry
+    scorer = DraftAI.get_scorer(registry)
+    assert DraftAI.get_scorer(registry) is scorer
+
+    yasuo = registry.get("Yasuo")
+    malphite = registry.get("Malphite")
+    vayne = registry.get("Vayne")
+    caitlyn = registry.get("Caitlyn")
+    assert scorer.synergy_rows[malphite.champion_id] >> yasuo.champion_id & 1
+
+    # Caitlyn counters Vayne, so she gains and Vayne loses against each other
+    scores = scorer.pick_scores(
+        registry.mask_of([vayne, caitlyn]), Role.ADC, 0, registry.bit(vayne)
+    )
+    assert scores[caitlyn.champion_id] == pytest.approx(
+        scorer.tier_vectors[Role.ADC][caitlyn.champion_id] + COUNTER_PENALTY
+    )
+    scores = scorer.pick_scores(registry.bit(vayne), Role.ADC, 0, registry.bit(caitlyn))
+    assert scores[vayne.champion_id] == pytest.approx(
+        scorer.tier_vectors[Role.ADC][vayne.champion_id] - COUNTER_PENALTY
+    )
+
+
+def test_match_auto_draft_uses_full_sequence(make_team):
+    team1 = make_team("T1")
+    team2 = make_team("GenG")
+    match = Match(team1, team2, datetime.now())
+    match.auto_draft()
+
+    draft_state = match.draft_state
+    assert draft_state.is_complete
+    assert len(draft_state.bans) == 10
+    starters = set(team1.players) | set(team2.players)
+    for pick in draft_state.picks:
+        assert pick.player in starters
+        assert pick.player.role in pick.champion.roles
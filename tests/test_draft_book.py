@@ -0,0 +1,92 @@
+import json
+import pytest
+from src.models.team import Team
+from src.models.draft import DraftState
+from src.ai.draft_ai import DraftAI
+from src.ai.draft_book import DraftBook, fingerprint
+
+
+@pytest.fixture
+def draft_state():
+    blue = Team("T1", "LCK", 1000000, 1)
+    red = Team("GenG", "LCK", 1000000, 2)
+    return DraftState(blue_team=blue, red_team=red)
+
+
+@pytest.fixture
+def book_path(tmp_path):
+    return str(tmp_path / "draft_book.json")
+
+
+def _ban(draft_state, *names):
+    for name in names:
+        assert draft_state.make_ban(draft_state.registry.get(name), draft_state.get_current_team())
+
+
+def test_key_ignores_ban_order(draft_state):
+    other = DraftState(blue_team=draft_state.blue_team, red_team=draft_state.red_team)
+    _ban(draft_state, "Ahri", "Zed", "Lux", "Jinx")
+    _ban(other, "Lux", "Jinx", "Ahri", "Zed")
+    assert DraftBook.key(draft_state) == DraftBook.key(other)
+
+    _ban(other, "Thresh")
+    assert DraftBook.key(draft_state) != DraftBook.key(other)
+
+
+def test_lru_eviction(draft_state):
+    book = DraftBook(None, max_entries=2)
+    positions = []
+    for name in ["Ahri", "Zed", "Lux"]:
+        book.put(draft_state, name)
+        positions.append(draft_state.snapshot())
+        _ban(draft_state, name)
+
+    assert len(book) == 2
+    draft_state.restore(positions[0])
+    assert book.get(draft_state) is None
+    draft_state.restore(positions[2])
+    assert book.get(draft_state) == "Lux"
+    assert (book.hits, book.misses) == (1, 1)
+
+
+def test_persists_and_invalidates_on_tier_change(draft_state, book_path):
+    book = DraftBook(book_path, tier_fingerprint="patch-1")
+    book.put(draft_state, "Ahri")
+    book.save()
+
+    assert DraftBook(book_path, tier_fingerprint="patch-1").get(draft_state) == "Ahri"
+    assert len(DraftBook(book_path, tier_fingerprint="patch-2")) == 0
+
+    with open(book_path, "w") as f:
+        f.write("not json")
+    assert len(DraftBook(book_path, tier_fingerprint="patch-1")) == 0
+
+
+def test_fingerprint_tracks_tier_list():
+    tiers = {role: dict(t) for role, t in DraftAI.TIER_LIST.items()}
+    base = fingerprint(tiers, DraftAI.SYNERGIES, DraftAI.COUNTERS)
+    assert base == fingerprint(DraftAI.TIER_LIST, DraftAI.SYNERGIES, DraftAI.COUNTERS)
+
+    role = next(iter(tiers))
+    # Demote one S tier champion to A tier
+    tiers[role]['A'] = tiers[role]['A'] + tiers[role]['S'][:1]
+    tiers[role]['S'] = tiers[role]['S'][1:]
+    assert fingerprint(tiers, DraftAI.SYNERGIES, DraftAI.COUNTERS) != base
+
+
+def test_ai_decision_resolves_from_book(draft_state, book_path, monkeypatch):
+    book = DraftBook(book_path)
+    monkeypatch.setattr(DraftAI, "_book", book)
+
+    first = DraftAI.get_ban_choice(draft_state, draft_state.blue_team)
+    assert book.misses == 1 and len(book) == 1
+
+    def fail(_):
+        raise AssertionError("search should not run on a book hit")
+    monkeypatch.setattr(DraftAI.get_search(), "choose", fail)
+    assert DraftAI.get_ban_choice(draft_state, draft_state.blue_team) is first
+    assert book.hits == 1
+
+    book.save()
+    with open(book_path) as f:
+        assert json.load(f)['entries'][0][1] == first.name
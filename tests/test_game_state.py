@@ -0,0 +1,137 @@
+import pytest
+
+from src.game.game_state import GameChange, GameState
+from src.models.team import Team
+
+
+@pytest.fixture
+def game_state():
+    state = GameState()
+    state.current_team = Team("T1", "LCK", 1000000, 1)
+    return state
+
+
+def test_listeners_receive_each_change(game_state):
+    changes = []
+    game_state.subscribe(changes.append)
+
+    game_state.notify(GameChange.ROSTER, GameChange.RESULTS)
+
+    assert changes == [GameChange.ROSTER, GameChange.RESULTS]
+
+
+def test_unsubscribed_listener_is_not_called(game_state):
+    changes = []
+    game_state.subscribe(changes.append)
+    game_state.subscribe(changes.append)  # Subscribing twice changes nothing
+    game_state.unsubscribe(changes.append)
+
+    game_state.notify(GameChange.FINANCES)
+
+    assert changes == []
+
+
+def test_calculate_finances_notifies_finances(game_state):
+    changes = []
+    game_state.subscribe(changes.append)
+
+    game_state.calculate_finances()
+
+    assert changes == [GameChange.FINANCES]
+
+
+def test_weeks_are_saved_through_the_write_queue(tmp_path):
+    from src.database.db_manager import DatabaseManager
+    from src.utils.memory_report import build_game_state
+
+    state = build_game_state("LCK")
+    state.current_team = None
+    path = str(tmp_path / "save.db")
+    state.open_save(path)
+    try:
+        state.simulate_all_leagues()
+        state.simulate_all_leagues()
+        state.write_queue.flush(timeout=10)
+    finally:
+        state.close_save()
+
+    teams = [team for league in [state.league] + list(state.other_leagues.values())
+             for team in league.get_all_teams()]
+    db = DatabaseManager(path)
+    try:
+        assert db.conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0] == len(teams)
+        assert db.load_team(teams[0].team_id).wins == teams[0].wins
+    finally:
+        db.close()
+
+
+def test_played_matches_are_saved_once_with_their_season(tmp_path):
+    from src.database.db_manager import DatabaseManager
+    from src.utils.memory_report import build_game_state
+
+    state = build_game_state("LCK")
+    state.current_team = None
+    path = str(tmp_path / "save.db")
+    state.open_save(path)
+    try:
+        state.simulate_all_leagues()
+        state.write_queue.flush(timeout=10)
+        state.simulate_all_leagues()
+        state.write_queue.flush(timeout=10)
+    finally:
+        state.close_save()
+
+    played = [match for league in [state.league] + list(state.other_leagues.values())
+              for division in league.divisions.values()
+              for match in division.matches if match.result]
+    label = f"{state.league.current_season.split.value} {state.league.current_season.year}"
+    db = DatabaseManager(path)
+    try:
+        assert db.conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0] == len(played)
+        assert db.conn.execute(
+            "SELECT COUNT(*) FROM team_season_stats WHERE season = ?", (label,)
+        ).fetchone()[0] > 0
+        assert db.conn.execute("SELECT COUNT(*) FROM player_season_stats").fetchone()[0] > 0
+    finally:
+        db.close()
+
+
+def test_simulated_weeks_keep_leagues_in_step():
+    from src.utils.memory_report import build_game_state
+
+    state = build_game_state("LCK")
+    state.current_team = None
+    for _ in range(2):
+        state.simulate_all_leagues()
+
+    leagues = [state.league] + list(state.other_leagues.values())
+    assert {league.current_season.current_week for league in leagues} == {2}
+
+
+def test_simulating_reflects_the_simulation_lock(game_state):
+    assert not game_state.simulating
+    with game_state.simulation_lock:
+        assert game_state.simulating
+    assert not game_state.simulating
+
+
+def test_old_match_detail_is_archived_in_the_save(tmp_path):
+    from src.database.db_manager import DatabaseManager
+    from src.utils.memory_report import build_game_state
+
+    state = build_game_state("LCK")
+    state.current_team = None
+    path = str(tmp_path / "save.db")
+    state.open_save(path)
+    try:
+        for _ in range(3):
+            state.simulate_all_leagues()
+        assert state.match_archive.db_manager is state.db_manager
+    finally:
+        state.close_save()
+
+    db = DatabaseManager(path)
+    try:
+        assert db.conn.execute("SELECT COUNT(*) FROM match_archive").fetchone()[0] > 0
+    finally:
+        db.close()
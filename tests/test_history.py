@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from src.models.history import LeagueHistory, TeamHistory, TeamSeason, titles_by_region
+from src.models.league import League, Season, Split
+from src.models.team import Team
+from src.utils.memory_report import measure
+
+
+def make_season(year: int, split: Split, champion=None, playoff_teams=()) -> Season:
+    season = Season(split, year, datetime(year, 1, 15))
+    season.champion = champion
+    season.playoff_teams = list(playoff_teams)
+    return season
+
+
+def test_team_history_range_queries():
+    history = TeamHistory()
+    for year in range(2000, 2040):
+        for split in Split:
+            history.append(make_season(year, split), wins=year - 2000, losses=3, points=50, game_diff=-2)
+
+    assert len(history) == 80
+    assert history[0] == TeamSeason(2000, "Spring", 0, 3, 50, -2)
+    assert history[-1].year == 2039 and history[-1].split == "Summer"
+    assert [s.year for s in history.last(10)] == [2035, 2035, 2036, 2036, 2037, 2037, 2038, 2038, 2039, 2039]
+    assert [s.wins for s in history.between(2010, 2011)] == [10, 10, 11, 11]
+    assert history.between(2050, 2060) == []
+    # Long careers cost bytes per season, not objects
+    assert history.nbytes == 80 * 14
+
+
+def test_reset_stats_records_the_finished_season():
+    league = League("LCK", {"Regular Season": [Team(f"History Team {i}", "LCK", 1000000) for i in range(4)]})
+    league.start_new_season(Split.SPRING, datetime(2024, 1, 15))
+    team = league.get_all_teams()[0]
+    team.wins, team.losses = 5, 2
+    league.start_new_season(Split.SUMMER, datetime(2024, 6, 1))
+
+    record = team.season_history[-1]
+    assert (record.year, record.split, record.wins, record.losses) == (2024, "Spring", 5, 2)
+    assert team.wins == 0 and team.losses == 0
+    assert league.season_history[0].year == 2024
+
+
+def test_league_history_stores_ids_and_finds_titles():
+    lck = [Team(f"LCK History {i}", "LCK", 1000000) for i in range(6)]
+    lec = [Team(f"LEC History {i}", "LEC", 1000000) for i in range(6)]
+    lck_history, lec_history = LeagueHistory(), LeagueHistory()
+    for year in range(2020, 2025):
+        lck_history.append(make_season(year, Split.SPRING, lck[year % 2], lck))
+        lec_history.append(make_season(year, Split.SPRING, lec[0], lec[:4]))
+    lck_history.append(make_season(2025, Split.SPRING))
+
+    season = lck_history[0]
+    assert season.champion == "LCK History 0"
+    assert season.playoff_teams == tuple(team.name for team in lck)
+    assert lec_history[0].playoff_teams == tuple(team.name for team in lec[:4])
+    assert lck_history[-1].champion is None
+
+    assert [s.year for s in lck_history.titles(lck[1])] == [2021, 2023]
+    assert len(lck_history.titles()) == 5
+
+    regions = titles_by_region([lck_history, lec_history])
+    assert {region: len(seasons) for region, seasons in regions.items()} == {"LCK": 5, "LEC": 5}
+
+
+def test_league_history_keeps_no_team_references():
+    teams = [Team(f"Reference Team {i}", "LCK", 1000000) for i in range(6)]
+    history = LeagueHistory()
+    for year in range(1900, 2100):
+        history.append(make_season(year, Split.SPRING, teams[0], teams))
+
+    usage = measure(history)
+
+    assert usage["teams"].objects == 0
+    assert usage["history"].objects == 2  # The history and its buffer
+    assert usage["history"].bytes < 8 * 1024
+    assert history.nbytes == 200 * 18
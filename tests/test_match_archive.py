@@ -0,0 +1,100 @@
+from datetime import datetime
+
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.game.match_archive import MatchArchive
+from src.models.league import League, SeasonPhase, Split
+from src.models.match import Match
+from src.utils.memory_report import measure
+
+
+@pytest.fixture
+def archive():
+    archive = MatchArchive(DatabaseManager(":memory:"), retained_weeks=1)
+    yield archive
+    archive.close()
+
+
+def play_season(league: League, split: Split, start: datetime) -> None:
+    league.start_new_season(split, start)
+    while league.current_season.phase == SeasonPhase.REGULAR_SEASON:
+        league.simulate_week()
+    while league.current_season.phase == SeasonPhase.PLAYOFFS:
+        if league.simulate_playoff_round():
+            break
+
+
+def test_archived_match_keeps_summary_and_rehydrates(archive, make_team):
+    match = Match(make_team("T1"), make_team("GenG"), datetime(2024, 1, 15))
+    match.simulate(best_of=3)
+    full = match.result
+    draft = match.draft_state
+
+    archive.archive(match, "LCK", "Spring 2024")
+
+    assert match.is_archived
+    assert match.draft_state is None
+    assert match.result.events == [] and match.result.winner_stats is None
+    assert match.result.winner is full.winner and match.result.mvp is full.mvp
+
+    detailed = match.detailed()
+    assert detailed is not match
+    assert [(e.type, e.time, e.description) for e in detailed.result.events] == \
+        [(e.type, e.time, e.description) for e in full.events]
+    assert detailed.result.events[0].player in full.winner.players + full.loser.players
+    assert detailed.result.winner_stats.kills == full.winner_stats.kills
+    assert {p.name: s.kills for p, s in detailed.result.loser_stats.player_stats.items()} == \
+        {p.name: s.kills for p, s in full.loser_stats.player_stats.items()}
+    assert [(p.champion, p.team) for p in detailed.draft_state.picks] == [(p.champion, p.team) for p in draft.picks]
+    assert detailed.draft_state.banned_mask == draft.banned_mask
+
+
+def test_apply_keeps_recent_weeks_and_standings(archive, make_team):
+    league = League("LCK", {"Regular Season": [make_team(f"Team {i}") for i in range(6)]})
+    league.start_new_season(Split.SPRING, datetime(2024, 1, 15))
+    for _ in range(3):
+        league.simulate_week()
+    division = league.divisions["Regular Season"]
+    standings = division.get_standings()
+
+    archived = archive.apply(league)
+
+    # Two of the three played weeks, six matches a week
+    assert archived == 12
+    assert all(m.is_archived for m in division.matches[:12])
+    assert not any(m.is_archived for m in division.matches[12:])
+    assert division.get_standings() == standings
+    assert len(archive.db_manager.get_archived_matches("LCK", "Spring 2024")) == 12
+
+
+def test_memory_stays_flat_across_seasons(archive, make_team):
+    league = League("LCK", {"Regular Season": [make_team(f"Team {i}") for i in range(6)]})
+    detail, matches = [], []
+    for year in range(2024, 2028):
+        play_season(league, Split.SPRING, datetime(year, 1, 15))
+        archive.apply(league)
+        usage = measure(league)
+        detail.append(sum(usage[category].bytes for category in ("events", "drafts", "stats")))
+        matches.append(usage["matches"].bytes)
+
+    # Finished seasons keep no detail in memory, only summaries
+    assert detail == [0, 0, 0, 0]
+    assert max(matches) < min(matches) * 1.1
+
+
+def test_archived_match_can_be_saved(archive, make_team):
+    db = archive.db_manager
+    match = Match(make_team("T1"), make_team("GenG"), datetime(2024, 1, 15))
+    db.save_team(match.team1)
+    db.save_team(match.team2)
+    match.simulate()
+    archive.archive(match, "LCK", "Spring 2024")
+
+    db.save_match(match, season="Spring 2024")
+
+    row = db.conn.execute(
+        "SELECT wins FROM team_season_stats WHERE team_id = ?", (match.result.winner.team_id,)
+    ).fetchone()
+    assert row[0] == 1
+    assert db.conn.execute("SELECT COUNT(*) FROM player_match_stats").fetchone()[0] == 0
@@ -0,0 +1,74 @@
+import random
+import pytest
+from datetime import datetime
+
+from src.models.match import EventType, Match
+from src.simulation.engine import MatchEngine
+from src.simulation.state import KILLS
+
+
+@pytest.fixture
+def teams(make_team):
+    return make_team("T1", team_id=1), make_team("GenG", team_id=2)
+
+
+def test_engine_is_deterministic_for_a_seed(teams):
+    first = MatchEngine(*teams, rng=random.Random(7))
+    second = MatchEngine(*teams, rng=random.Random(7))
+
+    assert [e.description for e in first.run()] == [e.description for e in second.run()]
+    assert first.state.blue.stats == second.state.blue.stats
+
+
+def test_replaying_events_rebuilds_the_state(teams):
+    engine = MatchEngine(*teams, rng=random.Random(3))
+    events = list(engine.events())
+
+    replay = engine.state.fresh()
+    for sim_event in events:
+        replay.apply(sim_event)
+
+    for replayed, played in zip(replay.sides, engine.state.sides):
+        assert replayed.stats == played.stats
+        assert replayed.objectives == played.objectives
+    assert replay.minute == engine.duration
+
+
+def test_game_state_is_consistent(teams):
+    for seed in range(50):
+        engine = MatchEngine(*teams, blue_win_chance=0.7, rng=random.Random(seed))
+        play_by_play = engine.run()
+        winner = engine.state.sides[engine.winner_side]
+        loser = engine.state.sides[1 - engine.winner_side]
+
+        assert winner.kills == loser.deaths
+        assert loser.kills == winner.deaths
+        assert winner.inhibitors >= 1
+        assert winner.team.name in play_by_play[-1].description
+        assert all(a.time <= b.time for a, b in zip(play_by_play, play_by_play[1:]))
+        if winner.kills + loser.kills:
+            assert sum(e.type == EventType.FIRST_BLOOD for e in play_by_play) == 1
+
+
+def test_win_chance_decides_the_winner(teams):
+    rng = random.Random(1)
+    blue_wins = sum(
+        MatchEngine(*teams, blue_win_chance=0.8, rng=rng, duration=25).winner_side == 0
+        for _ in range(500)
+    )
+    assert 350 < blue_wins < 450
+
+
+def test_series_result_totals_every_game(teams):
+    match = Match(*teams, datetime.now())
+    engines = [MatchEngine(*teams, rng=random.Random(seed)) for seed in range(3)]
+    for engine in engines:
+        engine.run()
+    result = match.build_result(engines)
+
+    assert result.winner_score + result.loser_score == 3
+    assert result.duration == sum(engine.duration for engine in engines)
+    team1_kills = sum(engine.state.blue.total(KILLS) for engine in engines)
+    stats = result.winner_stats if result.winner == teams[0] else result.loser_stats
+    assert stats.kills == team1_kills
+    assert result.mvp is not None
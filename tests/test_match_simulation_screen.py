@@ -0,0 +1,13 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from src.ui.screens import match_simulation_screen as screen
+
+
+def test_playback_constants_are_defined():
+    assert screen.PLAYBACK_SPEEDS[0] == 1
+    assert list(screen.PLAYBACK_SPEEDS) == sorted(screen.PLAYBACK_SPEEDS)
+    assert screen.PLAYBACK_SPEEDS[-1] == 16
+    # 1x keeps the original pace of one game minute per real second
+    assert screen.TICK_MINUTES * 1000 / screen.TICK_MS == 1
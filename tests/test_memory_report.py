@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from src.models.league import League, Split
+from src.models.match import Match
+from src.utils.memory_report import CATEGORIES, format_report, measure
+
+
+def test_objects_count_under_their_category(make_team):
+    team1, team2 = make_team("T1"), make_team("GenG")
+    match = Match(team1, team2, datetime(2024, 1, 15))
+    match.simulate()
+
+    usage = measure(match)
+
+    for category in ("matches", "events", "drafts", "stats", "teams"):
+        assert usage[category].objects > 0, category
+    # Just the two teams' empty season histories and their buffers
+    assert usage["history"].objects == 4
+
+
+def test_season_history_counts_as_history(make_team):
+    league = League("LCK", {"Regular Season": [make_team(f"Team {i}") for i in range(4)]})
+    league.start_new_season(Split.SPRING, datetime(2024, 1, 15))
+    league.start_new_season(Split.SUMMER, datetime(2024, 6, 1))
+
+    usage = measure(league)
+
+    assert usage["history"].objects > 0
+
+
+def test_shared_objects_are_counted_once(make_team):
+    team = make_team("T1")
+    once = measure([team])
+    twice = measure([team, team, [team]])
+
+    assert twice["teams"].bytes == once["teams"].bytes
+    assert twice["teams"].objects == once["teams"].objects
+
+
+def test_report_lists_every_category(make_team):
+    report = format_report(measure(make_team("T1")))
+    for category in CATEGORIES:
+        assert category in report
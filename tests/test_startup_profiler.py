@@ -0,0 +1,48 @@
+import sys
+
+from src.utils.startup_profiler import StartupProfiler, STARTUP_REPORT_ENV
+
+
+def test_profiler_is_off_unless_requested(monkeypatch):
+    monkeypatch.delenv(STARTUP_REPORT_ENV, raising=False)
+    assert StartupProfiler.from_environment(["main.py"]) is None
+
+
+def test_import_times_and_report(tmp_path, monkeypatch):
+    module = tmp_path / "startup_probe_module.py"
+    module.write_text("import startup_probe_child\nVALUE = 1\n")
+    (tmp_path / "startup_probe_child.py").write_text("CHILD = 2\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = StartupProfiler.from_environment(["main.py", "--startup-report"])
+    try:
+        import startup_probe_module
+    finally:
+        profiler.uninstall_import_timer()
+        sys.modules.pop("startup_probe_module", None)
+        sys.modules.pop("startup_probe_child", None)
+
+    assert startup_probe_module.VALUE == 1
+    # Modules see their real loader, not the timing wrapper
+    assert type(startup_probe_module.__loader__).__name__ == "SourceFileLoader"
+
+    own, cumulative = profiler.imports["startup_probe_module"]
+    child_own, child_cumulative = profiler.imports["startup_probe_child"]
+    assert cumulative >= own + child_cumulative * 0.99
+
+    profiler.mark("first paint")
+    report = profiler.report()
+    assert "first paint" in report
+    assert "startup_probe_module" in report
+
+
+def test_finish_writes_report_to_file(tmp_path, monkeypatch):
+    destination = tmp_path / "startup.txt"
+    monkeypatch.setenv(STARTUP_REPORT_ENV, str(destination))
+
+    profiler = StartupProfiler.from_environment([])
+    profiler.mark("first paint")
+    profiler.finish()
+
+    assert "first paint" in destination.read_text()
+    assert profiler._timer is None
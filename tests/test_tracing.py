@@ -0,0 +1,56 @@
+import json
+import pytest
+
+from src.utils import tracing
+from src.utils.tracing import span, start_tracing, stop_tracing, traced
+
+
+@pytest.fixture
+def tracer():
+    tracer = start_tracing()
+    yield tracer
+    stop_tracing()
+
+
+@traced()
+def traced_work(n):
+    with span("inner", n=n):
+        return sum(range(n))
+
+
+def test_spans_are_not_recorded_while_tracing_is_off():
+    assert tracing._active is None
+    assert traced_work(10) == 45
+    assert span("anything") is span("anything else")
+
+
+def test_nested_spans_split_total_and_self_time(tracer):
+    traced_work(1000)
+    traced_work(1000)
+
+    calls, total, own = tracer.totals["traced_work"]
+    inner_calls, inner_total, inner_own = tracer.totals["inner"]
+    assert calls == inner_calls == 2
+    assert own == total - inner_total
+    assert inner_own == inner_total
+
+
+def test_chrome_trace_export(tracer, tmp_path):
+    traced_work(5)
+    path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(str(path))
+
+    events = json.loads(path.read_text())["traceEvents"]
+    complete = [e for e in events if e["ph"] == "X"]
+    assert [e["name"] for e in complete] == ["inner", "traced_work"]
+    assert complete[0]["args"] == {"n": 5}
+    # The inner span lies within the outer one
+    assert complete[1]["ts"] <= complete[0]["ts"]
+    assert complete[0]["ts"] + complete[0]["dur"] <= complete[1]["ts"] + complete[1]["dur"]
+    assert any(e["ph"] == "M" for e in events)
+
+
+def test_summary_lists_each_span(tracer):
+    traced_work(5)
+    summary = tracer.summary()
+    assert "traced_work" in summary and "inner" in summary
@@ -0,0 +1,63 @@
+import pytest
+from src.models.draft import DraftState
+from src.ai.draft_ai import DraftAI
+from src.ai.win_probability import WinProbabilityEstimator
+
+
+@pytest.fixture
+def draft_state(make_team):
+    return DraftState(blue_team=make_team("T1", skill=90), red_team=make_team("GenG", skill=60))
+
+
+@pytest.fixture
+def estimator(draft_state):
+    return WinProbabilityEstimator(draft_state, DraftAI.get_scorer(draft_state.registry))
+
+
+def _pick(draft_state, name):
+    team = draft_state.get_current_team()
+    assert draft_state.make_pick(draft_state.registry.get(name), team)
+
+
+def _ban_phase(draft_state):
+    for name in ["Aatrox", "Camille", "Darius", "Fiora", "Gangplank", "Garen"]:
+        draft_state.make_ban(draft_state.registry.get(name), draft_state.get_current_team())
+
+
+def test_starts_even_and_favors_better_players(draft_state, estimator):
+    assert estimator.update() == pytest.approx(0.5)
+    _ban_phase(draft_state)
+    assert estimator.update() == pytest.approx(0.5)
+
+    _pick(draft_state, "Jax")  # blue top
+    _pick(draft_state, "Renekton")  # red top
+    assert estimator.update() > 0.5
+
+
+def test_preview_matches_pick(draft_state, estimator):
+    _ban_phase(draft_state)
+    _pick(draft_state, "Malphite")  # blue top
+    _pick(draft_state, "Jax")  # red top
+    _pick(draft_state, "Vi")  # red jungle
+
+    yasuo = draft_state.registry.get("Yasuo")
+    previews = estimator.preview_all()
+    # Blue's next role is jungle, so Yasuo (mid) is not a legal what-if
+    assert estimator.preview(yasuo) is None
+    lee_sin = draft_state.registry.get("Lee Sin")
+    expected = previews[lee_sin.champion_id]
+
+    _pick(draft_state, "Lee Sin")
+    assert estimator.update() == pytest.approx(expected)
+
+
+def test_incremental_matches_rebuild_after_undo(draft_state, estimator):
+    _ban_phase(draft_state)
+    for name in ["Malphite", "Jax", "Vi", "Lee Sin", "Ahri", "Syndra"]:
+        _pick(draft_state, name)
+    estimator.update()
+
+    draft_state.undo()
+    _pick(draft_state, "Viktor")
+    fresh = WinProbabilityEstimator(draft_state, estimator.scorer)
+    assert estimator.update() == pytest.approx(fresh.probability)
@@ -0,0 +1,156 @@
+import os
+import threading
+import pytest
+from datetime import datetime
+
+from src.database.db_manager import DatabaseManager
+from src.database.write_queue import WriteBehindQueue
+from src.models.player import Role
+from src.models.match import Match
+
+
+TEST_DB_PATH = "data/test_write_queue.db"
+
+
+@pytest.fixture
+def write_queue():
+    """Create a write-behind queue on a fresh test database."""
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+
+    wq = WriteBehindQueue(TEST_DB_PATH, batch_delay=0)
+    yield wq
+
+    wq.close()
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+
+
+def test_flush_persists_queued_writes(write_queue, make_team):
+    team1 = make_team("T1")
+    team2 = make_team("GenG")
+    write_queue.save_team(team1)
+    write_queue.save_team(team2)
+
+    match = Match(team1, team2, datetime.now())
+    match.simulate()
+    write_queue.save_match(match)
+
+    write_queue.flush(timeout=5)
+
+    db = DatabaseManager(TEST_DB_PATH)
+    try:
+        loaded = db.load_team(team1.team_id)
+        assert loaded.name == "T1"
+        assert len(loaded.players) == len(Role)
+        count = db.conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+        assert count == 1
+    finally:
+        db.close()
+
+
+def test_repeated_saves_are_coalesced(make_team):
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+
+    # A long batch delay keeps the whole burst in a single drain
+    wq = WriteBehindQueue(TEST_DB_PATH, batch_delay=0.5)
+    player = make_team("T1").players[0]
+    try:
+        for _ in range(10):
+            wq.save_player(player)
+        wq.flush(timeout=5)
+        assert wq.batches_written == 1
+    finally:
+        wq.close()
+
+    db = DatabaseManager(TEST_DB_PATH)
+    try:
+        count = db.conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+        assert count == 1
+    finally:
+        db.close()
+        os.remove(TEST_DB_PATH)
+
+
+def test_writer_errors_surface_on_flush(write_queue, make_team):
+    # Team names are unique, so the second insert fails on the writer thread
+    write_queue.save_team(make_team("T1"))
+    write_queue.flush(timeout=5)
+    write_queue.save_team(make_team("T1"))
+
+    with pytest.raises(Exception):
+        write_queue.flush(timeout=5)
+
+
+def test_later_saves_update_the_same_rows(write_queue, make_team):
+    team = make_team("T1")
+    write_queue.save_team(team)
+    write_queue.flush(timeout=5)
+    team.budget = 2000000
+    write_queue.save_team(team)
+    write_queue.flush(timeout=5)
+
+    db = DatabaseManager(TEST_DB_PATH)
+    try:
+        assert db.conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0] == 1
+        assert db.conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] == len(Role)
+        assert db.load_team(team.team_id).budget == 2000000
+    finally:
+        db.close()
+
+
+def test_changes_after_queueing_are_not_written(make_team):
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+
+    wq = WriteBehindQueue(TEST_DB_PATH, batch_delay=0.2)
+    team = make_team("T1")
+    try:
+        wq.save_team(team)
+        team.budget = 1
+        team.players[0].salary = 1
+        wq.flush(timeout=5)
+    finally:
+        wq.close()
+
+    db = DatabaseManager(TEST_DB_PATH)
+    try:
+        loaded = db.load_team(team.team_id)
+        assert loaded.budget == 1000000
+        assert all(player.salary == 100000 for player in loaded.players)
+    finally:
+        db.close()
+        os.remove(TEST_DB_PATH)
+
+
+def test_writer_setup_errors_raise_from_init(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    # The database directory cannot be created under a regular file
+    with pytest.raises(OSError):
+        WriteBehindQueue(str(blocker / "game.db"))
+
+
+def test_save_runs_on_writer_thread(write_queue, make_team):
+    caller = threading.get_ident()
+    write_queue.save_team(make_team("T1"))
+    write_queue.flush(timeout=5)
+    assert write_queue._thread.ident != caller
+
+
+def test_batch_rolls_back_on_error(make_team):
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+    db = DatabaseManager(TEST_DB_PATH)
+    try:
+        with pytest.raises(ValueError):
+            with db.batch():
+                db.save_team(make_team("T1"))
+                raise ValueError("abort")
+        count = db.conn.execute("SELECT COUNT(*) FROM teams").fetchone()[0]
+        assert count == 0
+    finally:
+        db.close()
+        os.remove(TEST_DB_PATH)